@@ -3,11 +3,13 @@ from .basic import RandomAgent
 from .heuristic import RuleBasedAgent
 from .mcts import MCTSAgent
 from .cfr_agent import CFRAgent
+from .pimc import PIMCAgent
 
 # Registry for easy access in UI/Evaluation scripts
 AVAILABLE_AGENTS = {
     "Random": RandomAgent,
     "RuleBased": RuleBasedAgent,
     "MCTS": MCTSAgent,
-    "CFR": CFRAgent
+    "CFR": CFRAgent,
+    "PIMC": PIMCAgent,
 }
\ No newline at end of file
@@ -1,11 +1,14 @@
+import random
 from abc import ABC, abstractmethod
 from typing import Optional, List
 from ..engine.state import EuchreGameState
 from ..engine.card import Card, Suit
 
 class Agent(ABC):
-    def __init__(self, name: str):
+    def __init__(self, name: str, rng: Optional[random.Random] = None):
         self.name = name
+        # All of an agent's randomness goes through self.rng (global random by default)
+        self.rng = rng if rng is not None else random
 
     @abstractmethod
     def select_discard(self, hand: List[Card], up_card: Card) -> Card:
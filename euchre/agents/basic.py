@@ -1,4 +1,3 @@
-import random
 from typing import Optional
 
 from .base import Agent
@@ -13,11 +12,11 @@ class RandomAgent(Agent):
     """
     def select_discard(self, hand: list[Card], up_card: Card) -> Card:
         # Randomly discard one card
-        return random.choice(hand)
+        return self.rng.choice(hand)
 
     def pick_up_card(self, game_state: EuchreGameState) -> bool:
         # 50/50 chance to order it up
-        return random.choice([True, False])
+        return self.rng.choice([True, False])
 
     def call_suit(self, game_state: EuchreGameState) -> Optional[Suit]:
         # Cannot pick the suit that was just turned down
@@ -25,9 +24,9 @@ class RandomAgent(Agent):
         valid_suits = [s for s in Suit if s != invalid_suit]
         
         # 20% chance to pass, otherwise pick a random valid suit
-        if random.random() < 0.2:
+        if self.rng.random() < 0.2:
             return None
-        return random.choice(valid_suits)
+        return self.rng.choice(valid_suits)
 
     def play_card(self, game_state: EuchreGameState) -> Card:
         player_idx = game_state.current_player_index
@@ -36,4 +35,4 @@ class RandomAgent(Agent):
         # Must use the engine's validation logic to find legal moves
         valid_moves = get_valid_moves(hand, game_state.current_trick, game_state.trump_suit)
         
-        return random.choice(valid_moves)
\ No newline at end of file
+        return self.rng.choice(valid_moves)
\ No newline at end of file
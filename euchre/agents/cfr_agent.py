@@ -1,22 +1,27 @@
-import pickle
 import random
 import os
 from typing import Optional
 
 from .base import Agent
 from .heuristic import RuleBasedAgent
-from .cfr_utils import get_info_set_key
+from .cfr_utils import ABSTRACTIONS, info_set_key
+from .policy_store import load_policy
 from ..engine.state import EuchreGameState
 from ..engine.card import Card, Suit
 
 class CFRAgent(Agent):
-    def __init__(self, name: str, policy_file="cfr_policy.pkl"):
-        super().__init__(name)
+    def __init__(self, name: str, policy_file="cfr_policy.pkl", rng: Optional[random.Random] = None,
+                 abstraction: str = "tier"):
+        super().__init__(name, rng)
+        if abstraction not in ABSTRACTIONS:
+            raise ValueError(f"Unknown abstraction: {abstraction}. Choose from {ABSTRACTIONS}")
+        # Must match the abstraction the policy was trained with
+        self.abstraction = abstraction
         self.policy = {}
-        # Load the trained policy if it exists
+        # Load the trained policy if it exists (pickle or compact, see policy_store);
+        # agents in one process share a single cached copy
         if os.path.exists(policy_file):
-            with open(policy_file, "rb") as f:
-                self.policy = pickle.load(f)
+            self.policy = load_policy(policy_file)
         
         # Use Heuristic bot for phases we haven't trained CFR for yet
         self.fallback_bot = RuleBasedAgent("Internal")
@@ -28,7 +33,6 @@ class CFRAgent(Agent):
         player_idx = game_state.current_player_index
         hand = game_state.hands[player_idx]
         dealer_idx = game_state.dealer_index
-        up_card_suit = game_state.up_card.suit
 
         # Reconstruct the history string (Who passed before me?)
         # Logic: If I am 1 spot left of dealer, 0 people passed.
@@ -43,12 +47,12 @@ class CFRAgent(Agent):
         
         history = ["P"] * steps
         
-        key = get_info_set_key(hand, history, player_idx, dealer_idx, up_card_suit)
+        key = info_set_key(self.abstraction, hand, history, player_idx, dealer_idx, game_state.up_card)
 
         # Default strategy: 50/50 if key missing
         strategy = self.policy.get(key, {"P": 0.5, "O": 0.5})
         
-        choice = random.choices(list(strategy.keys()), weights=list(strategy.values()))[0]
+        choice = self.rng.choices(list(strategy.keys()), weights=list(strategy.values()))[0]
 
         return choice == "O" # Returns True if "Order Up"
 
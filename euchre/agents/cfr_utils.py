@@ -1,31 +1,15 @@
-from ..engine.card import Rank, Card, Suit
+from ..engine.card import Card, Suit
+from ..engine.canonical import canonical_hand
+from .hand_tables import TIER_NAMES, hand_tier
 
 def get_hand_strength_bucket(hand: list[Card], up_card_suit: Suit) -> str:
     """
     Classifies a hand into strength tiers based on standard point values.
-    Right = 30, Left = 25, Trump = 10, Ace = 3.
+    Right = 30, Left = 25, Trump = 10, Ace = 3;
+    above 50 is Tier4, above 35 Tier3, above 20 Tier2, above 10 Tier1.
+    The tier is read from the precomputed table in hand_tables.
     """
-    score = 0
-    for card in hand:
-        # Use the new engine's effective suit logic
-        eff_suit = card.get_effective_suit(up_card_suit)
-        
-        if eff_suit == up_card_suit:
-            if card.rank == Rank.JACK:
-                if card.suit == up_card_suit:
-                    score += 30 # Right Bower
-                else:
-                    score += 25 # Left Bower
-            else:
-                score += 10 # Regular Trump
-        elif card.rank == Rank.ACE:
-            score += 3
-
-    if score > 50: return "Tier4"
-    if score > 35: return "Tier3"
-    if score > 20: return "Tier2"
-    if score > 10: return "Tier1"
-    return "Tier0"
+    return TIER_NAMES[hand_tier(hand, up_card_suit)]
 
 def get_info_set_key(hand, history, player_idx, dealer_idx, up_card_suit):
     """
@@ -35,4 +19,27 @@ def get_info_set_key(hand, history, player_idx, dealer_idx, up_card_suit):
     rel_pos = (player_idx - dealer_idx) % 4
     strength = get_hand_strength_bucket(hand, up_card_suit)
     hist_str = "".join(history)
-    return f"Pos{rel_pos}_{strength}_{hist_str}"
\ No newline at end of file
+    return f"Pos{rel_pos}_{strength}_{hist_str}"
+
+def get_exact_info_set_key(hand, history, player_idx, dealer_idx, up_card):
+    """
+    Like get_info_set_key, but keeps the actual hand and up-card instead of
+    a strength tier. Both are canonicalized over suit relabellings (the
+    up-card's suit becomes Hearts), so the 807,576 (hand, up-card) pairs
+    collapse to 105,798 keys and equivalent deals share an entry.
+    Example: 'Pos1_U3_H00002e_PP'
+    """
+    rel_pos = (player_idx - dealer_idx) % 4
+    hand_mask, up, _, _ = canonical_hand(hand, up_card)
+    hist_str = "".join(history)
+    return f"Pos{rel_pos}_U{up.ordinal}_H{hand_mask:06x}_{hist_str}"
+
+ABSTRACTIONS = ("tier", "exact")
+
+def info_set_key(abstraction, hand, history, player_idx, dealer_idx, up_card):
+    """Round 1 info-set key under the named abstraction."""
+    if abstraction == "tier":
+        return get_info_set_key(hand, history, player_idx, dealer_idx, up_card.suit)
+    if abstraction == "exact":
+        return get_exact_info_set_key(hand, history, player_idx, dealer_idx, up_card)
+    raise ValueError(f"Unknown abstraction: {abstraction}. Choose from {ABSTRACTIONS}")
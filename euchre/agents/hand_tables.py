@@ -0,0 +1,165 @@
+"""
+Precomputed bidding evaluations for every five-card hand.
+
+Both bidding heuristics are sums of per-card points that depend only on
+the card and the candidate trump, so they can be tabulated once for all
+C(24, 5) = 42,504 hands x 4 trumps:
+
+    score    RuleBasedAgent points (Right 4, Left 3, trump 2, off-suit Ace 1)
+    tier     CFR strength tier 0-4 (Right 30, Left 25, trump 10, off-suit Ace 3)
+    trumps   cards of the trump suit, bowers included
+    bowers   Right and Left Bower held
+    aces     off-suit Aces
+
+Rows are found by hand mask (bitboard.cards_to_mask). The tables are
+built on first use (about 0.15 s) or loaded from an .npz
+written by HandTables.save.
+"""
+import os
+from itertools import combinations
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ..engine.bitboard import cards_to_mask
+from ..engine.card import ALL_CARDS, Card, Rank, Suit
+
+HAND_SIZE = 5
+NUM_HANDS = 42_504
+TIER_NAMES = ("Tier0", "Tier1", "Tier2", "Tier3", "Tier4")
+# A tier is the number of thresholds the CFR score is strictly above
+TIER_THRESHOLDS = (10, 20, 35, 50)
+
+FIELDS = ("score", "tier", "trumps", "bowers", "aces")
+
+
+def _card_points(right: int, left: int, trump: int, ace: int) -> np.ndarray:
+    """points[trump suit, card] under one point system."""
+    points = np.zeros((len(Suit), len(ALL_CARDS)), dtype=np.int16)
+    for t in Suit:
+        for card in ALL_CARDS:
+            if card.get_effective_suit(t) == t:
+                if card.rank == Rank.JACK:
+                    points[t.ordinal, card.ordinal] = right if card.suit == t else left
+                else:
+                    points[t.ordinal, card.ordinal] = trump
+            elif card.rank == Rank.ACE:
+                points[t.ordinal, card.ordinal] = ace
+    return points
+
+
+SCORE_POINTS = _card_points(4, 3, 2, 1)
+CFR_POINTS = _card_points(30, 25, 10, 3)
+IS_TRUMP = _card_points(1, 1, 1, 0)
+IS_BOWER = _card_points(1, 1, 0, 0)
+IS_OFF_ACE = _card_points(0, 0, 0, 1)
+
+# Per-card points as nested tuples, for hands outside the table (not 5 cards)
+_SCORE_ROWS = tuple(tuple(row) for row in SCORE_POINTS.tolist())
+_CFR_ROWS = tuple(tuple(row) for row in CFR_POINTS.tolist())
+
+
+def tier_of(cfr_score: int) -> int:
+    return sum(cfr_score > t for t in TIER_THRESHOLDS)
+
+
+class HandTables:
+    """
+    The evaluation table: `masks[i]` is the i-th hand (in lexicographic order
+    of its card ordinals) and `score[i, trump]` etc. its evaluations.
+    """
+
+    def __init__(self, masks: np.ndarray, **fields: np.ndarray):
+        if set(fields) != set(FIELDS):
+            raise ValueError(f"HandTables needs exactly the fields {FIELDS}")
+        self.masks = masks
+        for name in FIELDS:
+            setattr(self, name, fields[name])
+        self._rows: Dict[int, int] = {m: i for i, m in enumerate(masks.tolist())}
+        # Python-level copies of the two fields read on every bidding decision
+        self._score_rows: List[List[int]] = self.score.tolist()
+        self._tier_rows: List[List[int]] = self.tier.tolist()
+
+    @classmethod
+    def build(cls) -> "HandTables":
+        hands = np.array(list(combinations(range(len(ALL_CARDS)), HAND_SIZE)), dtype=np.int64)
+        masks = (np.int64(1) << hands).sum(axis=1)
+
+        def total(points: np.ndarray) -> np.ndarray:
+            # (hands, trump): sum of the 5 cards' points under each trump
+            return points[:, hands].sum(axis=2).T
+
+        # side="left" counts the thresholds strictly below each score, as tier_of does
+        tier = np.searchsorted(np.array(TIER_THRESHOLDS), total(CFR_POINTS), side="left")
+        return cls(
+            masks,
+            score=total(SCORE_POINTS).astype(np.int8),
+            tier=tier.astype(np.int8),
+            trumps=total(IS_TRUMP).astype(np.int8),
+            bowers=total(IS_BOWER).astype(np.int8),
+            aces=total(IS_OFF_ACE).astype(np.int8),
+        )
+
+    @classmethod
+    def load(cls, path: str) -> "HandTables":
+        with np.load(path) as data:
+            return cls(data["masks"], **{name: data[name] for name in FIELDS})
+
+    def save(self, path: str):
+        tmp_path = f"{path}.tmp.npz"
+        np.savez(tmp_path, masks=self.masks, **{name: getattr(self, name) for name in FIELDS})
+        os.replace(tmp_path, path)
+
+    def __len__(self) -> int:
+        return len(self.masks)
+
+    def row(self, mask: int) -> Optional[int]:
+        """Table row of a five-card hand mask (None for any other mask)."""
+        return self._rows.get(mask)
+
+    def scores(self, mask: int) -> Sequence[int]:
+        """RuleBasedAgent scores of a hand for each trump, by suit ordinal."""
+        return self._score_rows[self._rows[mask]]
+
+    def tiers(self, mask: int) -> Sequence[int]:
+        """CFR strength tiers of a hand for each trump, by suit ordinal."""
+        return self._tier_rows[self._rows[mask]]
+
+    def counts(self, mask: int, trump: Suit) -> Tuple[int, int, int]:
+        """(trumps, bowers, off-suit aces) held with `trump` as trump."""
+        i, t = self._rows[mask], trump.ordinal
+        return int(self.trumps[i, t]), int(self.bowers[i, t]), int(self.aces[i, t])
+
+
+_TABLES: Optional[HandTables] = None
+
+
+def get_hand_tables(path: Optional[str] = None) -> HandTables:
+    """
+    The process-wide tables, built on first use. With `path`, they are
+    loaded from that file if it exists and written there otherwise.
+    """
+    global _TABLES
+    if _TABLES is None:
+        if path is not None and os.path.exists(path):
+            _TABLES = HandTables.load(path)
+        else:
+            _TABLES = HandTables.build()
+            if path is not None:
+                _TABLES.save(path)
+    return _TABLES
+
+
+def hand_scores(hand: Sequence[Card]) -> Sequence[int]:
+    """RuleBasedAgent scores of `hand` for each trump, indexed by suit ordinal."""
+    if len(hand) == HAND_SIZE:
+        return get_hand_tables().scores(cards_to_mask(hand))
+    return tuple(sum(row[c.ordinal] for c in hand) for row in _SCORE_ROWS)
+
+
+def hand_tier(hand: Sequence[Card], trump: Suit) -> int:
+    """CFR strength tier (0-4) of `hand` with `trump` as trump."""
+    if len(hand) == HAND_SIZE:
+        return get_hand_tables().tiers(cards_to_mask(hand))[trump.ordinal]
+    row = _CFR_ROWS[trump.ordinal]
+    return tier_of(sum(row[c.ordinal] for c in hand))
@@ -5,6 +5,7 @@ from .base import Agent
 from ..engine.state import EuchreGameState
 from ..engine.card import Card, Suit, Rank
 from ..engine.actions import get_valid_moves
+from .hand_tables import hand_scores
 
 class RuleBasedAgent(Agent):
     """
@@ -57,12 +58,14 @@ class RuleBasedAgent(Agent):
         
         best_suit = None
         best_score = 0
+        # One table lookup scores the hand for every suit
+        scores = hand_scores(hand)
         
         for suit in Suit:
             if suit == invalid_suit:
                 continue
             
-            score = self._eval_hand(hand, suit)
+            score = scores[suit.ordinal]
             if score > best_score:
                 best_score = score
                 best_suit = suit
@@ -99,17 +102,6 @@ class RuleBasedAgent(Agent):
         """
         Standard Point System:
         Right = 4, Left = 3, Ace = 1, Trump = 2
+        (precomputed per hand and trump, see hand_tables)
         """
-        score = 0
-        for card in hand:
-            eff_suit = card.get_effective_suit(trump)
-            if eff_suit == trump:
-                if card.rank == Rank.JACK and card.suit == trump:
-                    score += 4 # Right
-                elif card.rank == Rank.JACK:
-                    score += 3 # Left
-                else:
-                    score += 2 # Regular Trump
-            elif card.rank == Rank.ACE:
-                score += 1
-        return score
\ No newline at end of file
+        return hand_scores(hand)[trump.ordinal]
\ No newline at end of file
@@ -1,36 +1,94 @@
 import time
-import copy
 import random
 import math
-from typing import List, Optional
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
 
 from .base import Agent
 from .heuristic import RuleBasedAgent
 from ..engine.state import EuchreGameState, GamePhase
 from ..engine.card import Card, Suit
 from ..engine.actions import get_valid_moves
+from ..engine.bitboard import cards_to_mask
+from ..engine.solver import DoubleDummySolver
+from ..engine.zobrist import TranspositionTable, position_key
+
+class NodeStats:
+    """Visit statistics, shared by every node that reaches the same position."""
+    __slots__ = ("visits", "team0_wins")
+
+    def __init__(self):
+        self.visits = 0
+        self.team0_wins = 0.0
 
 class MCTSNode:
-    def __init__(self, parent=None, move=None, player_idx=None):
+    def __init__(self, parent=None, move=None, player_idx=None, stats: Optional[NodeStats] = None):
         self.parent = parent
         self.move = move  # The card played to reach this node
         self.player_idx = player_idx # Who played the move
         self.children = []
-        self.visits = 0
-        self.wins = 0.0
-        self.untried_moves = []
+        self.stats = stats if stats is not None else NodeStats()
+        # Times this node was selectable, i.e. its move was legal in the determinization
+        self.avails = 1
+
+    @property
+    def visits(self):
+        return self.stats.visits
+
+    @property
+    def wins(self):
+        """Wins from the point of view of player_idx's team."""
+        stats = self.stats
+        return stats.team0_wins if self.player_idx % 2 == 0 else stats.visits - stats.team0_wins
+
+    def child_for(self, move):
+        for child in self.children:
+            if child.move is move:
+                return child
+        return None
 
     def ucb1(self, c=1.41):
-        if self.visits == 0:
+        visits = self.stats.visits
+        if visits == 0:
             return float('inf')
-        return (self.wins / self.visits) + c * math.sqrt(math.log(self.parent.visits) / self.visits)
+        return (self.wins / visits) + c * math.sqrt(math.log(self.avails) / visits)
 
 class MCTSAgent(Agent):
-    def __init__(self, name: str, simulation_time=1.0):
-        super().__init__(name)
+    def __init__(self, name: str, simulation_time=1.0, rng: Optional[random.Random] = None,
+                 reuse_tree: bool = True, workers: int = 1, tt_size: Optional[int] = 100_000,
+                 leaf: str = "rollout", iterations: Optional[int] = None):
+        super().__init__(name, rng)
+        if leaf not in ("rollout", "solver"):
+            raise ValueError(f"Unknown leaf evaluation: {leaf}")
         self.simulation_time = simulation_time
+        # Fixed number of iterations per search (per worker), instead of the
+        # time budget; makes seeded searches reproducible
+        self.iterations = iterations
+        # Leaf evaluation: a random rollout, or the exact double-dummy result
+        # of the determinized world (slower per iteration, far less noisy)
+        self.leaf = leaf
+        self._solver: Optional[DoubleDummySolver] = None
+        # Root parallelism: `workers` processes search independently and their
+        # root visit counts are summed. The pool is started on first use and
+        # kept warm until close().
+        self.workers = workers
+        self._pool: Optional[ProcessPoolExecutor] = None
+        # Keep the search tree between decisions of the same hand
+        self.reuse_tree = reuse_tree
+        self._tree: Optional[MCTSNode] = None
+        self._tree_hand = None   # identifies the hand the tree belongs to
+        self._tree_plays = []    # tracker.plays at the tree's root
+        # Transposition table: nodes reaching the same position (e.g. the same
+        # cards played in a different trick order) share one NodeStats.
+        # At most tt_size entries, least recently used evicted; None disables.
+        self.tt_size = tt_size
+        self._table: Optional[TranspositionTable[NodeStats]] = TranspositionTable(tt_size) if tt_size else None
         # We use the RuleBased bot for Bidding and Rollouts
         self.fallback_bot = RuleBasedAgent("Internal")
+        # Iterations completed by the most recent search (for benchmarking)
+        self.last_iterations = 0
+        # Visits the most recent root already had from earlier searches
+        self.last_reused_visits = 0
 
     # --- Bidding: Delegate to Heuristic (Faster) ---
     def select_discard(self, hand, up_card):
@@ -48,107 +106,218 @@ class MCTSAgent(Agent):
         hand = game_state.hands[player_idx]
         valid_moves = get_valid_moves(hand, game_state.current_trick, game_state.trump_suit)
 
+        self.last_iterations = 0
+        self.last_reused_visits = 0
+
         # Optimization: Only 1 move? Don't think, just play.
         if len(valid_moves) == 1:
             return valid_moves[0]
 
-        root = MCTSNode(player_idx=player_idx)
-        root.untried_moves = valid_moves
-        
         end_time = time.time() + self.simulation_time
+        if self.workers > 1:
+            visits = self._parallel_search(game_state, end_time)
+        else:
+            visits = self._search(game_state, end_time)
+
+        # Return best move (most visited)
+        return max(valid_moves, key=lambda c: visits.get(c, 0))
 
-        while time.time() < end_time:
-            # 1. Determinize (Guess hidden cards)
-            # We clone the state and reshuffle unknown cards to opponents
-            sim_state = self._determinize(game_state)
+    def _search(self, game_state: EuchreGameState, end_time: float, added_only: bool = False) -> Dict[Card, int]:
+        """
+        Runs ISMCTS from `game_state` until `end_time`; returns root visits per
+        card (with `added_only`, just the visits this search added).
+        """
+        player_idx = game_state.current_player_index
+        root = self._advance_tree(game_state, player_idx)
+        before = {child.move: child.visits for child in root.children} if added_only else {}
+        self.last_reused_visits = 0 if added_only else root.visits
+
+        # One clone for the whole search; every iteration is undone back to here
+        sim_state = game_state.clone()
+        iterations = 0
+
+        limit = self.iterations
+        while (iterations < limit) if limit is not None else (time.time() < end_time):
+            iterations += 1
+            # 1. Determinize: deal the hidden cards consistently with what we've seen
+            self._determinize(sim_state, player_idx)
             
             node = root
             
-            # 2. Select
-            # Navigate down the tree to a leaf
-            while not node.untried_moves and node.children:
-                node = max(node.children, key=lambda c: c.ucb1())
-                # Apply move to sim_state
-                # Note: We need a way to advance the sim_state. 
-                # In this simplified version, we just play the move.
-                sim_state.play_card(node.player_idx, self._get_card_index(sim_state, node.move))
-
-            # 3. Expand
-            # If we aren't at game over, add a child node
-            if node.untried_moves and sim_state.phase == GamePhase.PLAYING:
-                move = random.choice(node.untried_moves)
-                
-                # Apply move
-                current_p = sim_state.current_player_index
-                sim_state.play_card(current_p, self._get_card_index(sim_state, move))
-                
-                new_node = MCTSNode(parent=node, move=move, player_idx=current_p)
-                # Calculate legal moves for the *next* player in the sim
-                next_p = sim_state.current_player_index
-                if sim_state.phase == GamePhase.PLAYING:
-                    new_node.untried_moves = get_valid_moves(sim_state.hands[next_p], sim_state.current_trick, sim_state.trump_suit)
-                
-                node.children.append(new_node)
-                node.untried_moves.remove(move)
-                node = new_node
-
-            # 4. Rollout
-            # Play randomly/heuristically until hand ends
+            # 2. Select / 3. Expand (single-observer ISMCTS)
+            # Only children whose card is legal in this determinization compete
             while sim_state.phase == GamePhase.PLAYING:
-                p_idx = sim_state.current_player_index
-                moves = get_valid_moves(sim_state.hands[p_idx], sim_state.current_trick, sim_state.trump_suit)
-                random_move = random.choice(moves)
-                sim_state.play_card(p_idx, self._get_card_index(sim_state, random_move))
+                p = sim_state.current_player_index
+                legal = get_valid_moves(sim_state.hands[p], sim_state.current_trick, sim_state.trump_suit)
+                available = []
+                untried = []
+                for move in legal:
+                    child = node.child_for(move)
+                    if child is None:
+                        untried.append(move)
+                    else:
+                        available.append(child)
+                if untried:
+                    move = self.rng.choice(untried)
+                    for other in available:
+                        other.avails += 1
+                    sim_state.apply(move)
+                    child = MCTSNode(parent=node, move=move, player_idx=p, stats=self._stats_for(sim_state))
+                    node.children.append(child)
+                    node = child
+                    break
+                for child in available:
+                    child.avails += 1
+                node = max(available, key=lambda c: c.ucb1())
+                sim_state.apply(node.move)
+
+            # 4. Rollout (or solve the rest of this world exactly)
+            team0_tricks = sim_state.tricks_taken[0]
+            if self.leaf == "solver" and sim_state.phase == GamePhase.PLAYING:
+                team0_tricks += self._solver.team0_tricks(
+                    [cards_to_mask(h) for h in sim_state.hands],
+                    [(p, c.ordinal) for p, c in sim_state.current_trick],
+                    sim_state.current_player_index,
+                )
+            else:
+                # Play randomly until hand ends
+                while sim_state.phase == GamePhase.PLAYING:
+                    p_idx = sim_state.current_player_index
+                    moves = get_valid_moves(sim_state.hands[p_idx], sim_state.current_trick, sim_state.trump_suit)
+                    sim_state.apply(self.rng.choice(moves))
+                # apply() stops at HAND_OVER, so tricks_taken still holds this hand's result.
+                team0_tricks = sim_state.tricks_taken[0]
 
             # 5. Backpropagate
-            # Did our team win?
-            # Note: team_scores increases during play. We need to check if we won the HAND.
-            # Simplified: Did we win more tricks in this rollout?
-            # Or did we get points?
-            
-            # Let's check the team of the root player
-            root_team = root.player_idx % 2
-            
-            # Simple reward: 1 if we won the hand, 0 if lost
-            # We can check sim_state.team_scores vs original scores, 
-            # or just sim_state.tricks_taken if hand isn't fully scored yet.
-            
-            # Better reward: Difference in tricks taken
-            reward = 0
-            if sim_state.tricks_taken[root_team] > sim_state.tricks_taken[1-root_team]:
-                reward = 1.0
+            # Simple reward: 1 to the team that won more tricks (3 of 5), 0 to the other
+            winning_team = 0 if team0_tricks >= 3 else 1
             
             while node:
-                node.visits += 1
-                node.wins += reward
+                node.stats.visits += 1
+                if winning_team == 0:
+                    node.stats.team0_wins += 1.0
                 node = node.parent
 
-        # Return best move (most visited)
-        best_child = max(root.children, key=lambda c: c.visits)
-        return best_child.move
+            while sim_state.undo_depth:
+                sim_state.undo()
+
+        self.last_iterations = iterations
+
+        if self.reuse_tree:
+            self._tree = root
+            self._tree_plays = list(game_state.tracker.plays)
+        return {child.move: child.visits - before.get(child.move, 0) for child in root.children}
+
+    def _parallel_search(self, game_state: EuchreGameState, end_time: float) -> Dict[Card, int]:
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers, initializer=_init_search_worker,
+                initargs=(self.simulation_time, self.reuse_tree, self.tt_size, self.leaf, self.iterations),
+            )
+        state = game_state.clone()
+        state.rng = None  # the module-level default can't be pickled; searches never deal
+        # Every task shares the same deadline, so a worker that happens to pick
+        # up two of them doesn't stretch the decision past the time budget
+        decision = self.rng.getrandbits(64)
+        futures = [
+            self._pool.submit(_search_in_worker, state, end_time, self.rng.getrandbits(64), decision)
+            for _ in range(self.workers)
+        ]
+        visits: Dict[Card, int] = {}
+        self.last_iterations = 0
+        self.last_reused_visits = 0
+        for future in futures:
+            counts, iterations, reused = future.result()
+            self.last_iterations += iterations
+            self.last_reused_visits += reused
+            for card, n in counts.items():
+                visits[card] = visits.get(card, 0) + n
+        return visits
+
+    def close(self):
+        """Shuts down the worker pool (if any)."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_pool"] = None
+        return state
+
+    def _advance_tree(self, game_state: EuchreGameState, player_idx: int) -> MCTSNode:
+        """
+        Returns the search root for this decision: the subtree of the previous
+        search reached by the cards played since, or a fresh node on a new hand.
+        """
+        tracker = game_state.tracker
+        # The seat's own holding for the hand (cards left plus cards played) tells
+        # apart deals that share the public details, e.g. hand 1 of two games
+        held = cards_to_mask(game_state.hands[player_idx]) | cards_to_mask(
+            card for seat, card in tracker.plays if seat == player_idx)
+        hand = (tracker.dealer, tracker.up_card, game_state.trump_suit, game_state.maker_team,
+                game_state.loner_player_index, tuple(game_state.team_scores), held)
+        node = self._tree if self.reuse_tree and hand == self._tree_hand else None
+        if hand != self._tree_hand and self._table is not None:
+            # Keys don't cover the hidden deal, so entries never carry over between hands
+            self._table.clear()
+        if hand != self._tree_hand or self._solver is None:
+            self._solver = DoubleDummySolver.for_state(game_state) if self.leaf == "solver" else None
+        self._tree = None
+        self._tree_hand = hand
 
-    def _determinize(self, state: EuchreGameState) -> EuchreGameState:
+        seen = len(self._tree_plays)
+        if node is not None and tracker.plays[:seen] == self._tree_plays:
+            for _, card in tracker.plays[seen:]:
+                node = node.child_for(card)
+                if node is None:
+                    break
+        else:
+            node = None
+
+        if node is None:
+            return MCTSNode(player_idx=player_idx, stats=self._stats_for(game_state))
+        # Detach so backpropagation stops here and the old ancestors can be freed
+        node.parent = None
+        return node
+
+    def _stats_for(self, state: EuchreGameState) -> NodeStats:
+        if self._table is None or state.phase != GamePhase.PLAYING:
+            return NodeStats()
+        return self._table.get_or_create(position_key(state), NodeStats)
+
+    def _determinize(self, sim: EuchreGameState, observer: int):
         """
-        Creates a perfect-information clone of the state.
-        It keeps the current player's hand and the current trick fixed.
-        It shuffles all other unknown cards and deals them to opponents.
+        Re-deals the cards `observer` cannot see in `sim` (a clone of the real
+        game, reset to the root position) for one iteration.
+        Uses the state's CardTracker, so the sampled world respects the played
+        cards, the up-card and every void shown so far.
         """
-        # Deep copy the state so we don't mess up the real game
-        sim = copy.deepcopy(state)
-        
-        # In a real implementation, you would:
-        # 1. Collect all cards not in my hand, not in current trick, and not played.
-        # 2. Shuffle them.
-        # 3. Redistribute to other players.
-        # For now, to keep it runnable without complex state tracking, 
-        # we will return the naive deepcopy (Assuming we know everyone's cards - Cheating MCTS)
-        # This is often called PIMC (Perfect Information Monte Carlo)
-        return sim
-
-    def _get_card_index(self, state, card):
-        """Helper to find the index of a card object in a hand."""
-        hand = state.hands[state.current_player_index]
-        for i, c in enumerate(hand):
-            if c.rank == card.rank and c.suit == card.suit:
-                return i
-        return 0
\ No newline at end of file
+        sim.hands = sim.tracker.sample_hands(sim.hands, observer, sim.trump_suit, self.rng)
+
+
+# Each pool process keeps one searcher, so its tree survives between decisions
+_WORKER_SEARCHER: Optional[MCTSAgent] = None
+# The decision (a random id per parallel search) this process last searched for
+_WORKER_DECISION: Optional[int] = None
+
+
+def _init_search_worker(simulation_time: float, reuse_tree: bool, tt_size: Optional[int], leaf: str,
+                        iterations: Optional[int]):
+    global _WORKER_SEARCHER
+    _WORKER_SEARCHER = MCTSAgent("Worker", simulation_time=simulation_time, reuse_tree=reuse_tree,
+                                 tt_size=tt_size, leaf=leaf, iterations=iterations)
+
+
+def _search_in_worker(state: EuchreGameState, end_time: float, seed: int,
+                      decision: int) -> Tuple[Dict[Card, int], int, int]:
+    global _WORKER_DECISION
+    searcher = _WORKER_SEARCHER
+    searcher.rng = random.Random(seed)
+    # A second task of the same decision on this process continues the first
+    # one's tree: report only what it adds, or the merge would count the
+    # first task's visits twice
+    repeat = decision == _WORKER_DECISION
+    _WORKER_DECISION = decision
+    visits = searcher._search(state, end_time, added_only=repeat)
+    return visits, searcher.last_iterations, searcher.last_reused_visits
@@ -0,0 +1,63 @@
+import random
+from typing import Dict, Optional
+
+from .base import Agent
+from .heuristic import RuleBasedAgent
+from ..engine.state import EuchreGameState
+from ..engine.card import Card
+from ..engine.actions import get_valid_moves
+from ..engine.bitboard import cards_to_mask
+from ..engine.solver import DoubleDummySolver
+
+class PIMCAgent(Agent):
+    """
+    Perfect Information Monte Carlo: deals `samples` worlds consistent with
+    what this seat has seen (via the state's CardTracker), solves each one
+    exactly with the double-dummy solver and plays the card with the most
+    tricks summed over all worlds.
+    """
+    def __init__(self, name: str, samples: int = 20, rng: Optional[random.Random] = None):
+        super().__init__(name, rng)
+        self.samples = samples
+        # Bidding is delegated to the heuristic bot, as in MCTSAgent
+        self.fallback_bot = RuleBasedAgent("Internal")
+        # One solver per hand, so worlds share its trick-boundary cache
+        self._solver: Optional[DoubleDummySolver] = None
+        self._solver_hand = None
+
+    def select_discard(self, hand, up_card):
+        return self.fallback_bot.select_discard(hand, up_card)
+
+    def pick_up_card(self, game_state):
+        return self.fallback_bot.pick_up_card(game_state)
+
+    def call_suit(self, game_state):
+        return self.fallback_bot.call_suit(game_state)
+
+    def play_card(self, game_state: EuchreGameState) -> Card:
+        player_idx = game_state.current_player_index
+        valid_moves = get_valid_moves(game_state.hands[player_idx], game_state.current_trick, game_state.trump_suit)
+        if len(valid_moves) == 1:
+            return valid_moves[0]
+
+        solver = self._solver_for(game_state)
+        tracker = game_state.tracker
+        trick = [(p, c.ordinal) for p, c in game_state.current_trick]
+        totals: Dict[int, int] = {}
+        for _ in range(self.samples):
+            hands = tracker.sample_hands(game_state.hands, player_idx, game_state.trump_suit, self.rng)
+            values = solver.card_values([cards_to_mask(h) for h in hands], trick, player_idx)
+            for idx, tricks in values.items():
+                totals[idx] = totals.get(idx, 0) + tricks
+
+        # Ties go to the first card in hand order
+        return max(valid_moves, key=lambda c: totals[c.ordinal])
+
+    def _solver_for(self, game_state: EuchreGameState) -> DoubleDummySolver:
+        tracker = game_state.tracker
+        hand = (tracker.dealer, tracker.up_card, game_state.trump_suit, game_state.loner_player_index,
+                tuple(game_state.team_scores))
+        if self._solver is None or hand != self._solver_hand:
+            self._solver = DoubleDummySolver.for_state(game_state)
+            self._solver_hand = hand
+        return self._solver
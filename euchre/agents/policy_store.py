@@ -0,0 +1,212 @@
+"""
+Compact, memory-mapped storage for CFR policies.
+
+The pickled policy ({info_set_key: {action: probability}}) has to be
+unpickled in full by every CFRAgent. The compact format instead holds:
+
+    header   magic, version, number of actions, number of entries,
+             offset of the key-string section (0 if absent), action names
+    keys     uint64[count], sorted: 64-bit BLAKE2b hashes of the key strings
+    probs    float32[count, num_actions], rows aligned with `keys`
+    strings  optional: uint64 offsets[count + 1] and the UTF-8 key strings,
+             only read when converting back to a pickle
+
+and is opened with mmap, so loading costs a few syscalls and the pages
+are shared by every process that maps the file. `load_policy` also keeps a
+process-wide cache, so repeated CFRAgent constructions reuse one mapping.
+
+    python -m euchre.agents.policy_store to-compact cfr_policy.pkl cfr_policy.bin
+    python -m euchre.agents.policy_store to-pickle cfr_policy.bin cfr_policy.pkl
+"""
+import argparse
+import hashlib
+import mmap
+import os
+import pickle
+import struct
+import sys
+from typing import Dict, Mapping, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+MAGIC = b"EUCHPOL\0"
+VERSION = 1
+_HEADER = struct.Struct("<8sIIQQ")
+_ACTION_BYTES = 8
+
+
+def key_hash(key: str) -> int:
+    """64-bit hash of an info-set key, as stored in compact policy files."""
+    return int.from_bytes(hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+def write_policy(policy: Mapping[str, Mapping[str, float]], path: str, actions: Optional[Sequence[str]] = None,
+                 include_keys: bool = True):
+    """
+    Writes a {key: {action: probability}} policy in the compact format.
+    `include_keys` appends the key strings so the file can be turned back
+    into a pickle; lookups never touch them.
+    """
+    if actions is None:
+        actions = list(next(iter(policy.values()))) if policy else ["P", "O"]
+    if any(len(a.encode("ascii")) > _ACTION_BYTES for a in actions):
+        raise ValueError(f"Action names must be at most {_ACTION_BYTES} ASCII characters")
+
+    keys = list(policy)
+    hashes = np.fromiter((key_hash(k) for k in keys), dtype=np.uint64, count=len(keys))
+    probs = np.array([[row.get(a, 0.0) for a in actions] for row in policy.values()], dtype=np.float32)
+    probs = probs.reshape(len(policy), len(actions))
+    order = np.argsort(hashes, kind="stable")
+    hashes, probs = hashes[order], probs[order]
+    if len(hashes) > 1 and (hashes[1:] == hashes[:-1]).any():
+        raise ValueError("Two info-set keys hash to the same 64-bit value")
+
+    strings_offset = 0
+    if include_keys:
+        strings_offset = _HEADER.size + len(actions) * _ACTION_BYTES + hashes.nbytes + probs.nbytes
+        encoded = [keys[i].encode("utf-8") for i in order]
+        ends = np.cumsum([0] + [len(e) for e in encoded], dtype=np.uint64)
+
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, VERSION, len(actions), len(hashes), strings_offset))
+        for a in actions:
+            f.write(a.encode("ascii").ljust(_ACTION_BYTES, b"\0"))
+        f.write(hashes.astype("<u8").tobytes())
+        f.write(probs.astype("<f4").tobytes())
+        if include_keys:
+            f.write(ends.astype("<u8").tobytes())
+            f.write(b"".join(encoded))
+    os.replace(tmp_path, path)
+
+
+def is_compact_policy(path: str) -> bool:
+    with open(path, "rb") as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+
+class CompactPolicy:
+    """Read-only, dict-like view of a compact policy file."""
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, num_actions, count, self._strings_offset = _HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a compact policy file")
+        if version != VERSION:
+            raise ValueError(f"{path}: unsupported compact policy version {version}")
+        offset = _HEADER.size
+        self.actions: Tuple[str, ...] = tuple(
+            self._mmap[offset + i * _ACTION_BYTES: offset + (i + 1) * _ACTION_BYTES].rstrip(b"\0").decode("ascii")
+            for i in range(num_actions)
+        )
+        offset += num_actions * _ACTION_BYTES
+        self.keys = np.frombuffer(self._mmap, dtype="<u8", count=count, offset=offset)
+        offset += 8 * count
+        self.probs = np.frombuffer(self._mmap, dtype="<f4", count=count * num_actions, offset=offset)
+        self.probs = self.probs.reshape(count, num_actions)
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def _row(self, key: str) -> int:
+        h = np.uint64(key_hash(key))
+        i = int(np.searchsorted(self.keys, h))
+        return i if i < len(self.keys) and self.keys[i] == h else -1
+
+    def __contains__(self, key: str) -> bool:
+        return self._row(key) >= 0
+
+    def probabilities(self, key: str) -> Optional[np.ndarray]:
+        i = self._row(key)
+        return None if i < 0 else self.probs[i]
+
+    def get(self, key: str, default=None) -> Union[Dict[str, float], None]:
+        i = self._row(key)
+        if i < 0:
+            return default
+        return dict(zip(self.actions, self.probs[i].tolist()))
+
+    def __getitem__(self, key: str) -> Dict[str, float]:
+        row = self.get(key)
+        if row is None:
+            raise KeyError(key)
+        return row
+
+    def key_strings(self) -> Optional[list]:
+        """The original keys, row-aligned, if the file was written with them."""
+        if not self._strings_offset:
+            return None
+        count = len(self.keys)
+        ends = np.frombuffer(self._mmap, dtype="<u8", count=count + 1, offset=self._strings_offset)
+        blob = self._strings_offset + 8 * (count + 1)
+        return [self._mmap[blob + int(ends[i]): blob + int(ends[i + 1])].decode("utf-8") for i in range(count)]
+
+    def to_dict(self) -> Dict[str, Dict[str, float]]:
+        keys = self.key_strings()
+        if keys is None:
+            raise ValueError(f"{self.path} was written without key strings")
+        return {k: dict(zip(self.actions, row)) for k, row in zip(keys, self.probs.tolist())}
+
+
+# path -> (mtime, size, policy); shared by every CFRAgent in the process
+_CACHE: Dict[str, Tuple[int, int, object]] = {}
+
+
+def load_policy(path: str):
+    """
+    Loads a policy file, compact or pickled, through the process-wide cache.
+    The result is shared between callers, so treat it as read-only.
+    """
+    path = os.path.abspath(path)
+    stat = os.stat(path)
+    cached = _CACHE.get(path)
+    if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+        return cached[2]
+    if is_compact_policy(path):
+        policy = CompactPolicy(path)
+    else:
+        with open(path, "rb") as f:
+            policy = pickle.load(f)
+    _CACHE[path] = (stat.st_mtime_ns, stat.st_size, policy)
+    return policy
+
+
+def clear_cache():
+    _CACHE.clear()
+
+
+def pickle_to_compact(pickle_path: str, compact_path: str):
+    with open(pickle_path, "rb") as f:
+        write_policy(pickle.load(f), compact_path)
+
+
+def compact_to_pickle(compact_path: str, pickle_path: str):
+    with open(pickle_path, "wb") as f:
+        pickle.dump(CompactPolicy(compact_path).to_dict(), f)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m euchre.agents.policy_store",
+                                     description="Convert CFR policies between pickle and the compact format.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    to_compact = sub.add_parser("to-compact", help="pickle -> compact")
+    to_compact.add_argument("src")
+    to_compact.add_argument("dst")
+    to_pickle = sub.add_parser("to-pickle", help="compact -> pickle")
+    to_pickle.add_argument("src")
+    to_pickle.add_argument("dst")
+    args = parser.parse_args(argv)
+
+    if args.command == "to-compact":
+        pickle_to_compact(args.src, args.dst)
+    else:
+        compact_to_pickle(args.src, args.dst)
+    print(f"Converted {args.src} -> {args.dst}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,354 @@
+"""
+Performance benchmarks for the engine, agents and trainers.
+
+    python -m euchre.bench                              # run, compare to bench_baseline.json if present
+    python -m euchre.bench --output results.json        # also write results
+    python -m euchre.bench --save-baseline bench_baseline.json
+    python -m euchre.bench --baseline old.json --threshold 0.1
+
+Each benchmark reports one number. Rates are the best of `--repeat` timed
+rounds of roughly `--duration` seconds, which is far less noisy than a single
+long run. A result counts as a regression when it is worse than the baseline
+by more than the threshold (a fraction, default 0.15); the exit status is then 1.
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import time
+from typing import Callable, Dict, List, Optional
+
+from .engine.actions import get_valid_moves, resolve_trick
+from .engine.bitboard import ALL_CARDS, cards_to_mask, get_valid_moves_mask, resolve_trick_mask, suit_index
+from .engine.card import Suit
+from .engine.state import EuchreGameState, GamePhase
+
+DEFAULT_BASELINE = "bench_baseline.json"
+
+
+class Benchmark:
+    def __init__(self, name: str, func: Callable[["BenchContext"], Optional[float]], unit: str, higher_is_better: bool):
+        self.name = name
+        self.func = func
+        self.unit = unit
+        self.higher_is_better = higher_is_better
+
+
+class BenchContext:
+    """Settings shared by all benchmarks."""
+    def __init__(self, duration: float = 1.0, repeat: int = 3, policy_file: str = "cfr_policy.pkl", seed: int = 0):
+        self.duration = duration
+        self.repeat = repeat
+        self.policy_file = policy_file
+        self.seed = seed
+
+    def best_rate(self, run_batch: Callable[[], int]) -> float:
+        """Ops/second: `run_batch` does some work and returns how many ops it did."""
+        best = 0.0
+        for _ in range(self.repeat):
+            ops = 0
+            start = time.perf_counter()
+            deadline = start + self.duration
+            while True:
+                ops += run_batch()
+                now = time.perf_counter()
+                if now >= deadline:
+                    break
+            best = max(best, ops / (now - start))
+        return best
+
+
+BENCHMARKS: Dict[str, Benchmark] = {}
+
+
+def benchmark(name: str, unit: str = "ops/s", higher_is_better: bool = True):
+    def register(func):
+        BENCHMARKS[name] = Benchmark(name, func, unit, higher_is_better)
+        return func
+    return register
+
+
+def _random_tricks(rng: random.Random, count: int):
+    """(hand, trick, trump) scenarios with 0-3 cards already in the trick."""
+    scenarios = []
+    for _ in range(count):
+        cards = rng.sample(ALL_CARDS, 9)
+        trick = [(p, c) for p, c in enumerate(cards[5:5 + rng.randint(0, 3)])]
+        scenarios.append((cards[:5], trick, rng.choice(list(Suit))))
+    return scenarios
+
+
+def _full_tricks(rng: random.Random, count: int):
+    return [([(p, c) for p, c in enumerate(rng.sample(ALL_CARDS, 4))], rng.choice(list(Suit))) for _ in range(count)]
+
+
+@benchmark("get_valid_moves", "calls/s")
+def bench_valid_moves(ctx: BenchContext):
+    scenarios = _random_tricks(random.Random(ctx.seed), 1000)
+
+    def run():
+        for hand, trick, trump in scenarios:
+            get_valid_moves(hand, trick, trump)
+        return len(scenarios)
+    return ctx.best_rate(run)
+
+
+@benchmark("resolve_trick", "calls/s")
+def bench_resolve_trick(ctx: BenchContext):
+    tricks = _full_tricks(random.Random(ctx.seed), 1000)
+
+    def run():
+        for trick, trump in tricks:
+            resolve_trick(trick, trump)
+        return len(tricks)
+    return ctx.best_rate(run)
+
+
+@benchmark("get_valid_moves_mask", "calls/s")
+def bench_valid_moves_mask(ctx: BenchContext):
+    scenarios = [
+        (cards_to_mask(hand), [(p, c.ordinal) for p, c in trick], suit_index(trump))
+        for hand, trick, trump in _random_tricks(random.Random(ctx.seed), 1000)
+    ]
+
+    def run():
+        for hand, trick, trump in scenarios:
+            get_valid_moves_mask(hand, trick, trump)
+        return len(scenarios)
+    return ctx.best_rate(run)
+
+
+@benchmark("resolve_trick_mask", "calls/s")
+def bench_resolve_trick_mask(ctx: BenchContext):
+    tricks = [
+        ([(p, c.ordinal) for p, c in trick], suit_index(trump))
+        for trick, trump in _full_tricks(random.Random(ctx.seed), 1000)
+    ]
+
+    def run():
+        for trick, trump in tricks:
+            resolve_trick_mask(trick, trump)
+        return len(tricks)
+    return ctx.best_rate(run)
+
+
+def _play_hand(game: EuchreGameState):
+    """Deal, order up from the first seat and play first legal cards to the end."""
+    game.start_hand()
+    game.order_up(game.current_player_index)
+    while game.phase == GamePhase.PLAYING:
+        p = game.current_player_index
+        hand = game.hands[p]
+        card = get_valid_moves(hand, game.current_trick, game.trump_suit)[0]
+        game.play_card(p, hand.index(card))
+
+
+@benchmark("game_state_hands", "hands/s")
+def bench_hands(ctx: BenchContext):
+    rng = random.Random(ctx.seed)
+
+    def run():
+        # A fresh game per batch so target_score is never reached mid-run
+        game = EuchreGameState(target_score=10**9, rng=rng)
+        for _ in range(20):
+            _play_hand(game)
+        return 20
+    return ctx.best_rate(run)
+
+
+def _mcts_position(seed: int) -> EuchreGameState:
+    game = EuchreGameState(rng=random.Random(seed))
+    game.start_hand()
+    game.order_up(game.current_player_index)
+    return game
+
+
+@benchmark("mcts_iterations", "iterations/s")
+def bench_mcts(ctx: BenchContext):
+    from .agents.mcts import MCTSAgent
+
+    best = 0.0
+    for i in range(ctx.repeat):
+        game = _mcts_position(ctx.seed + i)
+        agent = MCTSAgent("Bench", simulation_time=ctx.duration, rng=random.Random(ctx.seed))
+        start = time.perf_counter()
+        agent.play_card(game)
+        elapsed = time.perf_counter() - start
+        best = max(best, agent.last_iterations / elapsed)
+    return best
+
+
+@benchmark("mcts_parallel_iterations", "iterations/s")
+def bench_mcts_parallel(ctx: BenchContext):
+    """Root-parallel MCTS on up to 4 cores, with the worker pool already warm."""
+    from .agents.mcts import MCTSAgent
+
+    workers = min(4, os.cpu_count() or 1)
+    if workers < 2:
+        return None
+    agent = MCTSAgent("Bench", simulation_time=ctx.duration, rng=random.Random(ctx.seed), workers=workers)
+    best = 0.0
+    try:
+        agent.play_card(_mcts_position(ctx.seed))  # start the pool
+        for i in range(ctx.repeat):
+            game = _mcts_position(ctx.seed + i)
+            start = time.perf_counter()
+            agent.play_card(game)
+            elapsed = time.perf_counter() - start
+            best = max(best, agent.last_iterations / elapsed)
+    finally:
+        agent.close()
+    return best
+
+
+@benchmark("cfr_iterations", "iterations/s")
+def bench_cfr(ctx: BenchContext):
+    from .training.cfr_trainer import CFRTrainer
+
+    trainer = CFRTrainer(rng=random.Random(ctx.seed))
+
+    def run():
+        trainer.train_iteration()
+        return 1
+    return ctx.best_rate(run)
+
+
+@benchmark("server_games", "games/s")
+def bench_server_games(ctx: BenchContext):
+    """Rule-based games on 50 concurrent asyncio tables (event-loop overhead, no executor)."""
+    import asyncio
+    from .agents import RuleBasedAgent
+    from .server import InlineAgent, TableManager
+
+    rng = random.Random(ctx.seed)
+    seats = [InlineAgent(RuleBasedAgent(f"R{i}")) for i in range(4)]
+
+    async def play_batch():
+        async with TableManager(max_tables=50) as manager:
+            futures = [await manager.submit(seats, rng=random.Random(rng.getrandbits(32))) for _ in range(50)]
+            await asyncio.gather(*futures)
+        return 50
+    return ctx.best_rate(lambda: asyncio.run(play_batch()))
+
+
+def _cold_agent_load(policy_file: str, repeat: int) -> float:
+    from .agents.cfr_agent import CFRAgent
+    from .agents.policy_store import clear_cache
+
+    best = float("inf")
+    for _ in range(max(repeat, 5)):
+        # Time a cold load, not a hit in the process-wide policy cache
+        clear_cache()
+        start = time.perf_counter()
+        CFRAgent("Bench", policy_file=policy_file)
+        best = min(best, time.perf_counter() - start)
+    clear_cache()
+    return best
+
+
+@benchmark("cfr_agent_load", "s", higher_is_better=False)
+def bench_cfr_agent_load(ctx: BenchContext):
+    if not os.path.exists(ctx.policy_file):
+        return None
+    return _cold_agent_load(ctx.policy_file, ctx.repeat)
+
+
+@benchmark("cfr_agent_load_compact", "s", higher_is_better=False)
+def bench_cfr_agent_load_compact(ctx: BenchContext):
+    import tempfile
+    from .agents.policy_store import is_compact_policy, pickle_to_compact
+
+    if not os.path.exists(ctx.policy_file):
+        return None
+    if is_compact_policy(ctx.policy_file):
+        return _cold_agent_load(ctx.policy_file, ctx.repeat)
+    with tempfile.TemporaryDirectory() as tmp:
+        compact = os.path.join(tmp, "policy.bin")
+        pickle_to_compact(ctx.policy_file, compact)
+        return _cold_agent_load(compact, ctx.repeat)
+
+
+def run_benchmarks(ctx: BenchContext, names: Optional[List[str]] = None) -> dict:
+    results = {}
+    for name, bench in BENCHMARKS.items():
+        if names and name not in names:
+            continue
+        value = bench.func(ctx)
+        if value is None:
+            print(f"  {name:24s} skipped")
+            continue
+        results[name] = {"value": value, "unit": bench.unit, "higher_is_better": bench.higher_is_better}
+        print(f"  {name:24s} {value:14.6g} {bench.unit}")
+    return {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "duration": ctx.duration,
+            "repeat": ctx.repeat,
+        },
+        "results": results,
+    }
+
+
+def compare(current: dict, baseline: dict, threshold: float) -> List[str]:
+    """Prints a comparison table and returns the names of regressed benchmarks."""
+    regressions = []
+    print(f"\n{'benchmark':24s} {'baseline':>14s} {'current':>14s} {'change':>9s}")
+    for name, result in current["results"].items():
+        base = baseline.get("results", {}).get(name)
+        if not base or not base["value"]:
+            continue
+        ratio = result["value"] / base["value"]
+        # Speed-up ratio: > 1 is better for both "higher" and "lower is better" metrics
+        speedup = ratio if result["higher_is_better"] else 1 / ratio
+        flag = ""
+        if speedup < 1 - threshold:
+            regressions.append(name)
+            flag = "  REGRESSION"
+        print(f"{name:24s} {base['value']:14.6g} {result['value']:14.6g} {speedup - 1:+8.1%}{flag}")
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m euchre.bench", description=__doc__.split("\n\n")[0])
+    parser.add_argument("--output", help="write results as JSON to this path")
+    parser.add_argument("--baseline", default=None, help=f"baseline JSON to compare against (default: {DEFAULT_BASELINE} if it exists)")
+    parser.add_argument("--save-baseline", metavar="PATH", help="write results as the new baseline")
+    parser.add_argument("--threshold", type=float, default=0.15, help="allowed slowdown fraction before failing (default 0.15)")
+    parser.add_argument("--duration", type=float, default=1.0, help="seconds per timed round")
+    parser.add_argument("--repeat", type=int, default=3, help="timed rounds per benchmark (best is kept)")
+    parser.add_argument("--policy", default="cfr_policy.pkl", help="policy file for the CFRAgent load benchmark")
+    parser.add_argument("--only", nargs="+", choices=sorted(BENCHMARKS), help="run only these benchmarks")
+    args = parser.parse_args(argv)
+
+    ctx = BenchContext(duration=args.duration, repeat=args.repeat, policy_file=args.policy)
+    print("Running benchmarks...")
+    results = run_benchmarks(ctx, args.only)
+
+    for path in (args.output, args.save_baseline):
+        if path:
+            with open(path, "w") as f:
+                json.dump(results, f, indent=2)
+            print(f"Results written to {path}")
+
+    baseline_path = args.baseline
+    if baseline_path is None and os.path.exists(DEFAULT_BASELINE) and not args.save_baseline:
+        baseline_path = DEFAULT_BASELINE
+    if not baseline_path:
+        return 0
+
+    with open(baseline_path) as f:
+        baseline = json.load(f)
+    regressions = compare(results, baseline, args.threshold)
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) beyond {args.threshold:.0%}: {', '.join(regressions)}")
+        return 1
+    print(f"\nNo regressions beyond {args.threshold:.0%} against {baseline_path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
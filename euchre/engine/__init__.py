@@ -1,3 +1,5 @@
 from .card import Card, Deck, Suit, Rank
 from .state import EuchreGameState, GamePhase
-from .actions import get_valid_moves, resolve_trick
\ No newline at end of file
+from .actions import get_valid_moves, resolve_trick
+from .events import EventSink, NullSink, TextLogSink, ListSink, JsonlSink
+from .bitboard import BitboardGameState, cards_to_mask, mask_to_cards
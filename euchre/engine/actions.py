@@ -8,7 +8,7 @@ def get_valid_moves(hand: List[Card], current_trick: List[Tuple[int, Card]], tru
     """
     # If leading (first in trick), any card is valid
     if not current_trick:
-        return hand.copy()
+        return list(hand)
         
     # Determine the led suit (effective suit of the first card played)
     led_card = current_trick[0][1]
@@ -25,7 +25,7 @@ def get_valid_moves(hand: List[Card], current_trick: List[Tuple[int, Card]], tru
         return following_cards
     
     # Otherwise, you can play anything (slough or trump)
-    return hand.copy()
+    return list(hand)
 
 def resolve_trick(trick: List[Tuple[int, Card]], trump_suit: Optional[Suit]) -> int:
     """
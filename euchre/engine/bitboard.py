@@ -0,0 +1,189 @@
+"""
+Bitboard representation of Euchre hands and tricks.
+
+Each of the 24 cards owns one bit of an integer (suit-major, so the bits of
+a fresh, unshuffled Deck run 0..23). A hand is then a 24-bit mask, and the
+Left Bower rule is folded into per-trump suit masks that are built once at
+import. Legal moves become a single AND, trick resolution a table lookup
+(card.TRICK_VALUES, shared with Card.get_value).
+"""
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from .card import ALL_CARDS, NO_SUIT, TRICK_VALUES, Card, Rank, Suit
+from .state import EuchreGameState, GamePhase
+
+NUM_CARDS = len(ALL_CARDS)
+FULL_MASK = (1 << NUM_CARDS) - 1
+
+SUITS: Tuple[Suit, ...] = tuple(Suit)
+RANKS: Tuple[Rank, ...] = tuple(Rank)
+
+
+def suit_index(suit: Optional[Suit]) -> int:
+    """Maps a Suit (or None) to its row in the lookup tables."""
+    return NO_SUIT if suit is None else suit.ordinal
+
+
+def card_index(card: Card) -> int:
+    return card.ordinal
+
+
+def index_to_card(idx: int) -> Card:
+    return ALL_CARDS[idx]
+
+
+def cards_to_mask(cards: Iterable[Card]) -> int:
+    mask = 0
+    for card in cards:
+        mask |= 1 << card.ordinal
+    return mask
+
+
+def iter_bits(mask: int) -> Iterator[int]:
+    """Yields the card indices set in `mask`, lowest first."""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+def mask_to_cards(mask: int) -> List[Card]:
+    """Converts a mask back to a Card list (ordered by card index)."""
+    return [ALL_CARDS[i] for i in iter_bits(mask)]
+
+
+def _build_tables():
+    # EFFECTIVE_SUIT[trump][card] -> suit index the card follows as
+    # SUIT_MASKS[trump][suit] -> mask of cards whose effective suit is `suit`
+    effective, masks = [], []
+    for trump in list(SUITS) + [None]:
+        eff_row = [c.get_effective_suit(trump).ordinal for c in ALL_CARDS]
+        suit_row = [0] * len(SUITS)
+        for idx, s in enumerate(eff_row):
+            suit_row[s] |= 1 << idx
+        effective.append(tuple(eff_row))
+        masks.append(tuple(suit_row))
+    return tuple(effective), tuple(masks)
+
+
+EFFECTIVE_SUIT, SUIT_MASKS = _build_tables()
+
+
+def get_valid_moves_mask(hand: int, trick: List[Tuple[int, int]], trump: int) -> int:
+    """
+    Mask version of actions.get_valid_moves.
+    `trick` holds (player_idx, card_index) pairs, `trump` is a suit index.
+    """
+    if not trick:
+        return hand
+    led_suit = EFFECTIVE_SUIT[trump][trick[0][1]]
+    following = hand & SUIT_MASKS[trump][led_suit]
+    # Rule: If you can follow suit, you must.
+    return following or hand
+
+
+def resolve_trick_mask(trick: List[Tuple[int, int]], trump: int) -> int:
+    """Mask version of actions.resolve_trick. Returns the winner's player_idx."""
+    if not trick:
+        raise ValueError("Cannot resolve empty trick")
+
+    values = TRICK_VALUES[trump][EFFECTIVE_SUIT[trump][trick[0][1]]]
+    winner_idx, highest_val = -1, -1
+    for p_idx, idx in trick:
+        val = values[idx]
+        if val > highest_val:
+            highest_val = val
+            winner_idx = p_idx
+    return winner_idx
+
+
+class BitboardGameState(EuchreGameState):
+    """
+    EuchreGameState whose hands live in `hand_masks` instead of Card lists.
+
+    `hands` is kept as a read-only view (tuples ordered by card index) so
+    agents that want Card objects keep working; `play_card` indexes into that
+    view. The view is rebuilt on every access, so in-place edits couldn't
+    reach `hand_masks`: assign `hands` (or `hand_masks`) to change a hand.
+    Search code should use `valid_moves_mask` and `play_index` directly.
+
+    Assigning `hands` also records where each card sat in the assigned
+    lists, so the dealer's discard breaks ties in deal order exactly like
+    EuchreGameState.
+    """
+    __slots__ = ("hand_masks", "_deal_order")
+
+    @property
+    def hands(self) -> Tuple[Tuple[Card, ...], ...]:
+        return tuple(tuple(mask_to_cards(m)) for m in self.hand_masks)
+
+    @hands.setter
+    def hands(self, hands: List[List[Card]]):
+        self.hand_masks = [cards_to_mask(h) for h in hands]
+        order = [0] * NUM_CARDS
+        for hand in hands:
+            for pos, card in enumerate(hand):
+                order[card.ordinal] = pos
+        self._deal_order = order
+
+    def valid_moves_mask(self, player_idx: Optional[int] = None) -> int:
+        if player_idx is None:
+            player_idx = self.current_player_index
+        trick = [(p, c.ordinal) for p, c in self.current_trick]
+        return get_valid_moves_mask(self.hand_masks[player_idx], trick, suit_index(self.trump_suit))
+
+    def play_index(self, player_idx: int, idx: int):
+        """Plays the card with bit index `idx` (not its position in the hand)."""
+        if self.phase != GamePhase.PLAYING:
+            raise ValueError("Not in playing phase")
+        if player_idx != self.current_player_index:
+            raise ValueError(f"Not P{player_idx}'s turn")
+
+        self._place_card(player_idx, self._take_index(player_idx, idx))
+        self._deal_next_if_over()
+
+    def _take_card(self, player_idx: int, card_idx: int) -> Card:
+        hand_mask = self.hand_masks[player_idx]
+        for pos, idx in enumerate(iter_bits(hand_mask)):
+            if pos == card_idx:
+                return self._take_index(player_idx, idx)
+        raise IndexError(f"P{player_idx} has no card at position {card_idx}")
+
+    def _take_index(self, player_idx: int, idx: int) -> Card:
+        bit = 1 << idx
+        if not self.valid_moves_mask(player_idx) & bit:
+            raise ValueError(f"Illegal move: {ALL_CARDS[idx]}. Valid: {mask_to_cards(self.valid_moves_mask(player_idx))}")
+        self.hand_masks[player_idx] ^= bit
+        return ALL_CARDS[idx]
+
+    def _copy_hands(self, new: "BitboardGameState"):
+        new.hand_masks = self.hand_masks[:]
+        new._deal_order = self._deal_order  # replaced, never edited, by the setter
+
+    def _card_position(self, player_idx: int, card: Card) -> int:
+        bit = 1 << card.ordinal
+        hand_mask = self.hand_masks[player_idx]
+        if not hand_mask & bit:
+            raise ValueError(f"{card} is not in P{player_idx}'s hand")
+        return bin(hand_mask & (bit - 1)).count("1")
+
+    def _return_card(self, player_idx: int, card_idx: int, card: Card):
+        self.hand_masks[player_idx] |= 1 << card.ordinal
+
+    def _trick_winner(self) -> int:
+        trick = [(p, c.ordinal) for p, c in self.current_trick]
+        return resolve_trick_mask(trick, suit_index(self.trump_suit))
+
+    def _dealer_swap(self):
+        trump = suit_index(self.trump_suit)
+        up = self.up_card.ordinal
+        hand_mask = self.hand_masks[self.dealer_index] | (1 << up)
+        # Discard lowest value card; on ties the first dealt, with the up card
+        # last (EuchreGameState's stable sort of the hand plus the up card)
+        values = TRICK_VALUES[trump][NO_SUIT]
+        order = self._deal_order
+        discard = min(iter_bits(hand_mask), key=lambda i: (values[i], 5 if i == up else order[i]))
+        self.hand_masks[self.dealer_index] = hand_mask ^ (1 << discard)
+        self.tracker.discard = ALL_CARDS[discard]
+        if self.sink.enabled:
+            self.sink.emit("discard", player=self.dealer_index, card=self.tracker.discard)
@@ -0,0 +1,106 @@
+"""
+Suit-isomorphism canonicalization.
+
+Only colour matters to the rules (the Left Bower is the Jack of trump's
+colour), so relabelling suits with a permutation that keeps the colour
+pairs {HEARTS, DIAMONDS} and {CLUBS, SPADES} together maps every position
+to an equivalent one. There are 8 such permutations: swap within the red
+pair, swap within the black pair, and swap the two colours.
+
+A canonical form is the smallest image of a position under the
+permutations that send its trump (if any) to HEARTS, so positions that
+differ only by such a relabelling share one cache or table entry. The
+permutation used is returned as well, to map moves back.
+"""
+from functools import lru_cache
+from itertools import product
+from typing import Iterable, Optional, Sequence, Tuple
+
+from .card import ALL_CARDS, Card, Suit
+
+Permutation = Tuple[int, int, int, int]  # perm[suit ordinal] -> new suit ordinal
+
+_SUITS = tuple(Suit)
+_RANKS = 6
+_SUIT_BITS = (1 << _RANKS) - 1
+
+
+def _build_permutations() -> Tuple[Permutation, ...]:
+    perms = []
+    for swap_colours, swap_red, swap_black in product((False, True), repeat=3):
+        red = (1, 0) if swap_red else (0, 1)
+        black = (3, 2) if swap_black else (2, 3)
+        if swap_colours:
+            red, black = black, red
+        # Suit ordinals: HEARTS=0, DIAMONDS=1 (red), CLUBS=2, SPADES=3 (black)
+        perms.append((red[0], red[1], black[0], black[1]))
+    return tuple(perms)
+
+
+SUIT_PERMUTATIONS = _build_permutations()
+IDENTITY: Permutation = (0, 1, 2, 3)
+
+
+def inverse(perm: Permutation) -> Permutation:
+    inv = [0] * 4
+    for suit, image in enumerate(perm):
+        inv[image] = suit
+    return tuple(inv)
+
+
+def permute_mask(mask: int, perm: Permutation) -> int:
+    """Relabels the suits of a 24-bit card mask (6 rank bits per suit)."""
+    return (
+        (mask & _SUIT_BITS) << _RANKS * perm[0]
+        | (mask >> _RANKS & _SUIT_BITS) << _RANKS * perm[1]
+        | (mask >> 2 * _RANKS & _SUIT_BITS) << _RANKS * perm[2]
+        | (mask >> 3 * _RANKS & _SUIT_BITS) << _RANKS * perm[3]
+    )
+
+
+def permute_card(card: Card, perm: Permutation) -> Card:
+    return ALL_CARDS[perm[card.suit.ordinal] * _RANKS + card.rank.ordinal]
+
+
+def permute_suit(suit: Optional[Suit], perm: Permutation) -> Optional[Suit]:
+    return None if suit is None else _SUITS[perm[suit.ordinal]]
+
+
+@lru_cache(maxsize=None)
+def stabilizer(trump: Optional[int]) -> Tuple[Permutation, ...]:
+    """The permutations that send suit `trump` to HEARTS (all 8 without trump)."""
+    if trump is None:
+        return SUIT_PERMUTATIONS
+    return tuple(p for p in SUIT_PERMUTATIONS if p[trump] == 0)
+
+
+def canonicalize(masks: Sequence[int], trump: Optional[int] = None) -> Tuple[Tuple[int, ...], Permutation]:
+    """
+    Canonical form of a tuple of card masks (hands, played cards, ...) with
+    `trump` (a suit ordinal, or None) sent to HEARTS. Returns the canonical
+    masks and the permutation that produces them from `masks`.
+    """
+    best, best_perm = None, IDENTITY
+    for perm in stabilizer(trump):
+        image = tuple(permute_mask(m, perm) for m in masks)
+        if best is None or image < best:
+            best, best_perm = image, perm
+    return best, best_perm
+
+
+def canonical_hand(hand: Iterable[Card], up_card: Optional[Card] = None,
+                   trump: Optional[Suit] = None) -> Tuple[int, Optional[Card], Optional[Suit], Permutation]:
+    """
+    Canonical (hand mask, up-card, trump) for a bidding or playing context.
+    Trump, or else the up-card's suit, becomes HEARTS; ties between the
+    remaining relabellings are broken by the smallest (up-card, hand) image.
+    Returns those plus the permutation used (apply `inverse` to map back).
+    """
+    mask = 0
+    for card in hand:
+        mask |= 1 << card.ordinal
+    context = trump if trump is not None else (up_card.suit if up_card is not None else None)
+    up_mask = 0 if up_card is None else 1 << up_card.ordinal
+    (up_image, mask_image), perm = canonicalize((up_mask, mask), None if context is None else context.ordinal)
+    up_image = ALL_CARDS[up_image.bit_length() - 1] if up_card is not None else None
+    return mask_image, up_image, permute_suit(trump, perm), perm
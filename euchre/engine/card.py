@@ -1,6 +1,6 @@
 import random
 from enum import Enum
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import List, Optional, Tuple
 
 class Suit(Enum):
@@ -18,13 +18,7 @@ class Suit(Enum):
     @property
     def other_color_suit(self):
         """Returns the sister suit (e.g., Hearts <-> Diamonds)."""
-        pairs = {
-            Suit.HEARTS: Suit.DIAMONDS,
-            Suit.DIAMONDS: Suit.HEARTS,
-            Suit.CLUBS: Suit.SPADES,
-            Suit.SPADES: Suit.CLUBS
-        }
-        return pairs[self]
+        return self._sister
 
 class Rank(Enum):
     NINE = 9
@@ -34,10 +28,59 @@ class Rank(Enum):
     KING = 13
     ACE = 14
 
-@dataclass(frozen=True)
+# Stable integer ordinals, assigned once so hot paths index tuples instead of
+# hashing Enum members (Enum.__hash__ is a Python-level call).
+for _i, _s in enumerate(Suit):
+    _s.ordinal = _i
+for _i, _r in enumerate(Rank):
+    _r.ordinal = _i
+for _a, _b in ((Suit.HEARTS, Suit.DIAMONDS), (Suit.CLUBS, Suit.SPADES)):
+    _a._sister, _b._sister = _b, _a
+
+# Row used in the lookup tables when there is no trump / led suit
+NO_SUIT = len(Suit)
+
+_INTERNED = {}
+
+@dataclass(frozen=True, init=False)
 class Card:
+    """
+    A playing card. The 24 cards are interned: Card(rank, suit) always
+    returns the same object, so identity comparison and `ordinal` lookups
+    are safe everywhere.
+    """
     rank: Rank
     suit: Suit
+    ordinal: int = field(repr=False, compare=False)
+
+    def __new__(cls, rank: Rank, suit: Suit):
+        try:
+            return _INTERNED[rank, suit]
+        except KeyError:
+            pass
+        if not isinstance(rank, Rank) or not isinstance(suit, Suit):
+            raise ValueError(f"Invalid card: {rank!r} of {suit!r}")
+        card = object.__new__(cls)
+        object.__setattr__(card, "rank", rank)
+        object.__setattr__(card, "suit", suit)
+        object.__setattr__(card, "ordinal", suit.ordinal * len(Rank) + rank.ordinal)
+        _INTERNED[rank, suit] = card
+        return card
+
+    def __eq__(self, other):
+        return self is other
+
+    def __hash__(self):
+        return self.ordinal
+
+    def __reduce__(self):
+        return (Card, (self.rank, self.suit))
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
 
     def __repr__(self):
         return f"{self.rank.name.title()}{self.suit.value}"
@@ -48,47 +91,71 @@ class Card:
         """
         if trump_suit is None:
             return self.suit
-        
-        # Check for Left Bower (Jack of the other color suit)
-        if self.rank == Rank.JACK and self.suit == trump_suit.other_color_suit:
-            return trump_suit
-        
-        return self.suit
+        return EFFECTIVE_SUITS[trump_suit.ordinal][self.ordinal]
 
     def get_value(self, trump_suit: Optional[Suit], led_suit: Optional[Suit]) -> int:
         """
         Returns a comparable integer for determining trick winner.
         """
-        if trump_suit is None:
-            return self.rank.value if self.suit == led_suit else 0
+        t = NO_SUIT if trump_suit is None else trump_suit.ordinal
+        l = NO_SUIT if led_suit is None else led_suit.ordinal
+        return TRICK_VALUES[t][l][self.ordinal]
+
+# All 24 cards in ordinal order (the order of a fresh, unshuffled Deck)
+ALL_CARDS: Tuple[Card, ...] = tuple(Card(r, s) for s in Suit for r in Rank)
+
+def _effective_suit(card: Card, trump_suit: Optional[Suit]) -> Suit:
+    if trump_suit is None:
+        return card.suit
+    # Check for Left Bower (Jack of the other color suit)
+    if card.rank == Rank.JACK and card.suit == trump_suit.other_color_suit:
+        return trump_suit
+    return card.suit
+
+def _trick_value(card: Card, trump_suit: Optional[Suit], led_suit: Optional[Suit]) -> int:
+    if trump_suit is None:
+        return card.rank.value if card.suit == led_suit else 0
+
+    effective_suit = _effective_suit(card, trump_suit)
+
+    # 1. Trump Logic
+    if effective_suit == trump_suit:
+        base = 100
+        # Right Bower
+        if card.rank == Rank.JACK and card.suit == trump_suit:
+            return base + 20 
+        # Left Bower
+        if card.rank == Rank.JACK and card.suit == trump_suit.other_color_suit:
+            return base + 15
+        # Regular Trumps
+        return base + card.rank.value
 
-        effective_suit = self.get_effective_suit(trump_suit)
+    # 2. Led Suit Logic
+    if effective_suit == led_suit:
+        return card.rank.value
 
-        # 1. Trump Logic
-        if effective_suit == trump_suit:
-            base = 100
-            # Right Bower
-            if self.rank == Rank.JACK and self.suit == trump_suit:
-                return base + 20 
-            # Left Bower
-            if self.rank == Rank.JACK and self.suit == trump_suit.other_color_suit:
-                return base + 15
-            # Regular Trumps
-            return base + self.rank.value
+    # 3. Off-suit
+    return 0
 
-        # 2. Led Suit Logic
-        if effective_suit == led_suit:
-            return self.rank.value
+_SUITS_OR_NONE = list(Suit) + [None]
 
-        # 3. Off-suit
-        return 0
+# EFFECTIVE_SUITS[trump][card] and TRICK_VALUES[trump][led][card], indexed by
+# ordinal (NO_SUIT for None). Built once at import.
+EFFECTIVE_SUITS = tuple(
+    tuple(_effective_suit(c, trump) for c in ALL_CARDS) for trump in Suit
+)
+TRICK_VALUES = tuple(
+    tuple(tuple(_trick_value(c, trump, led) for c in ALL_CARDS) for led in _SUITS_OR_NONE)
+    for trump in _SUITS_OR_NONE
+)
 
 class Deck:
     def __init__(self):
-        self.cards = [Card(r, s) for s in Suit for r in Rank]
+        self.cards = list(ALL_CARDS)
     
-    def shuffle(self):
-        random.shuffle(self.cards)
+    def shuffle(self, rng: Optional[random.Random] = None):
+        """Shuffles with `rng` (a random.Random) or the global random module."""
+        (rng or random).shuffle(self.cards)
     
     def deal(self) -> Tuple[List[List[Card]], List[Card]]:
         if len(self.cards) != 24:
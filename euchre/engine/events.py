@@ -0,0 +1,104 @@
+"""
+Event sinks for EuchreGameState.
+
+The state machine reports what happens (deals, bids, plays, tricks, scores)
+to a sink instead of printing. The default NullSink is disabled, and the
+state checks `sink.enabled` before building an event, so search and
+training pay nothing for it.
+"""
+import json
+import sys
+from abc import ABC, abstractmethod
+from enum import Enum
+from typing import Any, Dict, List, Optional, TextIO
+
+
+class EventSink(ABC):
+    """Base class: receives (event name, payload) pairs from the game state."""
+    enabled = True
+
+    @abstractmethod
+    def emit(self, event: str, **data):
+        pass
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class NullSink(EventSink):
+    """Discards everything. Shared default for all game states."""
+    enabled = False
+
+    def emit(self, event: str, **data):
+        pass
+
+
+NULL_SINK = NullSink()
+
+
+class TextLogSink(EventSink):
+    """Human-readable log, matching the engine's old print() output."""
+    FORMATS = {
+        "new_hand": "\n--- New Hand! Dealer: P{dealer}, Up Card: {up_card} ---",
+        "order_up": "P{player} orders up {trump.name}",
+        "discard": "P{player} discards.",
+        "call_suit": "P{player} calls {trump.name}",
+        "pass": "P{player} passes",
+        "turn_down": "Up-card turned down.",
+        "redeal": "Stuck the dealer (or redeal). Restarting.",
+        "play": "P{player} plays {card}",
+        "trick": "P{winner} wins trick.",
+        "hand_over": "Hand Over. Score: {scores}",
+        "game_over": "GAME OVER",
+    }
+
+    def __init__(self, stream: Optional[TextIO] = None):
+        self.stream = stream
+
+    def emit(self, event: str, **data):
+        fmt = self.FORMATS.get(event)
+        line = fmt.format(**data) if fmt else f"{event}: {data}"
+        # Resolve stdout lazily so redirection (e.g. notebooks, pytest) still works
+        print(line, file=self.stream or sys.stdout)
+
+
+class ListSink(EventSink):
+    """Keeps every event in memory as a dict: {'event': name, **payload}."""
+
+    def __init__(self):
+        self.events: List[Dict[str, Any]] = []
+
+    def emit(self, event: str, **data):
+        data["event"] = event
+        self.events.append(data)
+
+    def of_type(self, event: str) -> List[Dict[str, Any]]:
+        return [e for e in self.events if e["event"] == event]
+
+
+def _json_default(obj):
+    if isinstance(obj, Enum):
+        return obj.name
+    return repr(obj)
+
+
+class JsonlSink(EventSink):
+    """Appends one JSON object per event to a file (Cards as e.g. 'Jack♣')."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, "a", encoding="utf-8")
+
+    def emit(self, event: str, **data):
+        data["event"] = event
+        self._file.write(json.dumps(data, default=_json_default, ensure_ascii=False) + "\n")
+
+    def close(self):
+        if not self._file.closed:
+            self._file.close()
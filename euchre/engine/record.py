@@ -0,0 +1,436 @@
+"""
+Compact game records and replay.
+
+A hand is stored as one mixed-radix integer, packed into HAND_BYTES (11)
+bytes. From least significant digit to most:
+
+    deal      which seat holds each card and which kitty card is turned up:
+              the 5-card subsets of seats 0-3 ranked in turn (combinatorial
+              number system), then the up-card among the 4 kitty cards
+    bid       BID_OUTCOMES (33) values: passed out, ordered up in round 1 by
+              seat k after the dealer (alone or not), or called in round 2
+              by seat k (one of the 3 legal suits, alone or not)
+    discard   the dealer's discard among its 6 cards (only when ordered up)
+    plays     each card played, as its index among the player's remaining
+              cards in ordinal order (radix = cards left in that hand)
+
+Seat order, dealer rotation and scores all follow from the rules, so a game
+is a 4-byte header (target score, first dealer, number of hands) plus
+11 bytes per hand. The deal is kept as a seat assignment rather than the
+full 24-card shuffle: card order inside a hand never changes the game.
+
+GameRecordSink builds records from a game's events, so any driver records
+by passing it as the sink (e.g. play_single_game(agents, sink=recorder)).
+GameReplay rebuilds the EuchreGameState before any action of any hand
+without running agents:
+
+    replay = GameReplay(record)
+    state = replay.state_at(hand=3, action=9)   # bids and plays count as actions
+"""
+import random
+import struct
+from dataclasses import dataclass, field
+from operator import attrgetter
+from typing import BinaryIO, Callable, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from .actions import resolve_trick
+from .card import ALL_CARDS, Card, Suit
+from .events import EventSink
+from .state import EuchreGameState
+
+HAND_BYTES = 11
+BID_OUTCOMES = 1 + 4 * 2 + 4 * 3 * 2
+FILE_MAGIC = b"EUCHREC1"
+
+_GAME_HEADER = struct.Struct("<BBH")
+_SUITS = tuple(Suit)
+_NUM_CARDS = len(ALL_CARDS)
+_ORDINAL = attrgetter("ordinal")
+
+# Binomial coefficients C(n, k) for n, k <= 24 (math.comb needs Python 3.8)
+_BINOM = [[1] + [0] * _NUM_CARDS]
+for _ in range(_NUM_CARDS):
+    _BINOM.append([1] + [a + b for a, b in zip(_BINOM[-1], _BINOM[-1][1:])])
+
+# Number of distinct deals: 5-card subsets for seats 0-3, then the up-card
+DEAL_COUNT = _BINOM[24][5] * _BINOM[19][5] * _BINOM[14][5] * _BINOM[9][5] * 4
+
+
+@dataclass
+class HandRecord:
+    """One hand: the deal, the bidding outcome and the cards in play order."""
+    dealer: int
+    hands: List[List[Card]]            # the four dealt hands (any order within a hand)
+    up_card: Card
+    maker: Optional[int] = None        # None: passed out (redeal)
+    trump: Optional[Suit] = None
+    bid_round: int = 1
+    alone: bool = False
+    discard: Optional[Card] = None     # set when the up-card was ordered up
+    plays: List[Card] = field(default_factory=list)
+
+    @property
+    def kitty(self) -> List[Card]:
+        dealt = {c for hand in self.hands for c in hand}
+        return [c for c in ALL_CARDS if c not in dealt]
+
+
+@dataclass
+class GameRecord:
+    target_score: int
+    first_dealer: int
+    hands: List[HandRecord]
+
+    def to_bytes(self) -> bytes:
+        return _GAME_HEADER.pack(self.target_score, self.first_dealer, len(self.hands)) + b"".join(
+            encode_hand(h) for h in self.hands
+        )
+
+    @classmethod
+    def from_bytes(cls, data: bytes, offset: int = 0) -> "GameRecord":
+        target, dealer, count = _GAME_HEADER.unpack_from(data, offset)
+        offset += _GAME_HEADER.size
+        hands = []
+        for i in range(count):
+            hands.append(decode_hand(data[offset:offset + HAND_BYTES], (dealer + i) % 4))
+            offset += HAND_BYTES
+        return cls(target, dealer, hands)
+
+    @property
+    def nbytes(self) -> int:
+        return _GAME_HEADER.size + HAND_BYTES * len(self.hands)
+
+
+# --- Deal ranking ---
+
+def _subset_rank(indices: Sequence[int]) -> int:
+    """Colex rank of a sorted index subset."""
+    return sum(_BINOM[idx][k + 1] for k, idx in enumerate(indices))
+
+
+def _subset_unrank(rank: int, size: int, n: int) -> List[int]:
+    indices = []
+    for k in range(size, 0, -1):
+        idx = k - 1
+        while idx + 1 < n and _BINOM[idx + 1][k] <= rank:
+            idx += 1
+        rank -= _BINOM[idx][k]
+        indices.append(idx)
+        n = idx
+    return indices[::-1]
+
+
+def _rank_deal(hands: Sequence[Sequence[Card]], up_card: Card) -> int:
+    remaining = list(range(_NUM_CARDS))
+    rank, radix = 0, 1
+    for hand in hands:
+        position = {card_idx: pos for pos, card_idx in enumerate(remaining)}
+        chosen = sorted(position[c.ordinal] for c in hand)
+        rank += _subset_rank(chosen) * radix
+        radix *= _BINOM[len(remaining)][5]
+        taken = set(chosen)
+        remaining = [c for pos, c in enumerate(remaining) if pos not in taken]
+    return rank + remaining.index(up_card.ordinal) * radix
+
+
+def _unrank_deal(rank: int) -> Tuple[List[List[Card]], Card]:
+    remaining = list(range(_NUM_CARDS))
+    hands = []
+    for _ in range(4):
+        rank, sub = divmod(rank, _BINOM[len(remaining)][5])
+        chosen = set(_subset_unrank(sub, 5, len(remaining)))
+        hands.append([ALL_CARDS[c] for pos, c in enumerate(remaining) if pos in chosen])
+        remaining = [c for pos, c in enumerate(remaining) if pos not in chosen]
+    return hands, ALL_CARDS[remaining[rank]]
+
+
+# --- Hand encoding ---
+
+def _bid_digit(hand: HandRecord) -> int:
+    if hand.maker is None:
+        return 0
+    k = (hand.maker - hand.dealer - 1) % 4
+    if hand.bid_round == 1:
+        return 1 + k * 2 + hand.alone
+    suits = [s for s in _SUITS if s != hand.up_card.suit]
+    return 9 + (k * 3 + suits.index(hand.trump)) * 2 + hand.alone
+
+
+def _apply_bid_digit(hand: HandRecord, digit: int):
+    if digit == 0:
+        return
+    if digit < 9:
+        k, alone = divmod(digit - 1, 2)
+        hand.bid_round, hand.trump = 1, hand.up_card.suit
+    else:
+        rest, alone = divmod(digit - 9, 2)
+        k, s = divmod(rest, 3)
+        hand.bid_round, hand.trump = 2, [t for t in _SUITS if t != hand.up_card.suit][s]
+    hand.maker, hand.alone = (hand.dealer + 1 + k) % 4, bool(alone)
+
+
+def _walk_plays(hand: HandRecord, choose: Callable[[int, List[Card]], Card]):
+    """
+    Steps through the play of a made hand without a game state: seats come
+    from the lead and trick-winner rules, and `choose(seat, cards)` picks
+    each card from the seat's remaining cards (in ordinal order).
+    """
+    remaining = [sorted(cards, key=_ORDINAL) for cards in hand.hands]
+    if hand.discard is not None:
+        dealer_cards = remaining[hand.dealer] + [hand.up_card]
+        dealer_cards.remove(hand.discard)
+        remaining[hand.dealer] = sorted(dealer_cards, key=_ORDINAL)
+    sitting_out = (hand.maker + 2) % 4 if hand.alone else None
+
+    def next_seat(seat: int) -> int:
+        seat = (seat + 1) % 4
+        return (seat + 1) % 4 if seat == sitting_out else seat
+
+    leader = next_seat(hand.dealer)
+    for _ in range(5):
+        trick, seat = [], leader
+        for _ in range(3 if hand.alone else 4):
+            cards = remaining[seat]
+            card = choose(seat, cards)
+            cards.remove(card)
+            trick.append((seat, card))
+            seat = next_seat(seat)
+        leader = resolve_trick(trick, hand.trump)
+
+
+def encode_hand(hand: HandRecord) -> bytes:
+    digits: List[Tuple[int, int]] = [(_rank_deal(hand.hands, hand.up_card), DEAL_COUNT), (_bid_digit(hand), BID_OUTCOMES)]
+    if hand.maker is not None:
+        if hand.bid_round == 1:
+            dealer_cards = sorted(hand.hands[hand.dealer] + [hand.up_card], key=_ORDINAL)
+            digits.append((dealer_cards.index(hand.discard), 6))
+        plays = iter(hand.plays)
+
+        def choose(seat: int, cards: List[Card]) -> Card:
+            card = next(plays)
+            digits.append((cards.index(card), len(cards)))
+            return card
+        _walk_plays(hand, choose)
+
+    value, scale = 0, 1
+    for digit, radix in digits:
+        value += digit * scale
+        scale *= radix
+    return value.to_bytes(HAND_BYTES, "little")
+
+
+def decode_hand(data: bytes, dealer: int) -> HandRecord:
+    value = int.from_bytes(data, "little")
+    value, deal = divmod(value, DEAL_COUNT)
+    hands, up_card = _unrank_deal(deal)
+    hand = HandRecord(dealer, hands, up_card)
+    value, bid = divmod(value, BID_OUTCOMES)
+    _apply_bid_digit(hand, bid)
+    if hand.maker is None:
+        return hand
+
+    if hand.bid_round == 1:
+        dealer_cards = sorted(hands[dealer] + [up_card], key=_ORDINAL)
+        value, idx = divmod(value, 6)
+        hand.discard = dealer_cards[idx]
+
+    def choose(seat: int, cards: List[Card]) -> Card:
+        nonlocal value
+        value, idx = divmod(value, len(cards))
+        hand.plays.append(cards[idx])
+        return cards[idx]
+    _walk_plays(hand, choose)
+    return hand
+
+
+# --- Replay ---
+
+class _RecordedDeals:
+    """
+    Stands in for the deal rng: each shuffle lays out the next recorded hand,
+    and once the record runs out `fallback` shuffles as usual.
+    """
+
+    def __init__(self, hands: Iterable[HandRecord], fallback=random):
+        self._hands = iter(hands)
+        self._fallback = fallback
+
+    def shuffle(self, cards: List[Card]):
+        hand = next(self._hands, None)
+        if hand is None:
+            self._fallback.shuffle(cards)
+        else:
+            cards[:] = _deck_order(hand)
+
+
+def _deck_order(hand: HandRecord) -> List[Card]:
+    """A deck that Deck.deal turns into `hand`'s deal (card i goes to seat i % 4)."""
+    hands = [sorted(cards, key=_ORDINAL) for cards in hand.hands]
+    if hand.discard is not None and hand.discard is not hand.up_card:
+        # EuchreGameState discards the first lowest-valued card in hand order
+        dealer = hands[hand.dealer]
+        dealer.remove(hand.discard)
+        dealer.insert(0, hand.discard)
+    deck = [hands[i % 4][i // 4] for i in range(20)]
+    kitty = [c for c in hand.kitty if c is not hand.up_card]
+    return deck + [hand.up_card] + kitty
+
+
+def _bid_actions(hand: HandRecord) -> int:
+    """Bidding actions in the hand: passes, plus the call if there was one."""
+    if hand.maker is None:
+        return 8
+    return (hand.bid_round - 1) * 4 + (hand.maker - hand.dealer - 1) % 4 + 1
+
+
+def _apply_bid(game: EuchreGameState, hand: HandRecord, i: int):
+    """Applies bidding action `i` of the hand: a pass, or the final call."""
+    if hand.maker is None or i < _bid_actions(hand) - 1:
+        game.pass_turn()
+    elif hand.bid_round == 1:
+        game.order_up(hand.maker, hand.alone)
+    else:
+        game.call_suit(hand.maker, hand.trump, hand.alone)
+
+
+def _apply_bids(game: EuchreGameState, hand: HandRecord, limit: Optional[int] = None):
+    total = _bid_actions(hand)
+    for i in range(total if limit is None else min(limit, total)):
+        _apply_bid(game, hand, i)
+
+
+class GameReplay:
+    """Rebuilds EuchreGameStates from a GameRecord."""
+
+    def __init__(self, record: GameRecord):
+        self.record = record
+
+    def actions_in_hand(self, hand: int) -> int:
+        h = self.record.hands[hand]
+        return _bid_actions(h) + len(h.plays)
+
+    def state_at(self, hand: int, action: int = 0, rng: Optional[random.Random] = None) -> EuchreGameState:
+        """
+        The state before action `action` (bids and plays, counted from 0) of
+        hand `hand`, with all earlier hands played and scored. `rng` becomes
+        the state's deal stream afterwards.
+        """
+        hands = self.record.hands
+        if not 0 <= hand < len(hands):
+            raise ValueError(f"Hand {hand} out of range (record has {len(hands)})")
+        if not 0 <= action <= self.actions_in_hand(hand):
+            raise ValueError(f"Action {action} out of range for hand {hand}")
+
+        rng = rng if rng is not None else random
+        game = EuchreGameState(target_score=self.record.target_score, rng=_RecordedDeals(hands, rng))
+        game.dealer_index = self.record.first_dealer
+        game.start_hand()
+        for h in hands[:hand]:
+            _apply_bids(game, h)
+            for card in h.plays:
+                p = game.current_player_index
+                game.play_card(p, game.hands[p].index(card))
+
+        h = hands[hand]
+        bids = _bid_actions(h)
+        _apply_bids(game, h, action)
+        for card in h.plays[:max(0, action - bids)]:
+            game.apply(card)
+        game.rng = rng
+        return game
+
+    def positions(self) -> Iterator[Tuple[int, int, EuchreGameState]]:
+        """
+        Walks the whole game once, yielding (hand, action, state) before every
+        action. The same state object is advanced after each yield, so
+        clone() it to keep a position.
+        """
+        hands = self.record.hands
+        game = EuchreGameState(target_score=self.record.target_score, rng=_RecordedDeals(hands))
+        game.dealer_index = self.record.first_dealer
+        game.start_hand()
+        for i, h in enumerate(hands):
+            bids = _bid_actions(h)
+            for action in range(bids):
+                yield i, action, game
+                _apply_bid(game, h, action)
+            for j, card in enumerate(h.plays):
+                yield i, bids + j, game
+                p = game.current_player_index
+                game.play_card(p, game.hands[p].index(card))
+
+    def final_scores(self) -> List[int]:
+        last = len(self.record.hands) - 1
+        return self.state_at(last, self.actions_in_hand(last)).team_scores
+
+
+# --- Recording ---
+
+class GameRecordSink(EventSink):
+    """
+    Collects GameRecords from the event stream of one or more games (a new
+    game starts with the first hand after a game_over). `games` holds the
+    finished games; an unfinished game can be taken with `current()`.
+    The target score comes from the game's new_hand events.
+    """
+
+    def __init__(self):
+        self.target_score: Optional[int] = None
+        self.games: List[GameRecord] = []
+        self._hands: List[HandRecord] = []
+        self._hand: Optional[HandRecord] = None
+
+    def emit(self, event: str, **data):
+        hand = self._hand
+        if event == "new_hand":
+            self.target_score = data["target_score"]
+            self._hand = HandRecord(data["dealer"], [sorted(h, key=_ORDINAL) for h in data["hands"]], data["up_card"])
+        elif event in ("order_up", "call_suit"):
+            hand.maker, hand.trump, hand.alone = data["player"], data["trump"], data["alone"]
+            hand.bid_round = 1 if event == "order_up" else 2
+        elif event == "discard":
+            hand.discard = data["card"]
+        elif event == "play":
+            hand.plays.append(data["card"])
+        elif event in ("hand_over", "redeal"):
+            self._hands.append(hand)
+            self._hand = None
+        if event == "game_over":
+            self.games.append(self.current())
+            self._hands = []
+
+    def current(self) -> Optional[GameRecord]:
+        """Completed hands of the game in progress (None before the first deal)."""
+        if not self._hands:
+            return None
+        return GameRecord(self.target_score, self._hands[0].dealer, self._hands[:])
+
+
+# --- Archives ---
+
+def write_games(f: BinaryIO, games: Iterable[GameRecord]) -> int:
+    """Writes games to an open binary file (magic first if it's empty); returns bytes written."""
+    written = 0
+    if f.tell() == 0:
+        written += f.write(FILE_MAGIC)
+    for game in games:
+        written += f.write(game.to_bytes())
+    return written
+
+
+def read_games(path: str) -> Iterator[GameRecord]:
+    """Streams the games of an archive written by write_games, reading one game at a time."""
+    with open(path, "rb") as f:
+        if f.read(len(FILE_MAGIC)) != FILE_MAGIC:
+            raise ValueError(f"{path} is not a game record archive")
+        while True:
+            header = f.read(_GAME_HEADER.size)
+            if not header:
+                return
+            if len(header) < _GAME_HEADER.size:
+                raise ValueError(f"{path} ends with a truncated game")
+            size = HAND_BYTES * _GAME_HEADER.unpack(header)[2]
+            body = f.read(size)
+            if len(body) < size:
+                raise ValueError(f"{path} ends with a truncated game")
+            yield GameRecord.from_bytes(header + body)
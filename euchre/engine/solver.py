@@ -0,0 +1,173 @@
+"""
+Exact double-dummy solver for the playing phase.
+
+With all four hands known, a Euchre hand has at most 20 plies, so it can be
+solved outright: plain minimax with alpha-beta inside a trick, and an
+exact, memoized value at every trick boundary, keyed by the four remaining
+hand masks and the leader. Team 0 maximizes its trick count, team 1
+minimizes it. Hands and tricks use the bitboard encoding, so legal moves
+and trick winners come from get_valid_moves_mask / resolve_trick_mask.
+
+Cards that are adjacent in their effective suit once the cards still in
+play are considered (e.g. K and Q when the A is gone, or both held by the
+same seat) are interchangeable, so the inner search tries one per run.
+"""
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from .bitboard import (
+    EFFECTIVE_SUIT, SUIT_MASKS, SUITS, cards_to_mask, get_valid_moves_mask, iter_bits, resolve_trick_mask, suit_index,
+)
+from .card import ALL_CARDS, NO_SUIT, TRICK_VALUES, Card
+
+
+def _build_suit_orders():
+    # SUIT_ORDER[trump] -> per effective suit, (bit, card index) pairs strongest first
+    orders = []
+    for trump in range(NO_SUIT + 1):
+        row = []
+        for suit in range(len(SUITS)):
+            cards = [i for i in range(len(ALL_CARDS)) if EFFECTIVE_SUIT[trump][i] == suit]
+            cards.sort(key=lambda i: -TRICK_VALUES[trump][suit][i])
+            row.append(tuple((1 << i, i) for i in cards))
+        orders.append(tuple(row))
+    return tuple(orders)
+
+
+SUIT_ORDER = _build_suit_orders()
+
+
+class DoubleDummySolver:
+    """
+    Solves positions for one trump suit (and loner, if any).
+
+    The trick-boundary cache only depends on the remaining cards, so one
+    solver can be kept for a whole hand and shared between determinized
+    worlds. It is cleared once it holds `max_entries` positions.
+    """
+
+    def __init__(self, trump: int, loner: Optional[int] = None, max_entries: int = 1_000_000):
+        self.trump = trump
+        self.suit_order = tuple(zip(SUIT_MASKS[trump], SUIT_ORDER[trump]))
+        self.sitting_out = None if loner is None else (loner + 2) % 4
+        self.trick_size = 3 if loner is not None else 4
+        self.max_entries = max_entries
+        self.cache: Dict[int, int] = {}
+        self.nodes = 0
+
+    @classmethod
+    def for_state(cls, state, **kwargs) -> "DoubleDummySolver":
+        loner = state.loner_player_index if state.is_loner else None
+        return cls(suit_index(state.trump_suit), loner, **kwargs)
+
+    def _next(self, player: int) -> int:
+        player = (player + 1) % 4
+        if player == self.sitting_out:
+            player = (player + 1) % 4
+        return player
+
+    def team0_tricks(self, hands: Sequence[int], trick: List[Tuple[int, int]], player: int) -> int:
+        """Tricks team 0 takes from here to the end of the hand (current trick included)."""
+        return self._search(tuple(hands), trick, player, -1, 6)
+
+    def card_values(self, hands: Sequence[int], trick: List[Tuple[int, int]], player: int) -> Dict[int, int]:
+        """
+        For each legal card index of `player`, the tricks `player`'s team
+        takes from here to the end of the hand with best play by everyone.
+        """
+        hands = tuple(hands)
+        remaining = bin(hands[player]).count("1")
+        values = {}
+        for idx in iter_bits(get_valid_moves_mask(hands[player], trick, self.trump)):
+            team0 = self._after(hands, trick, player, idx, -1, 6)
+            values[idx] = team0 if player % 2 == 0 else remaining - team0
+        return values
+
+    def _after(self, hands, trick, player, idx, alpha, beta) -> int:
+        """Team 0's tricks after `player` plays card `idx`."""
+        new_hands = list(hands)
+        new_hands[player] ^= 1 << idx
+        trick = trick + [(player, idx)]
+        if len(trick) < self.trick_size:
+            return self._search(tuple(new_hands), trick, self._next(player), alpha, beta)
+
+        winner = resolve_trick_mask(trick, self.trump)
+        won = 1 if winner % 2 == 0 else 0
+        if not new_hands[winner]:
+            return won
+        return won + self._boundary(tuple(new_hands), winner)
+
+    def _boundary(self, hands: Tuple[int, ...], leader: int) -> int:
+        key = hands[0] | hands[1] << 24 | hands[2] << 48 | hands[3] << 72 | leader << 96
+        value = self.cache.get(key)
+        if value is None:
+            # Full window, so the cached value is exact
+            value = self._search(hands, [], leader, -1, 6)
+            if len(self.cache) >= self.max_entries:
+                self.cache.clear()
+            self.cache[key] = value
+        return value
+
+    def _representatives(self, moves: int, in_play: int) -> List[int]:
+        """One card index per run of equivalent cards in `moves`."""
+        picks = []
+        for suit_mask, order in self.suit_order:
+            if not moves & suit_mask:
+                continue
+            in_run = False
+            for bit, idx in order:
+                if moves & bit:
+                    if not in_run:
+                        picks.append(idx)
+                        in_run = True
+                elif in_play & bit:
+                    in_run = False
+        return picks
+
+    def _search(self, hands, trick, player, alpha, beta) -> int:
+        self.nodes += 1
+        moves = get_valid_moves_mask(hands[player], trick, self.trump)
+        in_play = hands[0] | hands[1] | hands[2] | hands[3]
+        for _, idx in trick:
+            in_play |= 1 << idx
+        candidates = self._representatives(moves, in_play)
+        if player % 2 == 0:
+            # Team 0 can't take more than the tricks left
+            top = bin(hands[player]).count("1")
+            best = -1
+            for idx in candidates:
+                value = self._after(hands, trick, player, idx, alpha, beta)
+                if value > best:
+                    best = value
+                    if best == top:
+                        break
+                    if best > alpha:
+                        alpha = best
+                        if alpha >= beta:
+                            break
+        else:
+            best = 6
+            for idx in candidates:
+                value = self._after(hands, trick, player, idx, alpha, beta)
+                if value < best:
+                    best = value
+                    if best == 0:
+                        break
+                    if best < beta:
+                        beta = best
+                        if alpha >= beta:
+                            break
+        return best
+
+
+def solve(state, solver: Optional[DoubleDummySolver] = None) -> Dict[Card, int]:
+    """
+    Double-dummy values of the current player's legal cards in a playing-phase
+    EuchreGameState: tricks the player's team takes from the current trick on,
+    assuming everyone sees every hand and plays perfectly.
+    """
+    if solver is None:
+        solver = DoubleDummySolver.for_state(state)
+    hands = [cards_to_mask(h) for h in state.hands]
+    trick = [(p, c.ordinal) for p, c in state.current_trick]
+    values = solver.card_values(hands, trick, state.current_player_index)
+    return {ALL_CARDS[idx]: v for idx, v in values.items()}
@@ -1,9 +1,11 @@
+import random
 from enum import Enum, auto
 from typing import List, Optional, Tuple
-from dataclasses import dataclass, field
 
 from .card import Deck, Card, Suit
 from .actions import get_valid_moves, resolve_trick
+from .events import EventSink, NULL_SINK
+from .tracker import CardTracker
 
 class GamePhase(Enum):
     PRE_DEAL = auto()
@@ -14,8 +16,21 @@ class GamePhase(Enum):
     GAME_OVER = auto()
 
 class EuchreGameState:
-    def __init__(self, target_score=10):
+    # Slots keep clone() cheap and stop search code from growing ad-hoc attributes
+    __slots__ = (
+        "target_score", "team_scores", "dealer_index", "phase", "hands", "kitty",
+        "up_card", "trump_suit", "maker_team", "is_loner", "loner_player_index",
+        "current_player_index", "tricks_taken", "current_trick", "_undo_stack",
+        "sink", "rng", "tracker",
+    )
+
+    def __init__(self, target_score=10, sink: Optional[EventSink] = None,
+                 rng: Optional[random.Random] = None):
         self.target_score = target_score
+        # Deal stream: a seeded random.Random makes every shuffle reproducible
+        self.rng = rng if rng is not None else random
+        # Where game events go (see events.py). The default NullSink is free.
+        self.sink = sink if sink is not None else NULL_SINK
         self.team_scores = [0, 0]
         self.dealer_index = 0
         
@@ -33,31 +48,72 @@ class EuchreGameState:
         self.current_player_index = 0
         self.tricks_taken = [0, 0]
         self.current_trick: List[Tuple[int, Card]] = []
+        self._undo_stack: List[tuple] = []
+        # Public information about the hand in play (for determinization)
+        self.tracker = CardTracker()
+
+    def clone(self) -> "EuchreGameState":
+        """
+        Cheap copy for search. Lists are copied one level deep; Cards are
+        immutable singletons and are shared. The undo history is not copied,
+        and the clone is silent (NullSink) whatever the original logs to.
+        """
+        new = object.__new__(self.__class__)
+        new.sink = NULL_SINK
+        new.rng = self.rng
+        new.target_score = self.target_score
+        new.team_scores = self.team_scores[:]
+        new.dealer_index = self.dealer_index
+        new.phase = self.phase
+        self._copy_hands(new)
+        new.kitty = self.kitty[:]
+        new.up_card = self.up_card
+        new.trump_suit = self.trump_suit
+        new.maker_team = self.maker_team
+        new.is_loner = self.is_loner
+        new.loner_player_index = self.loner_player_index
+        new.current_player_index = self.current_player_index
+        new.tricks_taken = self.tricks_taken[:]
+        new.current_trick = self.current_trick[:]
+        new._undo_stack = []
+        new.tracker = self.tracker.clone()
+        return new
+
+    def _copy_hands(self, new: "EuchreGameState"):
+        new.hands = [hand[:] for hand in self.hands]
 
     def start_hand(self):
         deck = Deck()
-        deck.shuffle()
+        deck.shuffle(self.rng)
         self.hands, self.kitty = deck.deal()
         self.up_card = self.kitty[0]
         self.trump_suit = None
         self.maker_team = None
         self.is_loner = False
+        self.loner_player_index = None
         self.tricks_taken = [0, 0]
+        self.current_trick = []
+        self._undo_stack = []
+        self.tracker.reset(self.dealer_index, self.up_card)
         self.phase = GamePhase.BIDDING_ROUND_1
         self.current_player_index = (self.dealer_index + 1) % 4
-        print(f"\n--- New Hand! Dealer: P{self.dealer_index}, Up Card: {self.up_card} ---")
+        if self.sink.enabled:
+            self.sink.emit("new_hand", dealer=self.dealer_index, up_card=self.up_card,
+                           hands=[list(hand) for hand in self.hands], target_score=self.target_score)
 
     def order_up(self, player_idx: int, going_alone: bool = False):
         if self.phase != GamePhase.BIDDING_ROUND_1:
             raise ValueError("Not in Round 1")
         
         self.trump_suit = self.up_card.suit
+        self.tracker.picked_up = True
         self.maker_team = player_idx % 2
         self.is_loner = going_alone
         if going_alone:
             self.loner_player_index = player_idx
         
-        print(f"P{player_idx} orders up {self.trump_suit.name}")
+        if self.sink.enabled:
+            self.sink.emit("order_up", player=player_idx, trump=self.trump_suit, alone=going_alone)
         self._dealer_swap()
         self._start_playing_phase()
 
@@ -73,19 +129,24 @@ class EuchreGameState:
         if going_alone:
             self.loner_player_index = player_idx
 
-        print(f"P{player_idx} calls {suit.name}")
+        if self.sink.enabled:
+            self.sink.emit("call_suit", player=player_idx, trump=suit, alone=going_alone)
         self._start_playing_phase()
 
     def pass_turn(self):
-        print(f"P{self.current_player_index} passes")
+        if self.sink.enabled:
+            self.sink.emit("pass", player=self.current_player_index)
         self.current_player_index = (self.current_player_index + 1) % 4
         
         if self.current_player_index == (self.dealer_index + 1) % 4:
             if self.phase == GamePhase.BIDDING_ROUND_1:
                 self.phase = GamePhase.BIDDING_ROUND_2
-                print("Up-card turned down.")
+                self.tracker.picked_up = False
+                if self.sink.enabled:
+                    self.sink.emit("turn_down", up_card=self.up_card)
             else:
-                print("Stuck the dealer (or redeal). Restarting.")
+                if self.sink.enabled:
+                    self.sink.emit("redeal", dealer=self.dealer_index)
                 self.dealer_index = (self.dealer_index + 1) % 4
                 self.start_hand()
 
@@ -95,6 +156,59 @@ class EuchreGameState:
         if player_idx != self.current_player_index:
             raise ValueError(f"Not P{player_idx}'s turn")
 
+        card = self._take_card(player_idx, card_idx)
+        self._place_card(player_idx, card)
+        self._deal_next_if_over()
+
+    def _deal_next_if_over(self):
+        if self.phase == GamePhase.HAND_OVER:
+            self.dealer_index = (self.dealer_index + 1) % 4
+            self.start_hand()
+
+    # --- Search interface: apply/undo for the playing phase ---
+
+    def apply(self, card: Card):
+        """
+        Plays `card` for the current player and records how to take it back.
+        Unlike play_card, a finished hand is not redealt: the state stops in
+        HAND_OVER (or GAME_OVER) with tricks and score intact, so search code
+        can read the result and undo() back up the tree.
+        """
+        if self.phase != GamePhase.PLAYING:
+            raise ValueError("Not in playing phase")
+
+        player_idx = self.current_player_index
+        card_idx = self._card_position(player_idx, card)
+        trick = self.current_trick
+        self._take_card(player_idx, card_idx)
+        self._undo_stack.append((player_idx, card_idx, card, trick, self.tracker.voids[player_idx]))
+        self._place_card(player_idx, card)
+
+    def undo(self):
+        """Reverts the most recent apply()."""
+        player_idx, card_idx, card, trick, prev_voids = self._undo_stack.pop()
+
+        if self.phase != GamePhase.PLAYING:
+            team, points = self._hand_points()
+            self.team_scores[team] -= points
+            self.phase = GamePhase.PLAYING
+
+        if self.current_trick is not trick:
+            # This card completed the trick, so take the trick back too
+            self.current_trick = trick
+            self.tricks_taken[self._trick_winner() % 2] -= 1
+
+        trick.pop()
+        self.tracker.undo_play(player_idx, card, prev_voids)
+        self.current_player_index = player_idx
+        self._return_card(player_idx, card_idx, card)
+
+    @property
+    def undo_depth(self) -> int:
+        return len(self._undo_stack)
+
+    def _take_card(self, player_idx: int, card_idx: int) -> Card:
+        """Validates the move and removes the card from the player's hand."""
         hand = self.hands[player_idx]
         card = hand[card_idx]
         
@@ -104,21 +218,33 @@ class EuchreGameState:
             raise ValueError(f"Illegal move: {card}. Valid: {valid_moves}")
 
         hand.pop(card_idx)
+        return card
+
+    def _card_position(self, player_idx: int, card: Card) -> int:
+        return self.hands[player_idx].index(card)
+
+    def _return_card(self, player_idx: int, card_idx: int, card: Card):
+        self.hands[player_idx].insert(card_idx, card)
+
+    def _place_card(self, player_idx: int, card: Card):
         self.current_trick.append((player_idx, card))
-        print(f"P{player_idx} plays {card}")
+        self.tracker.record_play(player_idx, card, self.current_trick[0][1], self.trump_suit)
+        if self.sink.enabled:
+            self.sink.emit("play", player=player_idx, card=card)
 
-        if len(self.current_trick) == 4:
+        # Loner's partner sits out, so the trick is complete after 3 cards
+        if len(self.current_trick) == (3 if self.is_loner else 4):
             self._resolve_trick()
         else:
             self._advance_turn_playing()
 
     def _resolve_trick(self):
-        # USE ACTIONS.PY FOR LOGIC
-        winner_idx = resolve_trick(self.current_trick, self.trump_suit)
+        winner_idx = self._trick_winner()
         winning_team = winner_idx % 2
         
         self.tricks_taken[winning_team] += 1
-        print(f"P{winner_idx} wins trick.")
+        if self.sink.enabled:
+            self.sink.emit("trick", winner=winner_idx, tricks_taken=self.tricks_taken[:])
         
         self.current_trick = []
         if sum(self.tricks_taken) == 5:
@@ -126,17 +252,25 @@ class EuchreGameState:
         else:
             self.current_player_index = winner_idx
 
+    def _trick_winner(self) -> int:
+        # USE ACTIONS.PY FOR LOGIC
+        return resolve_trick(self.current_trick, self.trump_suit)
+
     def _dealer_swap(self):
         # Simplified swap logic
         dealer_hand = self.hands[self.dealer_index]
         dealer_hand.append(self.up_card)
         # Discard lowest value non-trump
         dealer_hand.sort(key=lambda c: c.get_value(self.trump_suit, None))
-        dealer_hand.pop(0)
+        self.tracker.discard = dealer_hand.pop(0)
+        if self.sink.enabled:
+            self.sink.emit("discard", player=self.dealer_index, card=self.tracker.discard)
 
     def _start_playing_phase(self):
         self.phase = GamePhase.PLAYING
-        self.current_player_index = (self.dealer_index + 1) % 4
+        # Step onto the dealer, then advance so the loner skip applies to the lead too
+        self.current_player_index = self.dealer_index
+        self._advance_turn_playing()
 
     def _advance_turn_playing(self):
         self.current_player_index = (self.current_player_index + 1) % 4
@@ -146,7 +280,8 @@ class EuchreGameState:
             if self.current_player_index == partner_idx:
                 self.current_player_index = (self.current_player_index + 1) % 4
 
-    def _score_hand(self):
+    def _hand_points(self) -> Tuple[int, int]:
+        """Returns (scoring team, points) for the finished hand."""
         maker_tricks = self.tricks_taken[self.maker_team]
         points = 0
         if maker_tricks == 5:
@@ -157,12 +292,17 @@ class EuchreGameState:
             points = 2 # Euchred
             
         winning_team = self.maker_team if maker_tricks >=3 else (1 - self.maker_team)
+        return winning_team, points
+
+    def _score_hand(self):
+        winning_team, points = self._hand_points()
         self.team_scores[winning_team] += points
         
-        print(f"Hand Over. Score: {self.team_scores}")
+        if self.sink.enabled:
+            self.sink.emit("hand_over", team=winning_team, points=points, scores=self.team_scores[:])
         if max(self.team_scores) >= self.target_score:
             self.phase = GamePhase.GAME_OVER
-            print("GAME OVER")
+            if self.sink.enabled:
+                self.sink.emit("game_over", scores=self.team_scores[:])
         else:
-            self.dealer_index = (self.dealer_index + 1) % 4
-            self.start_hand()
\ No newline at end of file
+            self.phase = GamePhase.HAND_OVER
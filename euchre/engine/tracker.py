@@ -0,0 +1,182 @@
+"""
+Public-information card tracker and hidden-hand sampling.
+
+EuchreGameState keeps a CardTracker up to date as the hand is played: which
+cards are gone, where the up-card went, and which effective suits each seat
+has shown out of (a failure to follow suit). From that, `sample_hands`
+deals the cards a given seat cannot see uniformly over every assignment
+consistent with what that seat knows, without rejection: a small counting
+DP over (effective suit group x recipient) tables picks how many cards of
+each group every seat gets, then the cards themselves are shuffled in.
+"""
+import random
+from bisect import bisect_right
+from functools import lru_cache
+from math import factorial
+from typing import List, Optional, Sequence, Tuple
+
+from .card import ALL_CARDS, Card, Suit
+from .zobrist import Z_PLAYED
+
+
+class CardTracker:
+    __slots__ = ("dealer", "up_card", "picked_up", "discard", "played", "voids", "plays", "key")
+
+    def __init__(self):
+        self.reset(0, None)
+
+    def reset(self, dealer: int, up_card: Optional[Card]):
+        self.dealer = dealer
+        self.up_card = up_card
+        # None while round 1 is open, then True (dealer took it) / False (turned down)
+        self.picked_up: Optional[bool] = None
+        self.discard: Optional[Card] = None   # only the dealer can see this
+        self.played = 0                       # mask of card ordinals played this hand
+        self.voids = [0, 0, 0, 0]             # per seat: bit s = void in effective suit s
+        self.plays: List[Tuple[int, Card]] = []
+        self.key = 0                          # Zobrist hash of (seat, card) plays
+
+    def clone(self) -> "CardTracker":
+        new = object.__new__(CardTracker)
+        new.dealer = self.dealer
+        new.up_card = self.up_card
+        new.picked_up = self.picked_up
+        new.discard = self.discard
+        new.played = self.played
+        new.voids = self.voids[:]
+        new.plays = self.plays[:]
+        new.key = self.key
+        return new
+
+    def record_play(self, player_idx: int, card: Card, led_card: Card, trump_suit: Optional[Suit]):
+        self.played |= 1 << card.ordinal
+        self.plays.append((player_idx, card))
+        self.key ^= Z_PLAYED[player_idx][card.ordinal]
+        led_suit = led_card.get_effective_suit(trump_suit)
+        if card.get_effective_suit(trump_suit) != led_suit:
+            self.voids[player_idx] |= 1 << led_suit.ordinal
+
+    def undo_play(self, player_idx: int, card: Card, prev_voids: int):
+        self.played &= ~(1 << card.ordinal)
+        self.plays.pop()
+        self.key ^= Z_PLAYED[player_idx][card.ordinal]
+        self.voids[player_idx] = prev_voids
+
+    def is_void(self, player_idx: int, suit: Suit) -> bool:
+        return bool(self.voids[player_idx] >> suit.ordinal & 1)
+
+    def sample_hands(self, hands: Sequence[Sequence[Card]], perspective: int, trump_suit: Optional[Suit],
+                     rng=random) -> List[List[Card]]:
+        """
+        Returns new hands for all four seats: `perspective` keeps its own,
+        the others are dealt uniformly from the worlds consistent with what
+        `perspective` has seen. `hands` supplies the current hand sizes.
+        """
+        own = hands[perspective]
+        known_out = self.played
+        for card in own:
+            known_out |= 1 << card.ordinal
+
+        fixed: List[List[Card]] = [[] for _ in range(4)]
+        if self.up_card is not None and self.picked_up is not None:
+            up_bit = 1 << self.up_card.ordinal
+            known_out |= up_bit
+            # Everyone saw the dealer take the up-card; it's still there unless played
+            if self.picked_up and perspective != self.dealer and not self.played & up_bit:
+                fixed[self.dealer].append(self.up_card)
+        if perspective == self.dealer and self.discard is not None:
+            known_out |= 1 << self.discard.ordinal
+
+        # Recipients: the three other seats, then the unseen rest of the kitty
+        seats = [s for s in range(4) if s != perspective]
+        caps = [len(hands[s]) - len(fixed[s]) for s in seats]
+        unknown = [c for c in ALL_CARDS if not known_out >> c.ordinal & 1]
+        caps.append(len(unknown) - sum(caps))
+
+        groups: List[List[Card]] = [[] for _ in range(len(Suit))]
+        for card in unknown:
+            groups[card.get_effective_suit(trump_suit).ordinal].append(card)
+        groups = [g for g in groups if g]
+        allowed = tuple(
+            tuple([not self.voids[s] >> g[0].get_effective_suit(trump_suit).ordinal & 1 for s in seats] + [True])
+            for g in groups
+        )
+
+        counts = _sample_counts(tuple(len(g) for g in groups), allowed, tuple(caps), rng)
+
+        new_hands = [list(h) for h in hands]
+        for s in seats:
+            new_hands[s] = fixed[s][:]
+        for group, row in zip(groups, counts):
+            rng.shuffle(group)
+            pos = 0
+            for r, n in enumerate(row[:-1]):
+                new_hands[seats[r]].extend(group[pos:pos + n])
+                pos += n
+        return new_hands
+
+
+def _distributions(k: int, allowed: Tuple[bool, ...], caps: Tuple[int, ...]):
+    """All ways to split k cards over recipients, honouring voids and capacities."""
+    if not caps:
+        if k == 0:
+            yield ()
+        return
+    top = min(k, caps[0]) if allowed[0] else 0
+    for n in range(top + 1):
+        for rest in _distributions(k - n, allowed[1:], caps[1:]):
+            yield (n,) + rest
+
+
+def _ways(k: int, split: Tuple[int, ...]) -> int:
+    # Multinomial: which of the k (distinct) cards go to which recipient
+    result = factorial(k)
+    for n in split:
+        result //= factorial(n)
+    return result
+
+
+@lru_cache(maxsize=4096)
+def _count(sizes: Tuple[int, ...], allowed: tuple, caps: Tuple[int, ...]) -> int:
+    """Number of consistent deals of the remaining groups into `caps`."""
+    if not sizes:
+        return 1 if not any(caps) else 0
+    return sum(_choices(sizes, allowed, caps)[1])
+
+
+@lru_cache(maxsize=4096)
+def _choices(sizes: Tuple[int, ...], allowed: tuple, caps: Tuple[int, ...]):
+    """Splits of the first group and the number of full deals each one leads to."""
+    splits, weights = [], []
+    for split in _distributions(sizes[0], allowed[0], caps):
+        rest = tuple(c - n for c, n in zip(caps, split))
+        weight = _ways(sizes[0], split) * _count(sizes[1:], allowed[1:], rest)
+        if weight:
+            splits.append(split)
+            weights.append(weight)
+    return splits, weights
+
+
+@lru_cache(maxsize=4096)
+def _cumulative(sizes, allowed, caps):
+    splits, weights = _choices(sizes, allowed, caps)
+    cumulative, running = [], 0
+    for w in weights:
+        running += w
+        cumulative.append(running)
+    return splits, cumulative
+
+
+def _sample_counts(sizes, allowed, caps, rng) -> List[Tuple[int, ...]]:
+    """Per group, how many cards each recipient gets, drawn with the exact deal weights."""
+    rows = []
+    for g in range(len(sizes)):
+        splits, cumulative = _cumulative(sizes[g:], allowed[g:], caps)
+        if not splits:
+            raise ValueError("No deal is consistent with the tracked information")
+        # Python ints are exact, so scale the uniform draw onto the integer total
+        pick = bisect_right(cumulative, int(rng.random() * cumulative[-1]))
+        split = splits[min(pick, len(splits) - 1)]
+        rows.append(split)
+        caps = tuple(c - n for c, n in zip(caps, split))
+    return rows
@@ -0,0 +1,86 @@
+"""
+Zobrist hashing of playing-phase positions and a bounded transposition table.
+
+A position is keyed by what decides the rest of the hand: which seat has
+played which card (so, from a fixed observer, what every seat has left),
+the cards in the current trick, tricks taken per team, the seat leading the
+trick and trump. Two play orders that reach the same such position hash to
+the same 64-bit key. The played-card part is kept incrementally by the
+CardTracker; `position_key` adds the rest in a handful of XORs.
+"""
+import random
+from collections import OrderedDict
+from typing import Callable, Generic, Optional, TypeVar
+
+from .card import NO_SUIT
+
+_rng = random.Random(0x5EED_2B1D)
+
+
+def _keys(n: int):
+    return tuple(_rng.getrandbits(64) for _ in range(n))
+
+
+Z_PLAYED = tuple(_keys(24) for _ in range(4))   # [seat][card ordinal]
+Z_TRICK = _keys(24)                              # card is in the current trick
+Z_TAKEN = tuple(_keys(6) for _ in range(2))     # [team][tricks taken]
+Z_LEADER = _keys(4)
+Z_TRUMP = _keys(NO_SUIT + 1)
+
+
+def position_key(state) -> int:
+    """Zobrist key of a playing-phase EuchreGameState."""
+    trick = state.current_trick
+    key = state.tracker.key
+    for _, card in trick:
+        key ^= Z_TRICK[card.ordinal]
+    leader = trick[0][0] if trick else state.current_player_index
+    trump = NO_SUIT if state.trump_suit is None else state.trump_suit.ordinal
+    taken = state.tricks_taken
+    return key ^ Z_LEADER[leader] ^ Z_TRUMP[trump] ^ Z_TAKEN[0][taken[0]] ^ Z_TAKEN[1][taken[1]]
+
+
+V = TypeVar("V")
+
+
+class TranspositionTable(Generic[V]):
+    """
+    Key -> entry map holding at most `max_entries` entries, evicting the
+    least recently used. Evicted entries stay valid for whoever still
+    holds them; they just stop being shared.
+    """
+
+    def __init__(self, max_entries: int = 100_000):
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[int, V]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key: int) -> Optional[V]:
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def get_or_create(self, key: int, factory: Callable[[], V]) -> V:
+        entries = self._entries
+        entry = entries.get(key)
+        if entry is not None:
+            entries.move_to_end(key)
+            self.hits += 1
+            return entry
+        self.misses += 1
+        entry = entries[key] = factory()
+        if len(entries) > self.max_entries:
+            entries.popitem(last=False)
+        return entry
+
+    def clear(self):
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
@@ -0,0 +1,3 @@
+from .vector import VectorEuchreEnv, NUM_ACTIONS, PASS, ORDER_UP, CALL_SUIT, ORDER_UP_ALONE, CALL_SUIT_ALONE
+from .observation import OBS_SIZE, encode_observation, legal_action_mask
+from .game_env import EuchreEnv, BatchedEuchreEnv
@@ -0,0 +1,179 @@
+"""
+Gym-style reset/step environments around EuchreGameState.
+
+EuchreEnv runs one game. The learner controls every seat that has no
+entry in `opponents`; opponent seats are played through the Agent protocol
+inside step(), so each step returns at the learner's next decision (or at
+the end of the game). Observations and legal-action masks (see
+observation.py) are written into buffers allocated once, and reset()/step()
+return those same arrays: copy them if you keep them across steps.
+
+BatchedEuchreEnv holds many EuchreEnvs whose buffers are rows of single
+contiguous [num_envs, ...] arrays, and restarts finished games itself, like
+VectorEuchreEnv.
+"""
+import random
+from typing import Dict, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ..agents.base import Agent
+from ..engine.card import ALL_CARDS, Suit
+from ..engine.state import EuchreGameState, GamePhase
+from .observation import OBS_DTYPE, OBS_SIZE, encode_observation, legal_action_mask
+from .vector import CALL_SUIT, CALL_SUIT_ALONE, NUM_ACTIONS, NUM_SEATS, ORDER_UP, ORDER_UP_ALONE, PASS
+
+_SUITS = tuple(Suit)
+
+
+class EuchreEnv:
+    """
+    One game to `target_score`. Actions use the VectorEuchreEnv layout:
+    card ordinals 0..23, PASS, ORDER_UP, CALL_SUIT + suit, ORDER_UP_ALONE,
+    CALL_SUIT_ALONE + suit.
+
+    step() returns (observation, reward, terminated, truncated, info):
+    the observation is for the seat now to act, and the reward is the
+    points the acting seat's team gained minus those its opponents gained
+    from this action up to the learner's next decision. info holds
+    "seat" (the seat now to act), "action_mask" and "points" (per team).
+    """
+
+    def __init__(self, opponents: Optional[Mapping[int, Agent]] = None, target_score: int = 10,
+                 seed: Optional[int] = None, obs_out: Optional[np.ndarray] = None,
+                 mask_out: Optional[np.ndarray] = None):
+        self.opponents: Dict[int, Agent] = dict(opponents or {})
+        if any(seat not in range(NUM_SEATS) for seat in self.opponents):
+            raise ValueError(f"Opponent seats must be in 0..{NUM_SEATS - 1}")
+        if len(self.opponents) == NUM_SEATS:
+            raise ValueError("At least one seat must be left to the learner")
+        self.target_score = target_score
+        self.rng = random.Random(seed)
+        self.observation = obs_out if obs_out is not None else np.zeros(OBS_SIZE, dtype=OBS_DTYPE)
+        self.action_mask = mask_out if mask_out is not None else np.zeros(NUM_ACTIONS, dtype=bool)
+        if self.observation.shape != (OBS_SIZE,) or self.action_mask.shape != (NUM_ACTIONS,):
+            raise ValueError("Observation and mask buffers must have shapes (OBS_SIZE,) and (NUM_ACTIONS,)")
+        self._points = [0, 0]
+        self.info = {"seat": 0, "action_mask": self.action_mask, "points": self._points}
+        self.game: Optional[EuchreGameState] = None
+
+    def reset(self, seed: Optional[int] = None) -> Tuple[np.ndarray, dict]:
+        if seed is not None:
+            self.rng.seed(seed)
+        self.game = EuchreGameState(target_score=self.target_score, rng=self.rng)
+        self.game.start_hand()
+        self._points[0] = self._points[1] = 0
+        self._play_opponents()
+        self._observe()
+        return self.observation, self.info
+
+    def step(self, action: int) -> Tuple[np.ndarray, float, bool, bool, dict]:
+        game = self.game
+        if game is None or game.phase == GamePhase.GAME_OVER:
+            raise ValueError("Call reset() before stepping a finished or unstarted game")
+        action = int(action)
+        if not 0 <= action < NUM_ACTIONS or not self.action_mask[action]:
+            raise ValueError(f"Illegal action {action}")
+
+        seat = game.current_player_index
+        before = game.team_scores[:]
+        self._apply(seat, action)
+        self._play_opponents()
+
+        team = seat % 2
+        self._points[0] = game.team_scores[0] - before[0]
+        self._points[1] = game.team_scores[1] - before[1]
+        reward = float(self._points[team] - self._points[1 - team])
+        terminated = game.phase == GamePhase.GAME_OVER
+        self._observe()
+        return self.observation, reward, terminated, False, self.info
+
+    def _apply(self, seat: int, action: int):
+        game = self.game
+        if action < len(ALL_CARDS):
+            hand = game.hands[seat]
+            game.play_card(seat, hand.index(ALL_CARDS[action]))
+        elif action == PASS:
+            game.pass_turn()
+        elif action in (ORDER_UP, ORDER_UP_ALONE):
+            game.order_up(seat, going_alone=action == ORDER_UP_ALONE)
+        elif action >= CALL_SUIT_ALONE:
+            game.call_suit(seat, _SUITS[action - CALL_SUIT_ALONE], going_alone=True)
+        else:
+            game.call_suit(seat, _SUITS[action - CALL_SUIT])
+
+    def _play_opponents(self):
+        """Lets the opponent agents act until a learner seat is to move or the game ends."""
+        game = self.game
+        while game.phase != GamePhase.GAME_OVER and game.current_player_index in self.opponents:
+            seat = game.current_player_index
+            agent = self.opponents[seat]
+            if game.phase == GamePhase.BIDDING_ROUND_1:
+                if agent.pick_up_card(game):
+                    game.order_up(seat)
+                else:
+                    game.pass_turn()
+            elif game.phase == GamePhase.BIDDING_ROUND_2:
+                suit = agent.call_suit(game)
+                if suit:
+                    game.call_suit(seat, suit)
+                else:
+                    game.pass_turn()
+            else:
+                hand = game.hands[seat]
+                game.play_card(seat, hand.index(agent.play_card(game)))
+
+    def _observe(self):
+        game = self.game
+        seat = game.current_player_index
+        self.info["seat"] = seat
+        encode_observation(game, seat, self.observation)
+        legal_action_mask(game, self.action_mask)
+
+
+class BatchedEuchreEnv:
+    """
+    `num_envs` EuchreEnvs stepped together. observations [N, OBS_SIZE],
+    action_masks [N, NUM_ACTIONS], rewards, terminated and truncated [N] are
+    contiguous arrays reused by every step; a game that ends is restarted
+    in place, so its row already shows the new game (the terminal flag and
+    reward of the finished one are still reported for that step).
+    """
+
+    def __init__(self, num_envs: int, opponents: Optional[Mapping[int, Agent]] = None,
+                 target_score: int = 10, seed: Optional[int] = None):
+        if num_envs < 1:
+            raise ValueError("num_envs must be at least 1")
+        self.num_envs = num_envs
+        self.observations = np.zeros((num_envs, OBS_SIZE), dtype=OBS_DTYPE)
+        self.action_masks = np.zeros((num_envs, NUM_ACTIONS), dtype=bool)
+        self.rewards = np.zeros(num_envs, dtype=np.float32)
+        self.terminated = np.zeros(num_envs, dtype=bool)
+        self.truncated = np.zeros(num_envs, dtype=bool)
+        self.seats = np.zeros(num_envs, dtype=np.int64)
+        self.info = {"seat": self.seats, "action_mask": self.action_masks}
+        # Agents are shared by every table; they must not keep per-game state
+        self.envs = [
+            EuchreEnv(opponents, target_score, None if seed is None else seed + i,
+                      obs_out=self.observations[i], mask_out=self.action_masks[i])
+            for i in range(num_envs)
+        ]
+
+    def reset(self, seed: Optional[int] = None) -> Tuple[np.ndarray, dict]:
+        for i, env in enumerate(self.envs):
+            env.reset(None if seed is None else seed + i)
+            self.seats[i] = env.info["seat"]
+        return self.observations, self.info
+
+    def step(self, actions: Sequence[int]) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, dict]:
+        if len(actions) != self.num_envs:
+            raise ValueError(f"Expected {self.num_envs} actions, got {len(actions)}")
+        for i, env in enumerate(self.envs):
+            _, reward, terminated, truncated, _ = env.step(actions[i])
+            self.rewards[i] = reward
+            self.terminated[i] = terminated
+            self.truncated[i] = truncated
+            if terminated:
+                env.reset()
+            self.seats[i] = env.info["seat"]
+        return self.observations, self.rewards, self.terminated, self.truncated, self.info
@@ -0,0 +1,111 @@
+"""
+Fixed-size observation encoding of an EuchreGameState for one seat.
+
+An observation is a float32 vector of OBS_SIZE entries, laid out as:
+
+    OBS_HAND      24  own cards
+    OBS_UP_CARD   24  the turned-up card (one-hot)
+    OBS_PICKED_UP  2  up-card ordered up / turned down (both 0 while round 1 is open)
+    OBS_TRUMP      5  trump suit, or the last entry while bidding
+    OBS_TRICK     96  current trick: 24 cards per seat, seats relative to the observer
+    OBS_PLAYED    24  every card played this hand (current trick included)
+    OBS_SCORES     2  game score, own team then opponents, / target_score
+    OBS_TRICKS     2  tricks taken this hand, own team then opponents, / 5
+    OBS_SEAT       4  observer's absolute seat (one-hot)
+    OBS_DEALER     4  dealer, relative to the observer
+    OBS_MAKER      2  making team, own then opponents (both 0 while bidding)
+    OBS_LONER      4  seat going alone, relative to the observer
+    OBS_PHASE      3  round 1 bidding / round 2 bidding / playing
+
+"Relative" seats count clockwise from the observer (0 = self, 2 = partner).
+The encoder writes into a caller-supplied buffer with scalar stores only,
+so stepping an environment allocates no arrays. The legal-action mask uses
+the action layout shared with VectorEuchreEnv (see vector.py).
+"""
+import numpy as np
+
+from ..engine.actions import get_valid_moves
+from ..engine.bitboard import iter_bits
+from ..engine.card import Suit
+from ..engine.state import EuchreGameState, GamePhase
+from .vector import CALL_SUIT, CALL_SUIT_ALONE, NUM_CARDS, NUM_SEATS, ORDER_UP, ORDER_UP_ALONE, PASS
+
+OBS_HAND = 0
+OBS_UP_CARD = OBS_HAND + NUM_CARDS
+OBS_PICKED_UP = OBS_UP_CARD + NUM_CARDS
+OBS_TRUMP = OBS_PICKED_UP + 2
+OBS_TRICK = OBS_TRUMP + len(Suit) + 1
+OBS_PLAYED = OBS_TRICK + NUM_SEATS * NUM_CARDS
+OBS_SCORES = OBS_PLAYED + NUM_CARDS
+OBS_TRICKS = OBS_SCORES + 2
+OBS_SEAT = OBS_TRICKS + 2
+OBS_DEALER = OBS_SEAT + NUM_SEATS
+OBS_MAKER = OBS_DEALER + NUM_SEATS
+OBS_LONER = OBS_MAKER + 2
+OBS_PHASE = OBS_LONER + NUM_SEATS
+OBS_SIZE = OBS_PHASE + 3
+
+OBS_DTYPE = np.float32
+
+_PHASE_ROW = {
+    GamePhase.BIDDING_ROUND_1: 0,
+    GamePhase.BIDDING_ROUND_2: 1,
+    GamePhase.PLAYING: 2,
+}
+
+
+def encode_observation(state: EuchreGameState, seat: int, out: np.ndarray) -> np.ndarray:
+    """Writes `seat`'s view of `state` into `out` (float32, length OBS_SIZE) and returns it."""
+    out.fill(0.0)
+    team = seat % 2
+
+    for card in state.hands[seat]:
+        out[OBS_HAND + card.ordinal] = 1.0
+    if state.up_card is not None:
+        out[OBS_UP_CARD + state.up_card.ordinal] = 1.0
+    picked_up = state.tracker.picked_up
+    if picked_up is not None:
+        out[OBS_PICKED_UP + (0 if picked_up else 1)] = 1.0
+    out[OBS_TRUMP + (len(Suit) if state.trump_suit is None else state.trump_suit.ordinal)] = 1.0
+
+    for player, card in state.current_trick:
+        out[OBS_TRICK + (player - seat) % NUM_SEATS * NUM_CARDS + card.ordinal] = 1.0
+    for idx in iter_bits(state.tracker.played):
+        out[OBS_PLAYED + idx] = 1.0
+
+    target = state.target_score
+    out[OBS_SCORES] = state.team_scores[team] / target
+    out[OBS_SCORES + 1] = state.team_scores[1 - team] / target
+    out[OBS_TRICKS] = state.tricks_taken[team] / 5
+    out[OBS_TRICKS + 1] = state.tricks_taken[1 - team] / 5
+
+    out[OBS_SEAT + seat] = 1.0
+    out[OBS_DEALER + (state.dealer_index - seat) % NUM_SEATS] = 1.0
+    if state.maker_team is not None:
+        out[OBS_MAKER + (0 if state.maker_team == team else 1)] = 1.0
+    if state.loner_player_index is not None:
+        out[OBS_LONER + (state.loner_player_index - seat) % NUM_SEATS] = 1.0
+    phase = _PHASE_ROW.get(state.phase)
+    if phase is not None:
+        out[OBS_PHASE + phase] = 1.0
+    return out
+
+
+def legal_action_mask(state: EuchreGameState, out: np.ndarray) -> np.ndarray:
+    """Writes the legal actions of the seat to act into `out` (bool, length NUM_ACTIONS) and returns it."""
+    out.fill(False)
+    phase = state.phase
+    if phase == GamePhase.BIDDING_ROUND_1:
+        out[PASS] = out[ORDER_UP] = out[ORDER_UP_ALONE] = True
+    elif phase == GamePhase.BIDDING_ROUND_2:
+        out[PASS] = True
+        # Cannot call the turned-down suit
+        turned_down = state.up_card.suit.ordinal
+        for suit in range(len(Suit)):
+            if suit != turned_down:
+                out[CALL_SUIT + suit] = out[CALL_SUIT_ALONE + suit] = True
+    elif phase == GamePhase.PLAYING:
+        hand = state.hands[state.current_player_index]
+        for card in get_valid_moves(hand, state.current_trick, state.trump_suit):
+            out[card.ordinal] = True
+    return out
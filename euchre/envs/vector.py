@@ -0,0 +1,320 @@
+"""
+Vectorized Euchre: N independent tables stepped together with NumPy.
+
+Rules follow EuchreGameState / actions.py: Left Bower via the shared
+per-trump tables, round 1 order-up with the dealer swap, round 2 calls,
+a redeal (dealer rotates) when round 2 is passed out, loners skipping
+their partner, and the same scoring. The dealer discards its lowest-value
+card with ties going to the card dealt first (the up card counts as dealt
+last), exactly like EuchreGameState.
+
+Every table acts once per step() (the seat in `current`), and finished
+hands and games are redealt automatically, so a fixed-size batch can be
+stepped in a loop for rollouts or payoff estimates.
+"""
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ..engine.card import ALL_CARDS, EFFECTIVE_SUITS, NO_SUIT, TRICK_VALUES, Card, Suit
+
+NUM_CARDS = len(ALL_CARDS)
+NUM_SEATS = 4
+
+# --- Action layout (shared by all array-based environments) ---
+# 0..23 play the card with that ordinal
+PASS = NUM_CARDS
+ORDER_UP = PASS + 1
+CALL_SUIT = ORDER_UP + 1            # + suit ordinal
+ORDER_UP_ALONE = CALL_SUIT + len(Suit)
+CALL_SUIT_ALONE = ORDER_UP_ALONE + 1  # + suit ordinal
+NUM_ACTIONS = CALL_SUIT_ALONE + len(Suit)
+
+# --- Phases (array encoding of GamePhase for the states a table can be in) ---
+BIDDING_ROUND_1 = 0
+BIDDING_ROUND_2 = 1
+PLAYING = 2
+
+# EFF_SUIT[trump, card] and VALUES[trump, led, card]; row NO_SUIT means "none"
+EFF_SUIT = np.array(
+    [[s.ordinal for s in row] for row in EFFECTIVE_SUITS]
+    + [[c.suit.ordinal for c in ALL_CARDS]],
+    dtype=np.int8,
+)
+VALUES = np.array(TRICK_VALUES, dtype=np.int16)
+CARD_SUIT = np.array([c.suit.ordinal for c in ALL_CARDS], dtype=np.int8)
+
+_NOT_IN_HAND = np.iinfo(np.int16).max
+
+
+class VectorEuchreEnv:
+    """
+    `num_envs` Euchre tables held in arrays:
+
+        hands       bool  [N, 4, 24]  card ownership per seat
+        deal_pos    int   [N, 24]     position of each card in the hand it was dealt to
+        up_card     int   [N]         card ordinal turned up
+        dealer      int   [N]
+        current     int   [N]         seat to act
+        phase       int   [N]         BIDDING_ROUND_1 / BIDDING_ROUND_2 / PLAYING
+        trump       int   [N]         suit ordinal, NO_SUIT while bidding
+        maker_team  int   [N]         -1 while bidding
+        loner       int   [N]         seat going alone, -1 if none
+        trick       int   [N, 4]      card played by each seat this trick, -1 if none
+        tricks      int   [N, 2]      tricks taken per team this hand
+        scores      int   [N, 2]      game score per team
+    """
+
+    def __init__(self, num_envs: int, target_score: int = 10, seed: Optional[int] = None):
+        n = num_envs
+        self.num_envs = n
+        self.target_score = target_score
+        self.rng = np.random.default_rng(seed)
+        self._rows = np.arange(n)
+
+        self.hands = np.zeros((n, NUM_SEATS, NUM_CARDS), dtype=bool)
+        # Position of each card in the hand it was dealt to (breaks discard ties)
+        self.deal_pos = np.zeros((n, NUM_CARDS), dtype=np.int64)
+        self.kitty = np.zeros((n, NUM_CARDS - 20), dtype=np.int64)
+        self.up_card = np.zeros(n, dtype=np.int64)
+        self.dealer = np.zeros(n, dtype=np.int64)
+        self.current = np.zeros(n, dtype=np.int64)
+        self.phase = np.zeros(n, dtype=np.int8)
+        self.trump = np.full(n, NO_SUIT, dtype=np.int64)
+        self.maker_team = np.full(n, -1, dtype=np.int64)
+        self.loner = np.full(n, -1, dtype=np.int64)
+        self.trick = np.full((n, NUM_SEATS), -1, dtype=np.int64)
+        self.trick_len = np.zeros(n, dtype=np.int64)
+        self.led_suit = np.full(n, NO_SUIT, dtype=np.int64)
+        self.tricks = np.zeros((n, 2), dtype=np.int64)
+        self.scores = np.zeros((n, 2), dtype=np.int64)
+
+        self.reset()
+
+    # --- Dealing ---
+
+    def reset(self, seed: Optional[int] = None):
+        """Starts a new game on every table (dealer P0, scores 0-0)."""
+        if seed is not None:
+            self.rng = np.random.default_rng(seed)
+        self.scores[:] = 0
+        self.dealer[:] = 0
+        self._deal(self._rows)
+
+    def _deal(self, ids: np.ndarray):
+        if not len(ids):
+            return
+        # A random permutation per table, dealt like Deck.deal (card i -> seat i % 4)
+        perm = np.argsort(self.rng.random((len(ids), NUM_CARDS)), axis=1)
+        self.hands[ids] = False
+        seats = np.arange(20) % NUM_SEATS
+        self.hands[ids[:, None], seats[None, :], perm[:, :20]] = True
+        self.deal_pos[ids[:, None], perm[:, :20]] = np.arange(20) // NUM_SEATS
+        self.kitty[ids] = perm[:, 20:]
+        self.up_card[ids] = perm[:, 20]
+        self._new_hand(ids)
+
+    def _new_hand(self, ids: np.ndarray):
+        self.phase[ids] = BIDDING_ROUND_1
+        self.current[ids] = (self.dealer[ids] + 1) % NUM_SEATS
+        self.trump[ids] = NO_SUIT
+        self.maker_team[ids] = -1
+        self.loner[ids] = -1
+        self.trick[ids] = -1
+        self.trick_len[ids] = 0
+        self.led_suit[ids] = NO_SUIT
+        self.tricks[ids] = 0
+
+    def load_deal(self, env_idx: int, hands: Sequence[Sequence[Card]], kitty: Sequence[Card], dealer: int):
+        """Puts a specific deal (e.g. from EuchreGameState) on one table."""
+        ids = np.array([env_idx])
+        self.hands[env_idx] = False
+        for seat, hand in enumerate(hands):
+            self.hands[env_idx, seat, [c.ordinal for c in hand]] = True
+            self.deal_pos[env_idx, [c.ordinal for c in hand]] = np.arange(len(hand))
+        self.kitty[env_idx] = [c.ordinal for c in kitty]
+        self.up_card[env_idx] = kitty[0].ordinal
+        self.dealer[env_idx] = dealer
+        self._new_hand(ids)
+
+    # --- Legal moves ---
+
+    def legal_actions(self) -> np.ndarray:
+        """Bool mask [N, NUM_ACTIONS] of the legal actions for each table's current seat."""
+        legal = np.zeros((self.num_envs, NUM_ACTIONS), dtype=bool)
+
+        bid1 = self.phase == BIDDING_ROUND_1
+        legal[bid1, PASS] = True
+        legal[bid1, ORDER_UP] = True
+        legal[bid1, ORDER_UP_ALONE] = True
+
+        bid2 = np.flatnonzero(self.phase == BIDDING_ROUND_2)
+        legal[bid2, PASS] = True
+        # Cannot call the turned-down suit
+        callable_suits = np.arange(len(Suit))[None, :] != CARD_SUIT[self.up_card[bid2]][:, None]
+        legal[bid2, CALL_SUIT:CALL_SUIT + len(Suit)] = callable_suits
+        legal[bid2, CALL_SUIT_ALONE:CALL_SUIT_ALONE + len(Suit)] = callable_suits
+
+        play = np.flatnonzero(self.phase == PLAYING)
+        legal[play, :NUM_CARDS] = self._valid_cards(play)
+        return legal
+
+    def _valid_cards(self, ids: np.ndarray) -> np.ndarray:
+        hand = self.hands[ids, self.current[ids]]
+        following = hand & (EFF_SUIT[self.trump[ids]] == self.led_suit[ids][:, None])
+        # Must follow suit when leading is over and the hand can follow
+        must_follow = (self.trick_len[ids] > 0) & following.any(axis=1)
+        return np.where(must_follow[:, None], following, hand)
+
+    def sample_actions(self, legal: Optional[np.ndarray] = None) -> np.ndarray:
+        """Uniformly random legal action per table."""
+        if legal is None:
+            legal = self.legal_actions()
+        return np.argmax(self.rng.random(legal.shape, dtype=np.float32) * legal, axis=1)
+
+    # --- Stepping ---
+
+    def step(self, actions: np.ndarray, legal: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray, dict]:
+        """
+        Applies one action per table for its current seat. Pass the mask from
+        legal_actions() as `legal` to skip recomputing it for validation.
+
+        Returns (points [N, 2] scored this step per team, hand_done [N],
+        game_done [N], info). Finished hands are redealt with the next dealer
+        and finished games restart at 0-0; info["final_scores"] holds the
+        game scores as they stood before that reset.
+        """
+        actions = np.asarray(actions, dtype=np.int64)
+        if legal is None:
+            legal = self.legal_actions()
+        illegal = ~legal[self._rows, actions]
+        if illegal.any():
+            raise ValueError(f"Illegal actions on tables {np.flatnonzero(illegal).tolist()}")
+
+        points = np.zeros((self.num_envs, 2), dtype=np.int64)
+        hand_done = np.zeros(self.num_envs, dtype=bool)
+        game_done = np.zeros(self.num_envs, dtype=bool)
+        final_scores = self.scores.copy()
+
+        phase = self.phase.copy()
+        bidding = phase != PLAYING
+
+        self._pass(np.flatnonzero(bidding & (actions == PASS)), phase)
+
+        order = np.flatnonzero((phase == BIDDING_ROUND_1) & ((actions == ORDER_UP) | (actions == ORDER_UP_ALONE)))
+        self.trump[order] = CARD_SUIT[self.up_card[order]]
+        self._make(order, actions[order] == ORDER_UP_ALONE)
+        self._dealer_swap(order)
+        self._start_playing(order)
+
+        call = np.flatnonzero((phase == BIDDING_ROUND_2) & (actions != PASS))
+        alone = actions[call] >= CALL_SUIT_ALONE
+        self.trump[call] = np.where(alone, actions[call] - CALL_SUIT_ALONE, actions[call] - CALL_SUIT)
+        self._make(call, alone)
+        self._start_playing(call)
+
+        self._play(np.flatnonzero(phase == PLAYING), actions, points, hand_done, game_done, final_scores)
+
+        return points, hand_done, game_done, {"final_scores": final_scores}
+
+    def _pass(self, ids: np.ndarray, phase: np.ndarray):
+        self.current[ids] = (self.current[ids] + 1) % NUM_SEATS
+        wrapped = ids[self.current[ids] == (self.dealer[ids] + 1) % NUM_SEATS]
+        # Round 1 passed out: up-card turned down
+        self.phase[wrapped[phase[wrapped] == BIDDING_ROUND_1]] = BIDDING_ROUND_2
+        # Round 2 passed out: redeal with the next dealer
+        redeal = wrapped[phase[wrapped] == BIDDING_ROUND_2]
+        self.dealer[redeal] = (self.dealer[redeal] + 1) % NUM_SEATS
+        self._deal(redeal)
+
+    def _make(self, ids: np.ndarray, alone: np.ndarray):
+        self.maker_team[ids] = self.current[ids] % 2
+        self.loner[ids] = np.where(alone, self.current[ids], -1)
+
+    def _dealer_swap(self, ids: np.ndarray):
+        dealer = self.dealer[ids]
+        up = self.up_card[ids]
+        self.hands[ids, dealer, up] = True
+        # Discard lowest value card; on ties the first dealt, with the up card last
+        order = self.deal_pos[ids]
+        order[np.arange(len(ids)), up] = 5
+        keys = np.where(self.hands[ids, dealer], VALUES[self.trump[ids], NO_SUIT] * 8 + order, _NOT_IN_HAND)
+        self.hands[ids, dealer, keys.argmin(axis=1)] = False
+
+    def _start_playing(self, ids: np.ndarray):
+        self.phase[ids] = PLAYING
+        self.current[ids] = self._next_seat(ids, self.dealer[ids])
+
+    def _next_seat(self, ids: np.ndarray, seat: np.ndarray) -> np.ndarray:
+        seat = (seat + 1) % NUM_SEATS
+        # Loner Logic: Skip partner
+        loner = self.loner[ids]
+        skip = (loner >= 0) & (seat == (loner + 2) % NUM_SEATS)
+        return np.where(skip, (seat + 1) % NUM_SEATS, seat)
+
+    def _play(self, ids, actions, points, hand_done, game_done, final_scores):
+        cards = actions[ids]
+        seats = self.current[ids]
+        self.hands[ids, seats, cards] = False
+        self.trick[ids, seats] = cards
+
+        leading = self.trick_len[ids] == 0
+        self.led_suit[ids[leading]] = EFF_SUIT[self.trump[ids[leading]], cards[leading]]
+        self.trick_len[ids] += 1
+
+        trick_size = np.where(self.loner[ids] >= 0, 3, 4)
+        complete = self.trick_len[ids] == trick_size
+        ongoing = ids[~complete]
+        self.current[ongoing] = self._next_seat(ongoing, self.current[ongoing])
+
+        done = ids[complete]
+        trick = self.trick[done]
+        values = VALUES[self.trump[done][:, None], self.led_suit[done][:, None], trick]
+        winner = np.where(trick >= 0, values, -1).argmax(axis=1)
+        self.tricks[done, winner % 2] += 1
+        self.trick[done] = -1
+        self.trick_len[done] = 0
+        self.current[done] = winner
+
+        self._score_hands(done[self.tricks[done].sum(axis=1) == 5], points, hand_done, game_done, final_scores)
+
+    def _score_hands(self, ids, points, hand_done, game_done, final_scores):
+        maker = self.maker_team[ids]
+        maker_tricks = self.tricks[ids, maker]
+        pts = np.where(maker_tricks == 5, np.where(self.loner[ids] >= 0, 4, 2),
+                       np.where(maker_tricks >= 3, 1, 2))
+        team = np.where(maker_tricks >= 3, maker, 1 - maker)
+        self.scores[ids, team] += pts
+        points[ids, team] = pts
+        hand_done[ids] = True
+        final_scores[ids] = self.scores[ids]
+
+        over = self.scores[ids].max(axis=1) >= self.target_score
+        game_done[ids[over]] = True
+        # Finished games restart like a fresh EuchreGameState; others pass the deal
+        self.scores[ids[over]] = 0
+        self.dealer[ids[over]] = 0
+        self.dealer[ids[~over]] = (self.dealer[ids[~over]] + 1) % NUM_SEATS
+        self._deal(ids)
+
+    # --- Convenience ---
+
+    def play_random_hands(self, num_hands: int) -> np.ndarray:
+        """
+        Steps every table with uniformly random legal actions until
+        `num_hands` hands have finished in total. Returns the points per team
+        of every finished hand as an array [num_hands_finished, 2].
+        """
+        finished: List[np.ndarray] = []
+        total = 0
+        while total < num_hands:
+            legal = self.legal_actions()
+            points, hand_done, _, _ = self.step(self.sample_actions(legal), legal)
+            if hand_done.any():
+                finished.append(points[hand_done])
+                total += int(hand_done.sum())
+        return np.concatenate(finished)
+
+    def hand_cards(self, env_idx: int, seat: int) -> List[Card]:
+        """Card objects for one seat's hand (ordinal order)."""
+        return [ALL_CARDS[i] for i in np.flatnonzero(self.hands[env_idx, seat])]
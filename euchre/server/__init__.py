@@ -0,0 +1,3 @@
+from .adapters import AsyncAgent, InlineAgent, ExecutorAgent, RemoteAgent, ComputePool, async_agent
+from .tables import TableManager, ServerStats, play_table
+from .transport import LocalTransport, serve_agent
@@ -0,0 +1,191 @@
+"""
+Async agent adapters for served tables.
+
+Every seat at a served table is an AsyncAgent: `await agent.decide(game,
+decision)` answers one decision of the seat to act -- a bool for PICK_UP,
+a Suit or None for CALL_SUIT, a Card for PLAY -- and must not modify `game`.
+
+    InlineAgent     calls a synchronous Agent on the event loop; right for
+                    agents that answer in microseconds (Random, RuleBased)
+    ExecutorAgent   runs an AgentSpec's decisions on a shared ComputePool
+                    (MCTS, CFR, PIMC), so slow searches don't block the loop
+    RemoteAgent     forwards decisions over a transport (see transport.py)
+
+async_agent() picks InlineAgent or ExecutorAgent by agent kind.
+"""
+import asyncio
+import threading
+from abc import ABC, abstractmethod
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Any, Dict, Optional, Tuple, Union
+
+from ..agents import Agent
+from ..engine.state import EuchreGameState
+from ..utils.evaluator import AgentSpec
+
+PICK_UP = "pick_up"
+CALL_SUIT = "call_suit"
+PLAY = "play"
+
+# Agent kinds (AVAILABLE_AGENTS keys) that search or load policies per decision
+CPU_HEAVY_KINDS = frozenset({"MCTS", "CFR", "PIMC"})
+
+
+def decide(agent: Agent, game: EuchreGameState, decision: str) -> Any:
+    """Asks a synchronous Agent for one decision."""
+    if decision == PICK_UP:
+        return agent.pick_up_card(game)
+    if decision == CALL_SUIT:
+        return agent.call_suit(game)
+    if decision == PLAY:
+        return agent.play_card(game)
+    raise ValueError(f"Unknown decision: {decision}")
+
+
+def detached_state(game: EuchreGameState) -> EuchreGameState:
+    """
+    A copy of `game` that can leave the table: the table keeps playing (e.g.
+    after a missed deadline) while a worker still reads the copy, and it
+    pickles for process pools.
+    """
+    state = game.clone()
+    state.rng = None  # the module-level default can't be pickled; agents never deal
+    return state
+
+
+class AsyncAgent(ABC):
+    def __init__(self, name: str):
+        self.name = name
+
+    @abstractmethod
+    async def decide(self, game: EuchreGameState, decision: str) -> Any:
+        """Answer `decision` for game.current_player_index."""
+        pass
+
+
+class InlineAgent(AsyncAgent):
+    """A synchronous Agent run directly on the event loop."""
+
+    def __init__(self, agent: Agent):
+        super().__init__(agent.name)
+        self.agent = agent
+
+    async def decide(self, game: EuchreGameState, decision: str) -> Any:
+        return decide(self.agent, game, decision)
+
+
+class ComputePool:
+    """
+    A concurrent.futures executor shared by ExecutorAgents, with at most
+    `max_pending` decisions submitted at once (queued or running). Tables
+    past the limit wait on the event loop, so thousands of tables don't
+    pile an unbounded backlog into the executor. A slot is freed only when
+    the executor finishes the call, even if its table stopped waiting.
+    """
+
+    def __init__(self, executor: Optional[Executor] = None, max_pending: int = 64):
+        if max_pending < 1:
+            raise ValueError("max_pending must be at least 1")
+        self.executor = executor if executor is not None else ThreadPoolExecutor(max_workers=1)
+        self.max_pending = max_pending
+        self._slots: Optional[asyncio.Semaphore] = None
+
+    async def run(self, fn, *args) -> Any:
+        if self._slots is None:
+            # Created on first use, inside the running loop
+            self._slots = asyncio.Semaphore(self.max_pending)
+        slots = self._slots
+        await slots.acquire()
+        loop = asyncio.get_running_loop()
+        try:
+            future = self.executor.submit(fn, *args)
+        except BaseException:
+            slots.release()
+            raise
+
+        def release(_):
+            if not loop.is_closed():
+                loop.call_soon_threadsafe(slots.release)
+        future.add_done_callback(release)
+        return await asyncio.wrap_future(future)
+
+    def shutdown(self, wait: bool = True):
+        self.executor.shutdown(wait=wait)
+
+
+# Agents built inside executor workers, one set per thread (and so per process):
+# search agents keep per-hand state and must not be shared between threads
+_LOCAL = threading.local()
+
+
+def _spec_key(spec: AgentSpec) -> Tuple[str, str, str]:
+    return spec.kind, spec.name, repr(sorted(spec.kwargs.items()))
+
+
+def _decide_in_worker(spec: AgentSpec, game: EuchreGameState, decision: str) -> Any:
+    agents: Dict[Tuple[str, str, str], Agent] = getattr(_LOCAL, "agents", None)
+    if agents is None:
+        agents = _LOCAL.agents = {}
+    key = _spec_key(spec)
+    agent = agents.get(key)
+    if agent is None:
+        agent = agents[key] = spec.build()
+    return decide(agent, game, decision)
+
+
+class ExecutorAgent(AsyncAgent):
+    """
+    Runs an AgentSpec's decisions on a ComputePool. Each worker thread or
+    process builds its own agent from the spec on first use, so the pool
+    may be a ThreadPoolExecutor or a ProcessPoolExecutor.
+    """
+
+    def __init__(self, spec: AgentSpec, pool: ComputePool):
+        super().__init__(spec.name)
+        self.spec = spec
+        self.pool = pool
+
+    async def decide(self, game: EuchreGameState, decision: str) -> Any:
+        return await self.pool.run(_decide_in_worker, self.spec, detached_state(game), decision)
+
+
+class RemoteAgent(AsyncAgent):
+    """
+    A seat played from the other end of a transport endpoint (see
+    transport.serve_agent). One request is in flight at a time; a reply to a
+    request that was abandoned (missed deadline) is skipped by its id.
+    """
+
+    def __init__(self, name: str, endpoint):
+        super().__init__(name)
+        self.endpoint = endpoint
+        self._next_id = 0
+        self._lock: Optional[asyncio.Lock] = None
+
+    async def decide(self, game: EuchreGameState, decision: str) -> Any:
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            self._next_id += 1
+            request_id = self._next_id
+            await self.endpoint.send({"id": request_id, "decision": decision, "state": detached_state(game)})
+            while True:
+                reply = await self.endpoint.recv()
+                if reply is None:
+                    raise ConnectionError(f"{self.name} disconnected")
+                if reply["id"] == request_id:
+                    return reply["answer"]
+
+
+def async_agent(agent: Union[Agent, AgentSpec, AsyncAgent], pool: Optional[ComputePool] = None) -> AsyncAgent:
+    """
+    Wraps an agent for a served table: AgentSpecs of CPU_HEAVY_KINDS go to
+    `pool` (if given), other specs and Agent instances run inline.
+    """
+    if isinstance(agent, AsyncAgent):
+        return agent
+    if isinstance(agent, AgentSpec):
+        if pool is not None and agent.kind in CPU_HEAVY_KINDS:
+            return ExecutorAgent(agent, pool)
+        agent = agent.build()
+    return InlineAgent(agent)
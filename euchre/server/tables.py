@@ -0,0 +1,217 @@
+"""
+Asyncio table manager: many concurrent games in one process.
+
+play_table() is the async counterpart of play_single_game: it drives one
+EuchreGameState and awaits each seat's AsyncAgent, so while one table waits
+for a search running on a ComputePool (or for a remote player) every other
+table keeps playing. Each decision can have a deadline; a seat that misses
+it, raises, or answers illegally is played by a fallback Agent for that
+decision and counted in ServerStats.
+
+TableManager runs queued games on up to `max_tables` tables at once.
+submit() waits while `queue_size` games are already queued, so a producer
+can't get ahead of the tables:
+
+    async with TableManager(max_tables=2000, decision_timeout=1.0) as manager:
+        pool = ComputePool(ThreadPoolExecutor(4))
+        seats = [async_agent(AgentSpec("MCTS", f"M{i}", {"simulation_time": 0.2}), pool) for i in range(4)]
+        futures = [await manager.submit(seats) for _ in range(10_000)]
+        results = await asyncio.gather(*futures)
+"""
+import asyncio
+import random
+from dataclasses import dataclass
+from typing import Any, List, Optional, Sequence
+
+from ..agents import Agent, RuleBasedAgent
+from ..engine.actions import get_valid_moves
+from ..engine.card import Card, Suit
+from ..engine.events import EventSink
+from ..engine.state import EuchreGameState, GamePhase
+from ..utils.evaluator import GameResult
+from .adapters import CALL_SUIT, PICK_UP, PLAY, AsyncAgent, decide
+
+_DECISIONS = {
+    GamePhase.BIDDING_ROUND_1: PICK_UP,
+    GamePhase.BIDDING_ROUND_2: CALL_SUIT,
+    GamePhase.PLAYING: PLAY,
+}
+
+
+@dataclass
+class ServerStats:
+    """Counters shared by every table of a manager."""
+    games: int = 0
+    decisions: int = 0
+    timeouts: int = 0   # answered by the fallback after the deadline
+    faults: int = 0     # answered by the fallback after an error or illegal answer
+
+
+def _is_legal(game: EuchreGameState, decision: str, answer: Any) -> bool:
+    if decision == PICK_UP:
+        return isinstance(answer, bool)
+    if decision == CALL_SUIT:
+        return answer is None or (isinstance(answer, Suit) and answer is not game.up_card.suit)
+    if not isinstance(answer, Card):
+        return False
+    hand = game.hands[game.current_player_index]
+    return answer in get_valid_moves(hand, game.current_trick, game.trump_suit)
+
+
+async def _ask(agent: AsyncAgent, game: EuchreGameState, decision: str, timeout: Optional[float],
+               fallback: Agent, stats: ServerStats) -> Any:
+    stats.decisions += 1
+    try:
+        if timeout is None:
+            answer = await agent.decide(game, decision)
+        else:
+            answer = await asyncio.wait_for(agent.decide(game, decision), timeout)
+    except asyncio.TimeoutError:
+        stats.timeouts += 1
+        return decide(fallback, game, decision)
+    except Exception:
+        stats.faults += 1
+        return decide(fallback, game, decision)
+    if not _is_legal(game, decision, answer):
+        stats.faults += 1
+        return decide(fallback, game, decision)
+    return answer
+
+
+async def play_table(
+    seats: Sequence[AsyncAgent],
+    target_score: int = 10,
+    sink: Optional[EventSink] = None,
+    rng: Optional[random.Random] = None,
+    decision_timeout: Optional[float] = None,
+    fallback: Optional[Agent] = None,
+    stats: Optional[ServerStats] = None
+) -> GameResult:
+    """
+    Plays one game to target_score with four AsyncAgents (Team 0: seats 0 & 2).
+
+    Args:
+        seats: The four AsyncAgents, by seat
+        target_score: Score required to win the game
+        sink: Optional EventSink receiving the game's event trace
+        rng: Optional random.Random driving the deals
+        decision_timeout: Seconds each decision may take (None: no deadline)
+        fallback: Agent answering missed, failed or illegal decisions
+            (a RuleBasedAgent by default)
+        stats: ServerStats to count decisions, timeouts and faults in
+
+    Returns:
+        GameResult with final scores and the number of hands dealt
+    """
+    if len(seats) != 4:
+        raise ValueError("Must provide exactly 4 agents")
+    fallback = fallback if fallback is not None else RuleBasedAgent("Fallback")
+    stats = stats if stats is not None else ServerStats()
+
+    game = EuchreGameState(target_score=target_score, sink=sink, rng=rng)
+    game.start_hand()
+    hands_dealt = 1
+    while game.phase != GamePhase.GAME_OVER:
+        seat = game.current_player_index
+        decision = _DECISIONS[game.phase]
+        answer = await _ask(seats[seat], game, decision, decision_timeout, fallback, stats)
+
+        if decision == PICK_UP:
+            if answer:
+                game.order_up(seat)
+            else:
+                game.pass_turn()
+        elif decision == CALL_SUIT:
+            if answer:
+                game.call_suit(seat, answer)
+            else:
+                game.pass_turn()
+        else:
+            game.play_card(seat, game.hands[seat].index(answer))
+        if game.phase == GamePhase.BIDDING_ROUND_1 and decision != PICK_UP:
+            # The last card of a hand or a passed-out round 2 deals the next hand
+            hands_dealt += 1
+            # Inline agents never suspend; let the other tables run between hands
+            await asyncio.sleep(0)
+
+    stats.games += 1
+    return GameResult(game.team_scores[0], game.team_scores[1], hands_dealt)
+
+
+class TableManager:
+    """
+    Runs games submitted with submit() on up to `max_tables` concurrent
+    tables, with at most `queue_size` games waiting for a table (submit()
+    blocks beyond that). Use as `async with TableManager(...) as manager`,
+    or call start() and close() around the games.
+    """
+
+    def __init__(self, max_tables: int = 1000, queue_size: Optional[int] = None,
+                 decision_timeout: Optional[float] = None, fallback: Optional[Agent] = None):
+        if max_tables < 1:
+            raise ValueError("max_tables must be at least 1")
+        self.max_tables = max_tables
+        self.queue_size = queue_size if queue_size is not None else max_tables
+        self.decision_timeout = decision_timeout
+        self.fallback = fallback if fallback is not None else RuleBasedAgent("Fallback")
+        self.stats = ServerStats()
+        self._queue: Optional[asyncio.Queue] = None
+        self._tables: List[asyncio.Task] = []
+
+    async def start(self):
+        if self._queue is not None:
+            raise ValueError("TableManager already started")
+        self._queue = asyncio.Queue(self.queue_size)
+        self._tables = [asyncio.ensure_future(self._run_table()) for _ in range(self.max_tables)]
+
+    async def submit(self, seats: Sequence[AsyncAgent], target_score: int = 10,
+                     sink: Optional[EventSink] = None, rng: Optional[random.Random] = None) -> asyncio.Future:
+        """Queues a game, waiting while the queue is full; returns a future of its GameResult."""
+        if self._queue is None:
+            raise ValueError("Call start() before submitting games")
+        if len(seats) != 4:
+            raise ValueError("Must provide exactly 4 agents")
+        result = asyncio.get_running_loop().create_future()
+        await self._queue.put((seats, target_score, sink, rng, result))
+        return result
+
+    async def play(self, seats: Sequence[AsyncAgent], target_score: int = 10,
+                   sink: Optional[EventSink] = None, rng: Optional[random.Random] = None) -> GameResult:
+        return await (await self.submit(seats, target_score, sink, rng))
+
+    async def join(self):
+        """Waits until every submitted game has finished."""
+        await self._queue.join()
+
+    async def close(self):
+        """Finishes the submitted games, then stops the tables."""
+        if self._queue is None:
+            return
+        await self.join()
+        for table in self._tables:
+            table.cancel()
+        await asyncio.gather(*self._tables, return_exceptions=True)
+        self._queue, self._tables = None, []
+
+    async def __aenter__(self) -> "TableManager":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def _run_table(self):
+        queue = self._queue
+        while True:
+            seats, target_score, sink, rng, result = await queue.get()
+            try:
+                if not result.cancelled():
+                    outcome = await play_table(seats, target_score, sink, rng, self.decision_timeout,
+                                               self.fallback, self.stats)
+                    if not result.cancelled():
+                        result.set_result(outcome)
+            except Exception as e:
+                if not result.done():
+                    result.set_exception(e)
+            finally:
+                queue.task_done()
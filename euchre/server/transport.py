@@ -0,0 +1,59 @@
+"""
+In-process transport between served tables and remote players.
+
+A transport connects two Endpoints that exchange messages: the table side
+sends decision requests ({"id", "decision", "state"}) and the player side
+answers ({"id", "answer"}); None closes the connection. LocalTransport
+links the two ends with asyncio queues inside one event loop and passes
+messages as they are; a network transport would offer the same
+send/recv/close over sockets and serialize the messages. RemoteAgent keeps
+one request in flight, so the queues never hold more than a few messages.
+"""
+import asyncio
+from typing import Optional
+
+from ..agents import Agent
+from .adapters import decide
+
+
+class Endpoint:
+    """One end of a LocalTransport."""
+
+    def __init__(self, outbox: asyncio.Queue, inbox: asyncio.Queue):
+        self._outbox = outbox
+        self._inbox = inbox
+
+    async def send(self, message: dict):
+        await self._outbox.put(message)
+
+    async def recv(self) -> Optional[dict]:
+        """The next message, or None once the other end has closed."""
+        return await self._inbox.get()
+
+    async def close(self):
+        await self._outbox.put(None)
+
+
+class LocalTransport:
+    """
+    A connected pair of endpoints: `table` for the RemoteAgent seat and
+    `player` for serve_agent. Must be created inside the running loop.
+    """
+
+    def __init__(self):
+        to_player: asyncio.Queue = asyncio.Queue()
+        to_table: asyncio.Queue = asyncio.Queue()
+        self.table = Endpoint(to_player, to_table)
+        self.player = Endpoint(to_table, to_player)
+
+
+async def serve_agent(endpoint: Endpoint, agent: Agent) -> int:
+    """Answers decision requests with `agent` until the connection closes; returns how many."""
+    answered = 0
+    while True:
+        request = await endpoint.recv()
+        if request is None:
+            return answered
+        answer = decide(agent, request["state"], request["decision"])
+        await endpoint.send({"id": request["id"], "answer": answer})
+        answered += 1
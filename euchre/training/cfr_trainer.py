@@ -1,119 +1,356 @@
+import os
 import pickle
 import random
-from collections import defaultdict
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Sequence
+
+import numpy as np
+
 from ..engine.state import EuchreGameState, GamePhase
 from ..engine.card import Deck
-from ..agents.cfr_utils import get_info_set_key
+from ..engine.events import EventSink
+from ..agents.cfr_utils import ABSTRACTIONS, info_set_key
 from ..agents.heuristic import RuleBasedAgent
+from .storage import InfoSetTable
+
+ACTIONS = ('P', 'O')  # Pass, Order Up
+
+MODES = ('vanilla', 'external', 'outcome')
 
 class CFRTrainer:
-    def __init__(self):
-        # Map of info_set_key -> { 'regret_sum': {act: val}, 'strategy_sum': {act: val} }
-        self.nodes = defaultdict(lambda: {
-            'regret_sum': {'P': 0.0, 'O': 0.0},
-            'strategy_sum': {'P': 0.0, 'O': 0.0}
-        })
+    """
+    CFR over round 1 bidding ('P'ass / 'O'rder up), one sampled deal per
+    iteration, scored by a rule-based playout. Payoffs are Team 0's point
+    difference; Team 1 plays to minimize it.
+
+    Modes (see `train`):
+      vanilla  - every action at every node is expanded.
+      external - the traversing team (alternating by iteration) expands its
+                 own actions, everyone else's are sampled from the current
+                 strategy.
+      outcome  - a single sampled path per iteration, with importance
+                 weighting and epsilon exploration for the traverser.
+    """
+    def __init__(self, sink: Optional[EventSink] = None, rng: Optional[random.Random] = None,
+                 epsilon: float = 0.6, abstraction: str = "tier"):
+        if abstraction not in ABSTRACTIONS:
+            raise ValueError(f"Unknown abstraction: {abstraction}. Choose from {ABSTRACTIONS}")
+        # Info-set keys: strength tiers, or exact suit-canonical hands (see cfr_utils)
+        self.abstraction = abstraction
+        # info_set_key -> dense id; regret and strategy sums are rows of NumPy arrays
+        self.table = InfoSetTable(ACTIONS)
         # We use the heuristic bot to simulate the rest of the hand (playout)
         self.evaluator = RuleBasedAgent("Eval")
+        # Optional trace of deals and playouts; training is silent by default
+        self.sink = sink
+        # Deals and sampling (global random by default)
+        self.rng = rng if rng is not None else random
+        # Exploration for the traverser in outcome sampling
+        self.epsilon = epsilon
+        self.iterations = 0
+        # Mode of the iterations run so far (checkpoints refuse to resume in another)
+        self.mode: Optional[str] = None
+        # (deal, maker seat, trump) -> team 0 payoff. Rule-based play is
+        # deterministic, so each playout only needs to run once; cleared
+        # every iteration since a deal never recurs.
+        self._payoffs = {}
+        # Vanilla CFR reaches every maker, so it scores all four at once;
+        # sampling modes only pay for the playouts they actually visit
+        self._batch_playouts = True
 
-    def train(self, iterations=1000):
-        print(f"Starting CFR Training for {iterations} iterations...")
+    def train(self, iterations=1000, mode='vanilla', workers=1, sync_every=1000,
+              checkpoint_path=None, checkpoint_every=1000, resume_from=None):
+        """
+        Runs `iterations` CFR iterations and saves the average policy.
+        With workers > 1, iterations are sharded over worker processes that
+        merge their regret/strategy deltas into this table every
+        `sync_every` iterations per worker.
+
+        With `checkpoint_path`, the full training state is written there
+        every `checkpoint_every` iterations (and at the end). `resume_from`
+        loads such a checkpoint first and then only runs the iterations
+        still missing to reach `iterations` in total, reproducing the
+        uninterrupted run exactly; it must have been trained in the same
+        `mode`.
+        """
+        if mode not in MODES:
+            raise ValueError(f"Unknown CFR mode: {mode}. Choose from {MODES}")
+        if resume_from is not None:
+            self.load_checkpoint(resume_from, mode)
+            print(f"Resumed from {resume_from} at iteration {self.iterations}")
+            iterations = max(iterations - self.iterations, 0)
+        print(f"Starting CFR Training ({mode}) for {iterations} iterations...")
         
-        for i in range(iterations):
-            if i % 100 == 0:
-                print(f"Iteration {i}/{iterations}")
-                
-            # Initialize a fresh game
-            state = EuchreGameState()
-            state.start_hand() # Deals cards, sets up_card, phase = BIDDING_ROUND_1
-            
-            # Start CFR traversal
-            # P0 and P1 represent reach probabilities for team 0 and team 1
-            self.cfr(state, [], 1.0, 1.0)
+        if workers > 1:
+            self.train_parallel(iterations, mode, workers, sync_every, checkpoint_path, checkpoint_every)
+        else:
+            for i in range(iterations):
+                if i % 100 == 0:
+                    print(f"Iteration {i}/{iterations}  avg regret bound: {self.exploitability_proxy():.4f}")
+                self.train_iteration(mode)
+                if checkpoint_path and self.iterations % checkpoint_every == 0:
+                    self.save_checkpoint(checkpoint_path)
 
+        if checkpoint_path:
+            self.save_checkpoint(checkpoint_path)
         self._save_policy()
 
-    def cfr(self, state: EuchreGameState, history, p0, p1):
+    def save_checkpoint(self, path):
         """
-        Recursive CFR function.
-        state: Current game state
-        history: List of actions taken so far in this round (e.g. ['P', 'P'])
-        p0: Reach probability for Team 0
-        p1: Reach probability for Team 1
+        Writes regrets, strategy sums, keys, iteration count, mode and RNG
+        state to an .npz file. The file is replaced atomically, so a crash mid-write
+        leaves the previous checkpoint intact.
+        """
+        version, internal, gauss_next = self.rng.getstate()
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            np.savez(
+                f,
+                keys=np.array(self.table.keys, dtype=str),
+                actions=np.array(self.table.actions, dtype=str),
+                regret_sum=self.table.regret_sum,
+                strategy_sum=self.table.strategy_sum,
+                iterations=np.int64(self.iterations),
+                abstraction=np.array(self.abstraction),
+                mode=np.array(self.mode or ""),
+                rng_version=np.int64(version),
+                rng_internal=np.array(internal, dtype=np.uint64),
+                rng_gauss_next=np.float64(np.nan if gauss_next is None else gauss_next),
+            )
+        os.replace(tmp_path, path)
+
+    def load_checkpoint(self, path, mode=None):
+        """
+        Restores the state written by save_checkpoint (into this trainer's
+        rng). A checkpoint trained with another abstraction, or in another
+        mode than `mode` (default: this trainer's), raises ValueError.
+        """
+        mode = mode if mode is not None else self.mode
+        with np.load(path, allow_pickle=False) as data:
+            if "abstraction" in data and str(data["abstraction"]) != self.abstraction:
+                raise ValueError(f"Checkpoint uses the '{data['abstraction']}' abstraction, "
+                                 f"this trainer '{self.abstraction}'")
+            saved_mode = str(data["mode"]) if "mode" in data else ""
+            if saved_mode and mode is not None and saved_mode != mode:
+                raise ValueError(f"Checkpoint was trained in '{saved_mode}' mode, not '{mode}'")
+            self.mode = saved_mode or mode
+            self.table = InfoSetTable.from_arrays(
+                data["actions"].tolist(), data["keys"].tolist(), data["regret_sum"], data["strategy_sum"],
+            )
+            self.iterations = int(data["iterations"])
+            gauss_next = float(data["rng_gauss_next"])
+            self.rng.setstate((
+                int(data["rng_version"]),
+                tuple(int(x) for x in data["rng_internal"]),
+                None if np.isnan(gauss_next) else gauss_next,
+            ))
+
+    def train_parallel(self, iterations, mode='vanilla', workers=2, sync_every=1000,
+                       checkpoint_path=None, checkpoint_every=1000):
+        """
+        Sharded training: each round, every worker starts from a snapshot of
+        this table's regrets, runs up to `sync_every` iterations on its own
+        seed stream (drawn from self.rng) and sends back its deltas, which
+        are summed into the table. Smaller `sync_every` keeps the workers'
+        strategies closer to serial CFR at the cost of more merging.
+        """
+        if mode not in MODES:
+            raise ValueError(f"Unknown CFR mode: {mode}. Choose from {MODES}")
+        if sync_every < 1:
+            raise ValueError("sync_every must be at least 1")
+        self.mode = mode
+        remaining = iterations
+        start = time.perf_counter()
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_cfr_worker,
+                                 initargs=(self.abstraction,)) as pool:
+            while remaining > 0:
+                batch = min(remaining, sync_every * workers)
+                shards = [batch // workers + (1 if w < batch % workers else 0) for w in range(workers)]
+                keys, regrets = list(self.table.keys), self.table.regret_sum.copy()
+                futures = [
+                    # Offsetting the iteration count spreads the traversing team across workers
+                    pool.submit(_train_shard, keys, regrets, self.iterations + w, n, mode, self.rng.getrandbits(64))
+                    for w, n in enumerate(shards) if n
+                ]
+                for future in futures:
+                    self.table.merge(*future.result())
+                previous = self.iterations
+                self.iterations += batch
+                remaining -= batch
+                # Checkpoints fall on round boundaries, where the state is consistent
+                if checkpoint_path and self.iterations // checkpoint_every > previous // checkpoint_every:
+                    self.save_checkpoint(checkpoint_path)
+                rate = (iterations - remaining) / (time.perf_counter() - start)
+                print(f"Iteration {iterations - remaining}/{iterations}  avg regret bound: "
+                      f"{self.exploitability_proxy():.4f}  ({rate:.0f} it/s)")
+
+    def train_iteration(self, mode='vanilla'):
+        """One CFR iteration over a freshly dealt hand."""
+        # Initialize a fresh game
+        state = EuchreGameState(sink=self.sink, rng=self.rng)
+        state.start_hand() # Deals cards, sets up_card, phase = BIDDING_ROUND_1
+        self._payoffs = {}
+        
+        # Sampling modes alternate the traversing team between iterations
+        traverser = self.iterations % 2
+        self._batch_playouts = mode == 'vanilla'
+        if mode == 'vanilla':
+            # P0 and P1 represent reach probabilities for team 0 and team 1
+            self.cfr(state, [], 1.0, 1.0)
+        elif mode == 'external':
+            self.external_cfr(state, [], traverser)
+        elif mode == 'outcome':
+            self.outcome_cfr(state, [], traverser, 1.0, 1.0, 1.0)
+        else:
+            raise ValueError(f"Unknown CFR mode: {mode}. Choose from {MODES}")
+        self.mode = mode
+        self.iterations += 1
+
+    def exploitability_proxy(self) -> float:
+        """
+        Sum over info sets of the largest positive cumulative regret, divided
+        by the iteration count. CFR's regret bound: the average strategy's
+        exploitability is at most about this, and it shrinks as training converges.
         """
-        # 1. Terminal Check: Round 1 ends if someone orders up or everyone passes
+        if not self.iterations or not len(self.table):
+            return 0.0
+        positive = np.maximum(self.table.regret_sum, 0.0).max(axis=1)
+        return float(positive.sum()) / self.iterations
+
+    def _terminal_value(self, state, history):
+        """Team 0 payoff if `history` ends round 1, else None."""
+        # Round 1 ends if someone orders up or everyone passes
         if history and history[-1] == 'O':
             # Someone ordered up. Play out the hand to see who wins.
             return self._get_playout_reward(state, history)
-            
         if len(history) == 4:
             # Everyone passed. In this simplified Trainer, we assume redeal = 0 payoff
             # Or we could train Round 2 here. For now, return 0.
             return 0
+        return None
 
-        # 2. Determine whose turn it is
+    def _info_set(self, state, history):
+        """(acting team, info-set id) of the decision after `history`."""
         # Bidding starts left of dealer
         start_player = (state.dealer_index + 1) % 4
         current_player = (start_player + len(history)) % 4
-        current_team = current_player % 2
-        
-        # 3. Get Information Set
         hand = state.hands[current_player]
         # Only pass the history relevant to this specific decision point
-        info_set_key = get_info_set_key(hand, history, current_player, state.dealer_index, state.up_card.suit)
-        
-        node = self.nodes[info_set_key]
+        key = info_set_key(self.abstraction, hand, history, current_player, state.dealer_index, state.up_card)
+        return current_player % 2, self.table.index(key)
+
+    def _sample(self, probs) -> int:
+        return 0 if self.rng.random() < probs[0] else 1
+
+    def cfr(self, state: EuchreGameState, history, p0, p1):
+        """
+        Recursive CFR function.
+        state: Current game state
+        history: List of actions taken so far in this round (e.g. ['P', 'P'])
+        p0: Reach probability for Team 0
+        p1: Reach probability for Team 1
+        Returns the expected payoff for Team 0.
+        """
+        # 1. Terminal Check
+        value = self._terminal_value(state, history)
+        if value is not None:
+            return value
+
+        # 2. Determine whose turn it is / 3. Get Information Set
+        current_team, node = self._info_set(state, history)
         
         # 4. Get Strategy (Regret Matching)
-        strategy = self._get_strategy(node['regret_sum'])
+        strategy = self.table.strategy(node)
         
-        actions = ['P', 'O'] # Pass, Order Up
-        util = {'P': 0, 'O': 0}
-        node_util = 0
+        util = np.zeros(len(ACTIONS))
         
         # 5. Recursively Call CFR for each action
-        for act in actions:
+        for a, act in enumerate(ACTIONS):
             # Update history
             next_history = history + [act]
             
             # Update reach probs
-            next_p0 = p0 * strategy[act] if current_team == 0 else p0
-            next_p1 = p1 * strategy[act] if current_team == 1 else p1
-            
-            # If 'O', we need to mutate state for the playout
-            next_state = state # In purely abstract CFR we clone, but here we lazy-mutate logic in terminal step
+            next_p0 = p0 * strategy[a] if current_team == 0 else p0
+            next_p1 = p1 * strategy[a] if current_team == 1 else p1
             
             # RECURSE
-            # Note: The utility returned is from the perspective of the *current_player*
-            util[act] = -1 * self.cfr(next_state, next_history, next_p0, next_p1) if current_team != (current_player % 2) else self.cfr(next_state, next_history, next_p0, next_p1)
-            # Actually, standard CFR returns utility for the active player.
-            # Let's simplify: Return utility for Team 0 always.
-            
-            util[act] = self.cfr(next_state, next_history, next_p0, next_p1)
+            # `state` is never mutated: playouts run on clones.
+            # The utility is always from Team 0's point of view.
+            util[a] = self.cfr(state, next_history, next_p0, next_p1)
             
-            node_util += strategy[act] * util[act]
+        node_util = float(strategy @ util)
 
         # 6. Compute Regrets & Update Node
-        # Reach prob for this player
-        pr = p0 if current_team == 0 else p1
+        # Regrets are counterfactual (weighted by the other team's reach) and
+        # from the acting team's point of view; strategy sums use own reach.
+        own, other, sign = (p0, p1, 1.0) if current_team == 0 else (p1, p0, -1.0)
         
-        for act in actions:
-            regret = util[act] - node_util
-            node['regret_sum'][act] += pr * regret
-            node['strategy_sum'][act] += pr * strategy[act]
+        self.table.regret_sum[node] += other * sign * (util - node_util)
+        self.table.strategy_sum[node] += own * strategy
             
         return node_util
 
-    def _get_strategy(self, regret_sum):
-        """Regret Matching to get current strategy"""
-        total_positive_regret = sum(max(r, 0) for r in regret_sum.values())
-        strategy = {}
-        if total_positive_regret > 0:
-            for act in ['P', 'O']:
-                strategy[act] = max(regret_sum[act], 0) / total_positive_regret
+    def external_cfr(self, state: EuchreGameState, history, traverser: int):
+        """
+        External-sampling MCCFR. Expands every action of `traverser`'s team,
+        samples one action elsewhere. Returns the sampled Team 0 payoff.
+        """
+        value = self._terminal_value(state, history)
+        if value is not None:
+            return value
+
+        current_team, node = self._info_set(state, history)
+        strategy = self.table.strategy(node)
+
+        if current_team != traverser:
+            # The sampled opponent path is drawn on-policy, so its strategy
+            # sum can be updated with weight 1
+            self.table.strategy_sum[node] += strategy
+            a = self._sample(strategy)
+            return self.external_cfr(state, history + [ACTIONS[a]], traverser)
+
+        util = np.array([self.external_cfr(state, history + [act], traverser) for act in ACTIONS])
+        node_util = float(strategy @ util)
+        sign = 1.0 if current_team == 0 else -1.0
+        self.table.regret_sum[node] += sign * (util - node_util)
+        return node_util
+
+    def outcome_cfr(self, state: EuchreGameState, history, traverser: int,
+                    my_reach: float, opp_reach: float, sample_reach: float):
+        """
+        Outcome-sampling MCCFR: follows one sampled path per iteration.
+        Returns the importance-weighted payoff estimate for `traverser`'s team.
+        """
+        value = self._terminal_value(state, history)
+        if value is not None:
+            return value if traverser == 0 else -value
+
+        current_team, node = self._info_set(state, history)
+        strategy = self.table.strategy(node)
+        if current_team == traverser:
+            sample_probs = self.epsilon / len(ACTIONS) + (1.0 - self.epsilon) * strategy
         else:
-            strategy = {'P': 0.5, 'O': 0.5}
-        return strategy
+            sample_probs = strategy
+        a = self._sample(sample_probs)
+
+        if current_team == traverser:
+            child = self.outcome_cfr(state, history + [ACTIONS[a]], traverser,
+                                     my_reach * strategy[a], opp_reach, sample_reach * sample_probs[a])
+        else:
+            child = self.outcome_cfr(state, history + [ACTIONS[a]], traverser,
+                                     my_reach, opp_reach * strategy[a], sample_reach * sample_probs[a])
+
+        # Unsampled actions are estimated as 0, the sampled one importance-weighted
+        action_values = np.zeros(len(ACTIONS))
+        action_values[a] = child / sample_probs[a]
+        value_estimate = float(strategy @ action_values)
+
+        if current_team == traverser:
+            weight = opp_reach / sample_reach
+            self.table.regret_sum[node] += weight * (action_values - value_estimate)
+            self.table.strategy_sum[node] += (my_reach / sample_reach) * strategy
+        return value_estimate
 
     def _get_playout_reward(self, state, history):
         """
@@ -126,56 +363,56 @@ class CFRTrainer:
         # The history length (including the 'O') tells us who acted
         actor_offset = len(history) - 1
         maker_idx = (start_player + actor_offset) % 4
-        
-        # Apply the 'Order Up' logic to the state
-        # In a real game, dealer swaps. We simulate that.
-        state.maker_team = maker_idx % 2
-        state.trump_suit = state.up_card.suit
-        state.phase = GamePhase.PLAYING
-        
-        # Simple dealer discard simulation
-        dealer_hand = state.hands[state.dealer_index]
-        dealer_hand.append(state.up_card)
-        discard = self.evaluator.select_discard(dealer_hand, state.up_card)
-        # Find and remove discard (tricky because select_discard assumes it's picking form hand)
-        # Let's just blindly remove lowest for speed/safety in trainer
-        dealer_hand.sort(key=lambda c: c.get_value(state.trump_suit, None))
-        dealer_hand.pop(0) # Remove worst
-        
-        # Play out the hand using Heuristic agents
-        # We start from left of dealer
-        state.current_player_index = (state.dealer_index + 1) % 4
-        
-        while state.phase == GamePhase.PLAYING:
-            p_idx = state.current_player_index
-            hand = state.hands[p_idx]
 
-            # Safety check for empty hand
-            if not hand:
-                break
+        key = (self._deal_key(state), maker_idx, state.up_card.suit)
+        if key not in self._payoffs:
+            if self._batch_playouts:
+                # Every seat may order up on this deal; score them all in one pass
+                self.playout_payoffs(state)
+            else:
+                self._payoffs[key] = self._playout(state, maker_idx)
+        return self._payoffs[key]
 
-            card = self.evaluator.play_card(state)
+    @staticmethod
+    def _deal_key(state):
+        return (state.dealer_index, state.up_card) + tuple(tuple(h) for h in state.hands)
 
-            # Find card index safely
-            card_idx = None
-            for i, c in enumerate(hand):
-                if c.rank == card.rank and c.suit == card.suit:
-                    card_idx = i
-                    break
+    def playout_payoffs(self, state):
+        """
+        Team 0 payoffs of ordering up the up-card from each of the four seats,
+        for a deal in round 1 bidding. Results are also cached for the iteration.
+        """
+        deal = self._deal_key(state)
+        trump = state.up_card.suit  # ordering up makes the up-card suit trump
+        payoffs = []
+        for maker_idx in range(4):
+            key = (deal, maker_idx, trump)
+            if key not in self._payoffs:
+                self._payoffs[key] = self._playout(state, maker_idx)
+            payoffs.append(self._payoffs[key])
+        return payoffs
 
-            if card_idx is None:
-                # Card not found, play first card as fallback
-                card_idx = 0
+    def _playout(self, state, maker_idx):
+        # Work on a clone so the caller's state (and sibling branches) see the original deal
+        sim = state.clone()
+        if self.sink is not None:
+            sim.sink = self.sink
 
-            state.play_card(p_idx, card_idx)
+        # Apply the 'Order Up' logic (dealer swap, lead left of dealer)
+        sim.order_up(maker_idx)
+        
+        # Play out the hand using Heuristic agents.
+        # apply() stops at HAND_OVER instead of dealing the next hand.
+        while sim.phase == GamePhase.PLAYING:
+            sim.apply(self.evaluator.play_card(sim))
             
         # Game Over (for this hand)
         # Calculate utility for Team 0
         # Winning 3+ tricks is the goal.
         # But points matter more.
         
-        team0_score = state.team_scores[0]
-        team1_score = state.team_scores[1]
+        team0_score = sim.team_scores[0]
+        team1_score = sim.team_scores[1]
         
         # Normalized payoff
         if team0_score > team1_score:
@@ -186,19 +423,34 @@ class CFRTrainer:
 
     def _save_policy(self):
         # Convert cumulative strategy sum to average strategy
-        final_policy = {}
-        for key, node in self.nodes.items():
-            strategy_sum = node['strategy_sum']
-            total = sum(strategy_sum.values())
-            if total > 0:
-                final_policy[key] = {k: v/total for k, v in strategy_sum.items()}
-            else:
-                final_policy[key] = {'P': 0.5, 'O': 0.5}
+        final_policy = self.table.to_policy()
                 
         with open("cfr_policy.pkl", "wb") as f:
             pickle.dump(final_policy, f)
         print("Policy saved to cfr_policy.pkl")
 
+# Each pool process keeps one trainer (and its rule-based evaluator) warm
+_WORKER_TRAINER: Optional[CFRTrainer] = None
+
+
+def _init_cfr_worker(abstraction: str):
+    global _WORKER_TRAINER
+    _WORKER_TRAINER = CFRTrainer(abstraction=abstraction)
+
+
+def _train_shard(keys: Sequence[str], regrets: np.ndarray, iterations_done: int, n: int, mode: str, seed: int):
+    """Runs `n` iterations from a regret snapshot; returns (keys, regret delta, strategy delta)."""
+    trainer = _WORKER_TRAINER
+    trainer.table = InfoSetTable.from_arrays(ACTIONS, keys, regrets)
+    trainer.iterations = iterations_done
+    trainer.rng = random.Random(seed)
+    for _ in range(n):
+        trainer.train_iteration(mode)
+    regret_delta = trainer.table.regret_sum.copy()
+    regret_delta[:len(keys)] -= regrets
+    return trainer.table.keys, regret_delta, trainer.table.strategy_sum.copy()
+
+
 if __name__ == "__main__":
     trainer = CFRTrainer()
     trainer.train(iterations=100) # Small number for test
\ No newline at end of file
@@ -0,0 +1,357 @@
+"""
+Self-play dataset generation and a memory-mapped reader.
+
+Every decision an agent makes (bids and card plays) becomes one record:
+
+    obs          float16 [OBS_SIZE]  the decider's observation (envs/observation.py)
+    legal        uint64              legal actions as a bitmask over NUM_ACTIONS
+    action       uint8               chosen action (VectorEuchreEnv layout)
+    seat         uint8               deciding seat
+    game         int64               game number within the run
+    hand         uint16              hand number within the game
+    hand_points  int8                points the decider's team won minus lost on that hand
+    game_points  int8                final game score, decider's team minus opponents
+    game_won     bool                whether the decider's team won the game
+
+Outcomes are filled in when a game ends, so at most one game of records
+plus one shard buffer is held in memory. Shards rotate every `shard_size`
+records and are written atomically, in one of two layouts:
+
+    npz   shard-WWW-NNNNN.npz, compressed (smallest; read a shard at a time)
+    npy   shard-WWW-NNNNN/<column>.npy, uncompressed (memory-mapped on read)
+
+WWW is the worker that wrote the shard, so workers never share a file.
+Games get per-game seeds derived from `seed`, as in run_tournament, so the
+records do not depend on the number of workers (shard boundaries do).
+
+    python -m euchre.training.dataset data/ --agents RuleBased RuleBased RuleBased RuleBased --games 1000
+"""
+import argparse
+import glob
+import os
+import random
+import shutil
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ..agents import AVAILABLE_AGENTS, Agent
+from ..engine.card import ALL_CARDS, Suit
+from ..engine.state import EuchreGameState, GamePhase
+from ..envs.observation import OBS_SIZE, encode_observation, legal_action_mask
+from ..envs.vector import CALL_SUIT, NUM_ACTIONS, ORDER_UP, PASS
+from ..utils.evaluator import AgentSpec, GameSeeds, _game_seeds, _seed_game
+
+# name -> (dtype, per-record shape)
+COLUMNS: Dict[str, Tuple[np.dtype, Tuple[int, ...]]] = {
+    "obs": (np.dtype(np.float16), (OBS_SIZE,)),
+    "legal": (np.dtype(np.uint64), ()),
+    "action": (np.dtype(np.uint8), ()),
+    "seat": (np.dtype(np.uint8), ()),
+    "game": (np.dtype(np.int64), ()),
+    "hand": (np.dtype(np.uint16), ()),
+    "hand_points": (np.dtype(np.int8), ()),
+    "game_points": (np.dtype(np.int8), ()),
+    "game_won": (np.dtype(np.bool_), ()),
+}
+FORMATS = ("npz", "npy")
+
+_SUITS = tuple(Suit)
+_BIT_WEIGHTS = np.array([1 << i for i in range(NUM_ACTIONS)], dtype=np.uint64)
+
+
+def unpack_legal(bits: np.ndarray) -> np.ndarray:
+    """Bool [n, NUM_ACTIONS] legal-action masks from the `legal` column."""
+    return (np.asarray(bits, dtype=np.uint64)[:, None] & _BIT_WEIGHTS) != 0
+
+
+# --- Recording ---
+
+def _decide(agent: Agent, game: EuchreGameState) -> int:
+    """Asks the agent for its move and returns it as an action id."""
+    if game.phase == GamePhase.BIDDING_ROUND_1:
+        return ORDER_UP if agent.pick_up_card(game) else PASS
+    if game.phase == GamePhase.BIDDING_ROUND_2:
+        suit = agent.call_suit(game)
+        return PASS if suit is None else CALL_SUIT + suit.ordinal
+    return agent.play_card(game).ordinal
+
+
+def _apply(game: EuchreGameState, seat: int, action: int):
+    if action == PASS:
+        game.pass_turn()
+    elif action == ORDER_UP:
+        game.order_up(seat)
+    elif action >= CALL_SUIT:
+        game.call_suit(seat, _SUITS[action - CALL_SUIT])
+    else:
+        game.play_card(seat, game.hands[seat].index(ALL_CARDS[action]))
+
+
+class GameRecorder:
+    """Plays self-play games and returns each one's records as column arrays."""
+
+    def __init__(self, agents: Sequence[Agent], target_score: int = 10):
+        if len(agents) != 4:
+            raise ValueError("Must provide exactly 4 agents")
+        self.agents = list(agents)
+        self.target_score = target_score
+        # Scratch buffers reused across games, grown if a game runs long
+        self._obs = np.zeros((256, OBS_SIZE), dtype=np.float32)
+        self._mask = np.zeros(NUM_ACTIONS, dtype=bool)
+
+    def play(self, game_id: int, seeds: GameSeeds = None) -> Dict[str, np.ndarray]:
+        game = EuchreGameState(target_score=self.target_score, rng=_seed_game(self.agents, seeds))
+        game.start_hand()
+
+        legal: List[int] = []
+        actions: List[int] = []
+        seats: List[int] = []
+        hands: List[int] = []
+        hand_points: List[int] = []
+        hand_start, hand_idx = 0, 0
+        while game.phase != GamePhase.GAME_OVER:
+            n = len(actions)
+            if n == len(self._obs):
+                self._obs = np.concatenate([self._obs, np.zeros_like(self._obs)])
+            seat = game.current_player_index
+            encode_observation(game, seat, self._obs[n])
+            legal.append(int(legal_action_mask(game, self._mask) @ _BIT_WEIGHTS))
+            action = _decide(self.agents[seat], game)
+            seats.append(seat)
+            actions.append(action)
+            hands.append(hand_idx)
+
+            dealer, scores = game.dealer_index, game.team_scores[:]
+            _apply(game, seat, action)
+            if game.dealer_index != dealer or game.phase == GamePhase.GAME_OVER:
+                # The hand is over (scored, or passed out with no points)
+                gained = [game.team_scores[0] - scores[0], game.team_scores[1] - scores[1]]
+                for i in range(hand_start, len(actions)):
+                    team = seats[i] % 2
+                    hand_points.append(gained[team] - gained[1 - team])
+                hand_start, hand_idx = len(actions), hand_idx + 1
+
+        n = len(actions)
+        seat_arr = np.array(seats, dtype=np.uint8)
+        final = np.array(game.team_scores)
+        own, other = final[seat_arr % 2], final[1 - seat_arr % 2]
+        return {
+            "obs": self._obs[:n].astype(np.float16),
+            "legal": np.array(legal, dtype=np.uint64),
+            "action": np.array(actions, dtype=np.uint8),
+            "seat": seat_arr,
+            "game": np.full(n, game_id, dtype=np.int64),
+            "hand": np.array(hands, dtype=np.uint16),
+            "hand_points": np.array(hand_points, dtype=np.int8),
+            "game_points": (own - other).astype(np.int8),
+            "game_won": own > other,
+        }
+
+    def records(self, game_ids: Sequence[int], seeds: Sequence[GameSeeds]) -> Iterator[Dict[str, np.ndarray]]:
+        """Lazily plays the given games, yielding one game's records at a time."""
+        for game_id, game_seeds in zip(game_ids, seeds):
+            yield self.play(game_id, game_seeds)
+
+
+# --- Shard writing ---
+
+class ShardWriter:
+    """Buffers records and writes them out in rotating shards of `shard_size`."""
+
+    def __init__(self, out_dir: str, worker: int = 0, shard_size: int = 100_000, fmt: str = "npz"):
+        if fmt not in FORMATS:
+            raise ValueError(f"Unknown format: {fmt}. Choose from {FORMATS}")
+        if shard_size < 1:
+            raise ValueError("shard_size must be at least 1")
+        os.makedirs(out_dir, exist_ok=True)
+        self.out_dir = out_dir
+        self.worker = worker
+        self.shard_size = shard_size
+        self.fmt = fmt
+        self.shards: List[str] = []
+        self.records = 0
+        self._buffer = {name: np.zeros((shard_size,) + shape, dtype=dtype) for name, (dtype, shape) in COLUMNS.items()}
+        self._fill = 0
+
+    def write(self, columns: Dict[str, np.ndarray]):
+        n = len(columns["action"])
+        start = 0
+        while start < n:
+            take = min(n - start, self.shard_size - self._fill)
+            for name, buf in self._buffer.items():
+                buf[self._fill:self._fill + take] = columns[name][start:start + take]
+            self._fill += take
+            start += take
+            if self._fill == self.shard_size:
+                self.flush()
+        self.records += n
+
+    def flush(self):
+        if not self._fill:
+            return
+        name = os.path.join(self.out_dir, f"shard-{self.worker:03d}-{len(self.shards):05d}")
+        data = {col: buf[:self._fill] for col, buf in self._buffer.items()}
+        if self.fmt == "npz":
+            path, tmp_path = f"{name}.npz", f"{name}.tmp.npz"
+            np.savez_compressed(tmp_path, **data)
+            os.replace(tmp_path, path)
+        else:
+            path, tmp_path = name, f"{name}.tmp"
+            shutil.rmtree(tmp_path, ignore_errors=True)
+            os.makedirs(tmp_path)
+            for col, values in data.items():
+                np.save(os.path.join(tmp_path, f"{col}.npy"), values)
+            # os.replace can't move a directory onto a non-empty one
+            shutil.rmtree(path, ignore_errors=True)
+            os.replace(tmp_path, path)
+        self.shards.append(path)
+        self._fill = 0
+
+    def close(self):
+        self.flush()
+
+
+# --- Generation ---
+
+_WORKER_RECORDER: Optional[GameRecorder] = None
+
+
+def _init_dataset_worker(seat_specs: List[AgentSpec], target_score: int):
+    global _WORKER_RECORDER
+    _WORKER_RECORDER = GameRecorder([spec.build() for spec in seat_specs], target_score)
+
+
+def _write_games(recorder: GameRecorder, out_dir: str, worker: int, game_ids, seeds, shard_size, fmt) -> Tuple[int, List[str]]:
+    writer = ShardWriter(out_dir, worker, shard_size, fmt)
+    for columns in recorder.records(game_ids, seeds):
+        writer.write(columns)
+    writer.close()
+    return writer.records, writer.shards
+
+
+def _write_games_in_worker(out_dir, worker, game_ids, seeds, shard_size, fmt):
+    return _write_games(_WORKER_RECORDER, out_dir, worker, game_ids, seeds, shard_size, fmt)
+
+
+def _clear_shards(out_dir: str):
+    """Removes the shards (files, directories and leftover temporaries) of an earlier run."""
+    for path in glob.glob(os.path.join(out_dir, "shard-*")):
+        if os.path.isdir(path):
+            shutil.rmtree(path)
+        else:
+            os.remove(path)
+
+
+def generate_dataset(out_dir: str, seats: Sequence[AgentSpec], num_games: int, workers: int = 1,
+                     shard_size: int = 100_000, fmt: str = "npz", seed: Optional[int] = None,
+                     target_score: int = 10) -> Tuple[int, List[str]]:
+    """
+    Plays `num_games` self-play games with the agents in `seats` (seat order
+    0-3) and writes their decisions to `out_dir`. Games are split into one
+    contiguous block per worker. Shards of an earlier run in `out_dir` are
+    removed first. Returns (records written, shard paths).
+    """
+    if len(seats) != 4:
+        raise ValueError("Must provide exactly 4 agent specs")
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown format: {fmt}. Choose from {FORMATS}")
+    if workers > 1 and seed is None:
+        # Workers fork with identical RNG state; give every game its own seed anyway
+        seed = random.SystemRandom().getrandbits(32)
+    game_seeds = _game_seeds(seed, num_games)
+    _clear_shards(out_dir)
+    workers = max(1, min(workers, num_games))
+    bounds = [num_games * w // workers for w in range(workers + 1)]
+    blocks = [(range(bounds[w], bounds[w + 1]), game_seeds[bounds[w]:bounds[w + 1]]) for w in range(workers)]
+
+    if workers == 1:
+        recorder = GameRecorder([spec.build() for spec in seats], target_score)
+        return _write_games(recorder, out_dir, 0, *blocks[0], shard_size, fmt)
+
+    total, shards = 0, []
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_dataset_worker,
+                             initargs=(list(seats), target_score)) as pool:
+        futures = [pool.submit(_write_games_in_worker, out_dir, w, ids, block_seeds, shard_size, fmt)
+                   for w, (ids, block_seeds) in enumerate(blocks)]
+        for future in futures:
+            records, worker_shards = future.result()
+            total += records
+            shards.extend(worker_shards)
+    return total, shards
+
+
+# --- Reading ---
+
+class DatasetReader:
+    """
+    Streams a dataset directory shard by shard. npy shards are memory-mapped,
+    so only the pages actually touched are read; npz shards are decompressed
+    one at a time. Either way memory stays bounded by a single shard.
+    """
+
+    def __init__(self, path: str, columns: Optional[Sequence[str]] = None):
+        self.path = path
+        self.columns = tuple(columns) if columns is not None else tuple(COLUMNS)
+        unknown = set(self.columns) - set(COLUMNS)
+        if unknown:
+            raise ValueError(f"Unknown columns: {sorted(unknown)}")
+        paths = glob.glob(os.path.join(path, "shard-*"))
+        self.shards = sorted(p for p in paths if not p.endswith((".tmp", ".tmp.npz")))
+        self._lengths: Optional[List[int]] = None
+
+    def _shard_length(self, shard: str) -> int:
+        if os.path.isdir(shard):
+            return len(np.load(os.path.join(shard, "action.npy"), mmap_mode="r"))
+        with np.load(shard) as data:
+            return len(data["action"])
+
+    def __len__(self) -> int:
+        if self._lengths is None:
+            self._lengths = [self._shard_length(s) for s in self.shards]
+        return sum(self._lengths)
+
+    def iter_shards(self) -> Iterator[Dict[str, np.ndarray]]:
+        for shard in self.shards:
+            if os.path.isdir(shard):
+                yield {col: np.load(os.path.join(shard, f"{col}.npy"), mmap_mode="r") for col in self.columns}
+            else:
+                with np.load(shard) as data:
+                    yield {col: data[col] for col in self.columns}
+
+    def iter_batches(self, batch_size: int = 4096) -> Iterator[Dict[str, np.ndarray]]:
+        """Batches of up to `batch_size` records; a batch never spans two shards."""
+        for shard in self.iter_shards():
+            n = len(shard[self.columns[0]])
+            for start in range(0, n, batch_size):
+                yield {col: values[start:start + batch_size] for col, values in shard.items()}
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m euchre.training.dataset",
+                                     description="Generate a self-play decision dataset.")
+    parser.add_argument("out_dir")
+    parser.add_argument("--agents", nargs=4, default=["RuleBased"] * 4, choices=sorted(AVAILABLE_AGENTS),
+                        help="agent kind for seats 0-3")
+    parser.add_argument("--games", type=int, default=1000)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--shard-size", type=int, default=100_000)
+    parser.add_argument("--format", choices=FORMATS, default="npz")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    seats = [AgentSpec(kind, f"{kind}{seat}") for seat, kind in enumerate(args.agents)]
+    start = time.time()
+    records, shards = generate_dataset(args.out_dir, seats, args.games, args.workers,
+                                       args.shard_size, args.format, args.seed)
+    elapsed = time.time() - start
+    print(f"Wrote {records} decisions from {args.games} games to {len(shards)} shards "
+          f"in {elapsed:.1f}s ({records / max(elapsed, 1e-9):.0f} decisions/s)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
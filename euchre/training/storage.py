@@ -0,0 +1,121 @@
+"""
+Array-backed storage for CFR regrets and strategy sums.
+
+Info-set keys are mapped to dense integer ids in insertion order; row `id`
+of `regret_sum` and `strategy_sum` holds that info set's values, one column
+per action. The arrays are preallocated and grown by doubling, so an info
+set costs 2 * num_actions * 8 bytes of array storage plus its key entry,
+and regret matching over the whole table is a handful of NumPy operations.
+"""
+from typing import Dict, Hashable, Iterator, List, Optional, Sequence
+
+import numpy as np
+
+
+def regret_matching(regrets: np.ndarray) -> np.ndarray:
+    """
+    Current strategy from cumulative regrets, row-wise: positive regrets
+    normalized, uniform where no regret is positive. Works on one row or many.
+    """
+    positive = np.maximum(regrets, 0.0)
+    totals = positive.sum(axis=-1, keepdims=True)
+    uniform = np.full_like(positive, 1.0 / regrets.shape[-1])
+    return np.divide(positive, totals, out=uniform, where=totals > 0)
+
+
+class InfoSetTable:
+    def __init__(self, actions: Sequence[str] = ("P", "O"), capacity: int = 1024):
+        self.actions = tuple(actions)
+        self._ids: Dict[Hashable, int] = {}
+        self.keys: List[Hashable] = []
+        capacity = max(capacity, 1)
+        self._regret_sum = np.zeros((capacity, len(self.actions)))
+        self._strategy_sum = np.zeros((capacity, len(self.actions)))
+
+    @classmethod
+    def from_arrays(cls, actions: Sequence[str], keys: Sequence[Hashable],
+                    regret_sum: np.ndarray, strategy_sum: Optional[np.ndarray] = None) -> "InfoSetTable":
+        """A table holding `keys` with the given rows (strategy sums default to zero)."""
+        table = cls(actions, capacity=len(keys))
+        table.keys = list(keys)
+        table._ids = {key: i for i, key in enumerate(table.keys)}
+        table._regret_sum[:len(keys)] = regret_sum
+        if strategy_sum is not None:
+            table._strategy_sum[:len(keys)] = strategy_sum
+        return table
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._ids
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(self.keys)
+
+    @property
+    def capacity(self) -> int:
+        return len(self._regret_sum)
+
+    @property
+    def regret_sum(self) -> np.ndarray:
+        """(len(self), num_actions) view of the cumulative regrets."""
+        return self._regret_sum[:len(self.keys)]
+
+    @property
+    def strategy_sum(self) -> np.ndarray:
+        """(len(self), num_actions) view of the cumulative strategy weights."""
+        return self._strategy_sum[:len(self.keys)]
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the regret/strategy arrays (including spare capacity)."""
+        return self._regret_sum.nbytes + self._strategy_sum.nbytes
+
+    def get(self, key: Hashable) -> Optional[int]:
+        return self._ids.get(key)
+
+    def index(self, key: Hashable) -> int:
+        """The id of `key`, adding a zeroed row for it if it's new."""
+        idx = self._ids.get(key)
+        if idx is None:
+            idx = len(self.keys)
+            if idx == self.capacity:
+                self._grow(2 * idx)
+            self._ids[key] = idx
+            self.keys.append(key)
+        return idx
+
+    def _grow(self, capacity: int):
+        for name in ("_regret_sum", "_strategy_sum"):
+            old = getattr(self, name)
+            new = np.zeros((capacity, old.shape[1]))
+            new[:len(old)] = old
+            setattr(self, name, new)
+
+    def merge(self, keys: Sequence[Hashable], regret_delta: np.ndarray, strategy_delta: np.ndarray):
+        """Adds per-key deltas (rows aligned with `keys`), creating missing info sets."""
+        ids = np.fromiter((self.index(key) for key in keys), dtype=np.int64, count=len(keys))
+        # ids are distinct, so fancy-index += is safe
+        self._regret_sum[ids] += regret_delta
+        self._strategy_sum[ids] += strategy_delta
+
+    def strategy(self, idx: int) -> np.ndarray:
+        """Regret-matching strategy of one info set."""
+        return regret_matching(self._regret_sum[idx])
+
+    def strategies(self) -> np.ndarray:
+        """Regret-matching strategies of every info set at once."""
+        return regret_matching(self.regret_sum)
+
+    def average_strategy(self) -> np.ndarray:
+        """Normalized strategy sums (uniform where an info set was never reached)."""
+        sums = self.strategy_sum
+        totals = sums.sum(axis=1, keepdims=True)
+        uniform = np.full_like(sums, 1.0 / len(self.actions))
+        return np.divide(sums, totals, out=uniform, where=totals > 0)
+
+    def to_policy(self) -> Dict[Hashable, Dict[str, float]]:
+        """The average strategy as {key: {action: probability}} (the pickled policy format)."""
+        average = self.average_strategy().tolist()
+        return {key: dict(zip(self.actions, row)) for key, row in zip(self.keys, average)}
@@ -5,15 +5,37 @@ Runs multiple games between different agent configurations and tracks statistics
 """
 import sys
 import os
-from typing import List, Dict, Tuple
+import random
+from typing import Any, List, Dict, Optional, Sequence, Tuple, Union
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
 import time
 
 # Add current directory to path for imports
 sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
 
 from euchre.engine.state import EuchreGameState, GamePhase
-from euchre.agents import Agent, RandomAgent, RuleBasedAgent, MCTSAgent, CFRAgent
+from euchre.engine.events import EventSink, TextLogSink
+from euchre.agents import Agent, RandomAgent, RuleBasedAgent, MCTSAgent, CFRAgent, AVAILABLE_AGENTS
+
+
+@dataclass(frozen=True)
+class AgentSpec:
+    """
+    Picklable recipe for an agent: a key of AVAILABLE_AGENTS, the agent's
+    name and its constructor kwargs. Worker processes build their own agents
+    from specs instead of sharing instances with the parent.
+    """
+    kind: str
+    name: str
+    kwargs: Dict[str, Any] = field(default_factory=dict)
+
+    def build(self) -> Agent:
+        return AVAILABLE_AGENTS[self.kind](self.name, **self.kwargs)
+
+
+AgentLike = Union[Agent, AgentSpec]
 
 
 class GameResult:
@@ -49,6 +71,15 @@ class TournamentStats:
         else:
             self.team1_wins += 1
 
+    def merge(self, other: "TournamentStats"):
+        """Fold another batch of results for the same matchup into this one."""
+        self.games_played += other.games_played
+        self.team0_wins += other.team0_wins
+        self.team1_wins += other.team1_wins
+        self.total_hands += other.total_hands
+        self.team0_total_score += other.team0_total_score
+        self.team1_total_score += other.team1_total_score
+
     def print_summary(self):
         """Print tournament statistics."""
         print("\n" + "="*60)
@@ -66,14 +97,94 @@ class TournamentStats:
         print("="*60)
 
 
-def play_single_game(agents: List[Agent], target_score: int = 10, verbose: bool = False) -> GameResult:
+class DuplicateStats:
+    """
+    Duplicate results: every deal stream is played twice with the teams
+    swapping seats, and the paired score difference (team A - team B,
+    averaged over the two seatings) is what gets compared. Luck of the
+    cards cancels within each pair, so the standard error is much smaller
+    than for the same number of independent games.
+    """
+    def __init__(self, team_a_name: str, team_b_name: str):
+        self.team_a_name = team_a_name
+        self.team_b_name = team_b_name
+        self.paired_diffs: List[float] = []
+        self.game_diffs: List[int] = []
+        self.team_a_wins = 0
+        self.team_b_wins = 0
+
+    @property
+    def games_played(self) -> int:
+        return len(self.game_diffs)
+
+    def add_pair(self, a_first: GameResult, b_first: GameResult):
+        """a_first: team A in seats 0 & 2; b_first: same deals, team B in seats 0 & 2."""
+        diffs = (a_first.team0_score - a_first.team1_score, b_first.team1_score - b_first.team0_score)
+        self.game_diffs.extend(diffs)
+        self.paired_diffs.append(sum(diffs) / 2)
+        self.team_a_wins += (a_first.winner == 0) + (b_first.winner == 1)
+        self.team_b_wins += (a_first.winner == 1) + (b_first.winner == 0)
+
+    def merge(self, other: "DuplicateStats"):
+        self.paired_diffs.extend(other.paired_diffs)
+        self.game_diffs.extend(other.game_diffs)
+        self.team_a_wins += other.team_a_wins
+        self.team_b_wins += other.team_b_wins
+
+    @staticmethod
+    def _mean_and_std_error(values: List[float]) -> Tuple[float, float]:
+        n = len(values)
+        mean = sum(values) / n
+        if n < 2:
+            return mean, float("inf")
+        var = sum((v - mean) ** 2 for v in values) / (n - 1)
+        return mean, (var / n) ** 0.5
+
+    @property
+    def mean_diff(self) -> float:
+        return self._mean_and_std_error(self.paired_diffs)[0]
+
+    @property
+    def std_error(self) -> float:
+        """Standard error of the mean paired difference."""
+        return self._mean_and_std_error(self.paired_diffs)[1]
+
+    @property
+    def unpaired_std_error(self) -> float:
+        """What the standard error would be treating every game as independent."""
+        return self._mean_and_std_error(self.game_diffs)[1]
+
+    def print_summary(self):
+        mean, se = self._mean_and_std_error(self.paired_diffs)
+        print("\n" + "="*60)
+        print(f"DUPLICATE RESULTS: {self.team_a_name} vs {self.team_b_name}")
+        print("="*60)
+        print(f"Deals: {len(self.paired_diffs)} (x2 seatings = {self.games_played} games)")
+        print(f"{self.team_a_name:20s} | Wins: {self.team_a_wins:4d} ({self.team_a_wins/self.games_played*100:5.1f}%)")
+        print(f"{self.team_b_name:20s} | Wins: {self.team_b_wins:4d} ({self.team_b_wins/self.games_played*100:5.1f}%)")
+        print()
+        print(f"Paired score diff (A - B): {mean:+.2f} ± {1.96 * se:.2f} (95% CI)")
+        print(f"Std error paired: {se:.3f} | unpaired: {self.unpaired_std_error:.3f}")
+        print("="*60)
+
+
+def play_single_game(
+    agents: List[Agent],
+    target_score: int = 10,
+    verbose: bool = False,
+    sink: Optional[EventSink] = None,
+    rng: Optional[random.Random] = None
+) -> GameResult:
     """
     Play a single game to target_score with the given agents.
 
     Args:
         agents: List of 4 Agent objects (Team 0: agents[0] & agents[2], Team 1: agents[1] & agents[3])
         target_score: Score required to win the game
-        verbose: Whether to print game progress
+        verbose: Whether to print game progress (also logs every game event
+            to stdout unless a sink is given)
+        sink: Optional EventSink receiving the game's event trace
+        rng: Optional random.Random driving the deals (the deal stream)
 
     Returns:
         GameResult object with final scores and stats
@@ -81,7 +192,10 @@ def play_single_game(agents: List[Agent], target_score: int = 10, verbose: bool
     if len(agents) != 4:
         raise ValueError("Must provide exactly 4 agents")
 
-    game = EuchreGameState(target_score=target_score)
+    if sink is None and verbose:
+        sink = TextLogSink()
+
+    game = EuchreGameState(target_score=target_score, sink=sink, rng=rng)
     hands_played = 0
     max_steps = 1000  # Safety limit to prevent infinite loops
     step_count = 0
@@ -145,28 +259,155 @@ def play_single_game(agents: List[Agent], target_score: int = 10, verbose: bool
     return GameResult(game.team_scores[0], game.team_scores[1], hands_played)
 
 
+def _seat_agents(team0_agents: Sequence[Agent], team1_agents: Sequence[Agent]) -> List[Agent]:
+    # Arrange agents: Team 0 = positions 0 & 2, Team 1 = positions 1 & 3
+    return [
+        team0_agents[0],  # Player 0 (Team 0)
+        team1_agents[0],  # Player 1 (Team 1)
+        team0_agents[1],  # Player 2 (Team 0)
+        team1_agents[1],  # Player 3 (Team 1)
+    ]
+
+
+def _build(agent: AgentLike) -> Agent:
+    return agent.build() if isinstance(agent, AgentSpec) else agent
+
+
+# Per-game seeds: (deal_seed, agent_seed), or None for unseeded play
+GameSeeds = Optional[Tuple[int, int]]
+
+
+def _game_seeds(seed: Optional[int], num_games: int) -> List[GameSeeds]:
+    if seed is None:
+        return [None] * num_games
+    seed_stream = random.Random(seed)
+    return [(seed_stream.getrandbits(32), seed_stream.getrandbits(32)) for _ in range(num_games)]
+
+
+def _seed_game(agents: Sequence[Agent], seeds: GameSeeds) -> Optional[random.Random]:
+    """
+    Gives every seat's agent its own stream for the game (agent.rng, derived
+    from the agent seed and the seat) and returns the deal stream; None when
+    unseeded. The global `random` state is left alone.
+    """
+    if seeds is None:
+        return None
+    deal_seed, agent_seed = seeds
+    for seat, agent in enumerate(agents):
+        agent.rng = random.Random(agent_seed << 2 | seat)
+    return random.Random(deal_seed)
+
+
+def _play_seeded_game(agents, target_score, seeds: GameSeeds, verbose=False, sink=None) -> GameResult:
+    return play_single_game(agents, target_score, verbose, sink, rng=_seed_game(agents, seeds))
+
+
+def _play_games(
+    agents: List[Agent],
+    team_names: Tuple[str, str],
+    game_seeds: Sequence[GameSeeds],
+    target_score: int,
+    verbose: bool = False,
+    sink: Optional[EventSink] = None
+) -> TournamentStats:
+    stats = TournamentStats(*team_names)
+    for seeds in game_seeds:
+        stats.add_result(_play_seeded_game(agents, target_score, seeds, verbose, sink))
+    return stats
+
+
+def _play_duplicates(
+    agents: List[Agent],
+    team_names: Tuple[str, str],
+    game_seeds: Sequence[GameSeeds],
+    target_score: int
+) -> DuplicateStats:
+    # agents are seated A0, B0, A1, B1; the swap puts team B in seats 0 & 2
+    swapped = [agents[1], agents[0], agents[3], agents[2]]
+    stats = DuplicateStats(*team_names)
+    for seeds in game_seeds:
+        stats.add_pair(
+            _play_seeded_game(agents, target_score, seeds),
+            _play_seeded_game(swapped, target_score, seeds),
+        )
+    return stats
+
+
+# Per-process agents for parallel tournaments, built once by the pool initializer
+_WORKER_AGENTS: Optional[List[Agent]] = None
+
+
+def _init_worker(seat_specs: List[AgentSpec]):
+    global _WORKER_AGENTS
+    _WORKER_AGENTS = [spec.build() for spec in seat_specs]
+
+
+def _play_games_in_worker(team_names, game_seeds, target_score) -> TournamentStats:
+    return _play_games(_WORKER_AGENTS, team_names, game_seeds, target_score)
+
+
+def _play_duplicates_in_worker(team_names, game_seeds, target_score) -> DuplicateStats:
+    return _play_duplicates(_WORKER_AGENTS, team_names, game_seeds, target_score)
+
+
+def _run_in_pool(seats, workers, worker_fn, team_names, game_seeds, target_score, stats, total):
+    # A few chunks per worker keeps the pool busy without per-game overhead
+    num_chunks = min(len(game_seeds), workers * 4)
+    chunks = [game_seeds[i::num_chunks] for i in range(num_chunks)]
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(seats,)) as pool:
+        futures = [pool.submit(worker_fn, team_names, chunk, target_score) for chunk in chunks]
+        for future in as_completed(futures):
+            stats.merge(future.result())
+            print(f"  Progress: {stats.games_played}/{total} games completed")
+
+
+def _check_parallel(seats, workers, verbose=False, sink=None):
+    if workers > 1:
+        if not all(isinstance(a, AgentSpec) for a in seats):
+            raise TypeError("Parallel tournaments need AgentSpec entries, not Agent instances")
+        if sink is not None or verbose:
+            raise ValueError("sink/verbose are only supported with workers=1")
+
+
 def run_tournament(
-    team0_agents: Tuple[Agent, Agent],
-    team1_agents: Tuple[Agent, Agent],
+    team0_agents: Tuple[AgentLike, AgentLike],
+    team1_agents: Tuple[AgentLike, AgentLike],
     num_games: int = 100,
     target_score: int = 10,
-    verbose: bool = False
+    verbose: bool = False,
+    sink: Optional[EventSink] = None,
+    workers: int = 1,
+    seed: Optional[int] = None
 ) -> TournamentStats:
     """
     Run a tournament between two teams.
 
     Args:
-        team0_agents: Tuple of 2 agents for team 0 (players 0 and 2)
-        team1_agents: Tuple of 2 agents for team 1 (players 1 and 3)
+        team0_agents: Tuple of 2 agents (or AgentSpecs) for team 0 (players 0 and 2)
+        team1_agents: Tuple of 2 agents (or AgentSpecs) for team 1 (players 1 and 3)
         num_games: Number of games to play
         target_score: Points needed to win each game
         verbose: Whether to print progress
+        sink: Optional EventSink receiving every game's event trace
+        workers: Number of processes to spread games over. Anything above 1
+            needs AgentSpecs, so each worker builds its own agents.
+        seed: Gives every game its own deal stream and agent seed (derived
+            from `seed`), so results are reproducible and identical for any
+            `workers`. Time-budgeted agents (MCTS) stay nondeterministic.
 
     Returns:
         TournamentStats object with results
     """
     team0_name = f"{team0_agents[0].name} & {team0_agents[1].name}"
     team1_name = f"{team1_agents[0].name} & {team1_agents[1].name}"
+    team_names = (team0_name, team1_name)
+
+    seats = _seat_agents(team0_agents, team1_agents)
+    _check_parallel(seats, workers, verbose, sink)
+    if workers > 1 and seed is None:
+        # Workers fork with identical RNG state; give every game its own seed anyway
+        seed = random.SystemRandom().getrandbits(32)
+    game_seeds = _game_seeds(seed, num_games)
 
     stats = TournamentStats(team0_name, team1_name)
 
@@ -175,23 +416,73 @@ def run_tournament(
 
     start_time = time.time()
 
-    for game_num in range(num_games):
-        if not verbose and (game_num + 1) % 10 == 0:
-            print(f"  Progress: {game_num + 1}/{num_games} games completed")
+    if workers <= 1:
+        agents = [_build(a) for a in seats]
+        for game_num, seeds in enumerate(game_seeds):
+            if not verbose and (game_num + 1) % 10 == 0:
+                print(f"  Progress: {game_num + 1}/{num_games} games completed")
+            stats.merge(_play_games(agents, team_names, [seeds], target_score, verbose, sink))
+    else:
+        _run_in_pool(seats, workers, _play_games_in_worker, team_names, game_seeds, target_score, stats, num_games)
 
-        # Arrange agents: Team 0 = positions 0 & 2, Team 1 = positions 1 & 3
-        agents = [
-            team0_agents[0],  # Player 0 (Team 0)
-            team1_agents[0],  # Player 1 (Team 1)
-            team0_agents[1],  # Player 2 (Team 0)
-            team1_agents[1],  # Player 3 (Team 1)
-        ]
+    elapsed = time.time() - start_time
+    print(f"\nTournament completed in {elapsed:.1f} seconds ({elapsed/num_games:.2f}s per game)")
 
-        result = play_single_game(agents, target_score, verbose)
-        stats.add_result(result)
+    return stats
+
+
+def run_duplicate_tournament(
+    team_a_agents: Tuple[AgentLike, AgentLike],
+    team_b_agents: Tuple[AgentLike, AgentLike],
+    num_deals: int = 50,
+    target_score: int = 10,
+    workers: int = 1,
+    seed: Optional[int] = None
+) -> DuplicateStats:
+    """
+    Duplicate tournament: each of `num_deals` seeded deal streams is played
+    twice, once with team A in seats 0 & 2 and once with team B there, and
+    the paired score difference is reported (see DuplicateStats).
+
+    Args:
+        team_a_agents: Tuple of 2 agents (or AgentSpecs) for team A
+        team_b_agents: Tuple of 2 agents (or AgentSpecs) for team B
+        num_deals: Number of deal streams (games played = 2 * num_deals)
+        target_score: Points needed to win each game
+        workers: Number of processes (AgentSpecs required above 1)
+        seed: Master seed; a random one is drawn if omitted
+
+    Returns:
+        DuplicateStats object with results
+    """
+    team_a_name = f"{team_a_agents[0].name} & {team_a_agents[1].name}"
+    team_b_name = f"{team_b_agents[0].name} & {team_b_agents[1].name}"
+    team_names = (team_a_name, team_b_name)
+
+    seats = _seat_agents(team_a_agents, team_b_agents)
+    _check_parallel(seats, workers)
+    if seed is None:
+        seed = random.SystemRandom().getrandbits(32)
+    game_seeds = _game_seeds(seed, num_deals)
+
+    stats = DuplicateStats(team_a_name, team_b_name)
+
+    print(f"\nStarting Duplicate Tournament: {team_a_name} vs {team_b_name}")
+    print(f"Playing {num_deals} deals x 2 seatings to {target_score} points each...")
+
+    start_time = time.time()
+
+    if workers <= 1:
+        agents = [_build(a) for a in seats]
+        for deal_num, seeds in enumerate(game_seeds):
+            if (deal_num + 1) % 10 == 0:
+                print(f"  Progress: {deal_num + 1}/{num_deals} deals completed")
+            stats.merge(_play_duplicates(agents, team_names, [seeds], target_score))
+    else:
+        _run_in_pool(seats, workers, _play_duplicates_in_worker, team_names, game_seeds, target_score, stats, 2 * num_deals)
 
     elapsed = time.time() - start_time
-    print(f"\nTournament completed in {elapsed:.1f} seconds ({elapsed/num_games:.2f}s per game)")
+    print(f"\nDuplicate tournament completed in {elapsed:.1f} seconds")
 
     return stats
 
@@ -240,6 +531,13 @@ def main():
         print("\nCFR policy file not found. Train CFR first with:")
         print("  python -m euchre.training.cfr_trainer")
 
+    # Tournament 5: Duplicate RuleBased vs Random (same deals, seats swapped)
+    print("\n\n### Tournament 5: Duplicate RuleBased vs Random ###")
+    team_a = (AgentSpec("RuleBased", "H0"), AgentSpec("RuleBased", "H2"))
+    team_b = (AgentSpec("Random", "R1"), AgentSpec("Random", "R3"))
+    stats5 = run_duplicate_tournament(team_a, team_b, num_deals=50, seed=0)
+    stats5.print_summary()
+
     print("\n\n" + "="*60)
     print("ALL TOURNAMENTS COMPLETE")
     print("="*60)
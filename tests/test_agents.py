@@ -0,0 +1,196 @@
+import sys
+import os
+import random
+import tempfile
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from euchre.engine.state import EuchreGameState, GamePhase
+from euchre.engine.actions import get_valid_moves
+from euchre.agents.mcts import MCTSAgent
+from euchre.agents.pimc import PIMCAgent
+from euchre.agents.cfr_agent import CFRAgent
+from euchre.agents.cfr_utils import get_hand_strength_bucket
+from euchre.agents.hand_tables import HandTables, get_hand_tables, hand_scores
+from euchre.engine.card import ALL_CARDS, Rank, Suit
+from euchre.agents.policy_store import (CompactPolicy, clear_cache, compact_to_pickle, load_policy,
+                                        write_policy)
+
+def test_mcts_reuses_tree_within_hand():
+    rng = random.Random(2)
+    game = EuchreGameState(rng=random.Random(2))
+    game.start_hand()
+    game.order_up(game.current_player_index)
+    seat = game.current_player_index
+    # An iteration budget, not a time budget, so the searches don't depend on machine load
+    agent = MCTSAgent("M", iterations=300, rng=random.Random(0), tt_size=200)
+
+    reused = []
+    while game.phase == GamePhase.PLAYING:
+        p = game.current_player_index
+        hand = game.hands[p]
+        valid = get_valid_moves(hand, game.current_trick, game.trump_suit)
+        if p == seat:
+            card = agent.play_card(game)
+            if len(valid) > 1:
+                reused.append(agent.last_reused_visits)
+        else:
+            card = rng.choice(valid)
+        assert card in valid
+        game.apply(card)
+
+    # The first search starts from scratch; later ones pick up the old subtree
+    assert reused[0] == 0 and any(v > 0 for v in reused[1:])
+    # The transposition table stays within its cap
+    assert len(agent._table) <= 200
+
+    # A new hand throws the old tree away
+    game.dealer_index = (game.dealer_index + 1) % 4
+    game.start_hand()
+    game.order_up(game.current_player_index)
+    while game.current_player_index != seat or len(get_valid_moves(game.hands[seat], game.current_trick, game.trump_suit)) < 2:
+        p = game.current_player_index
+        game.apply(get_valid_moves(game.hands[p], game.current_trick, game.trump_suit)[0])
+    agent.play_card(game)
+    assert agent.last_reused_visits == 0 and agent.last_iterations == 300
+
+    print("✅ MCTS reuses its tree within a hand.")
+
+def test_mcts_root_parallel():
+    game = EuchreGameState(rng=random.Random(4))
+    game.start_hand()
+    game.order_up(game.current_player_index)
+    agent = MCTSAgent("M", simulation_time=0.2, rng=random.Random(0), workers=2)
+    try:
+        while game.phase == GamePhase.PLAYING:
+            p = game.current_player_index
+            valid = get_valid_moves(game.hands[p], game.current_trick, game.trump_suit)
+            card = agent.play_card(game)
+            assert card in valid
+            if len(valid) > 1:
+                assert agent.last_iterations > 0
+            game.apply(card)
+        # The pool stays up between decisions
+        assert agent._pool is not None
+    finally:
+        agent.close()
+    assert agent._pool is None
+
+    print("✅ Root-parallel MCTS merges worker searches.")
+
+def test_mcts_parallel_tasks_on_one_worker():
+    """Both tasks of a decision landing on one process must not count the first task's visits twice."""
+    import time
+    from concurrent.futures import ProcessPoolExecutor
+    from euchre.agents.mcts import _init_search_worker
+
+    game = EuchreGameState(rng=random.Random(4))
+    game.start_hand()
+    game.order_up(game.current_player_index)
+    agent = MCTSAgent("M", iterations=200, rng=random.Random(0), workers=2)
+    agent._pool = ProcessPoolExecutor(max_workers=1, initializer=_init_search_worker,
+                                      initargs=(agent.simulation_time, True, agent.tt_size, agent.leaf, agent.iterations))
+    try:
+        visits = agent._parallel_search(game, time.time() + 1.0)
+        assert agent.last_iterations == 400 and agent.last_reused_visits == 0
+        assert sum(visits.values()) == 400
+    finally:
+        agent.close()
+
+    print("✅ Parallel MCTS merges tasks sharing a worker.")
+
+def test_solver_based_agents_play_legal_hands():
+    rng = random.Random(6)
+    game = EuchreGameState(rng=random.Random(6))
+    game.start_hand()
+    game.order_up(game.current_player_index)
+    agents = {0: PIMCAgent("P", samples=4, rng=random.Random(0)),
+              1: MCTSAgent("M", simulation_time=0.05, rng=random.Random(0), leaf="solver")}
+    while game.phase == GamePhase.PLAYING:
+        p = game.current_player_index
+        valid = get_valid_moves(game.hands[p], game.current_trick, game.trump_suit)
+        card = agents[p % 2].play_card(game) if p < 2 else rng.choice(valid)
+        assert card in valid
+        game.apply(card)
+    assert sum(game.tricks_taken) == 5
+
+    print("✅ PIMC and solver-leaf MCTS play legal hands.")
+
+def test_compact_policy_round_trip():
+    policy = {f"Pos{p}_Tier{t}_{'P' * p}": {"P": 0.25 * t, "O": 1 - 0.25 * t} for p in range(4) for t in range(5)}
+    with tempfile.TemporaryDirectory() as tmp:
+        compact = os.path.join(tmp, "policy.bin")
+        write_policy(policy, compact)
+        loaded = CompactPolicy(compact)
+        assert len(loaded) == len(policy)
+        for key, row in policy.items():
+            assert key in loaded
+            assert all(abs(loaded[key][a] - row[a]) < 1e-6 for a in row)
+        assert loaded.get("missing", {"P": 0.5}) == {"P": 0.5}
+
+        # Agents in one process share one mapping; a rewritten file is reloaded
+        clear_cache()
+        a, b = CFRAgent("A", policy_file=compact), CFRAgent("B", policy_file=compact)
+        assert a.policy is b.policy
+        assert load_policy(compact) is a.policy
+        write_policy({"Pos0_Tier4_": {"P": 0.0, "O": 1.0}}, compact)
+        assert len(load_policy(compact)) == 1
+
+        # Back to a pickle, with the original key strings
+        write_policy(policy, compact)
+        pkl = os.path.join(tmp, "policy.pkl")
+        compact_to_pickle(compact, pkl)
+        assert set(load_policy(pkl)) == set(policy)
+        clear_cache()
+
+    print("✅ Compact policies round-trip and are shared through the cache.")
+
+def _reference_points(hand, trump, right, left, regular, ace):
+    score = 0
+    for card in hand:
+        if card.get_effective_suit(trump) == trump:
+            if card.rank == Rank.JACK:
+                score += right if card.suit == trump else left
+            else:
+                score += regular
+        elif card.rank == Rank.ACE:
+            score += ace
+    return score
+
+def test_hand_tables_match_card_by_card_scoring():
+    tables = get_hand_tables()
+    assert len(tables) == 42504
+    rng = random.Random(7)
+    for _ in range(2000):
+        hand = rng.sample(ALL_CARDS, 5)
+        scores = hand_scores(hand)
+        for trump in Suit:
+            assert scores[trump.ordinal] == _reference_points(hand, trump, 4, 3, 2, 1)
+            cfr = _reference_points(hand, trump, 30, 25, 10, 3)
+            tier = sum(cfr > t for t in (10, 20, 35, 50))
+            assert get_hand_strength_bucket(hand, trump) == f"Tier{tier}"
+            trumps, bowers, aces = tables.counts(sum(1 << c.ordinal for c in hand), trump)
+            assert trumps == _reference_points(hand, trump, 1, 1, 1, 0)
+            assert bowers == _reference_points(hand, trump, 1, 1, 0, 0)
+            assert aces == _reference_points(hand, trump, 0, 0, 0, 1)
+
+    # Hands of other sizes fall back to per-card points
+    assert hand_scores(ALL_CARDS[:6]) == tuple(_reference_points(ALL_CARDS[:6], t, 4, 3, 2, 1) for t in Suit)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "hand_tables.npz")
+        tables.save(path)
+        loaded = HandTables.load(path)
+        assert (loaded.score == tables.score).all() and (loaded.tier == tables.tier).all()
+        assert loaded.scores(int(tables.masks[123])) == tables.scores(int(tables.masks[123]))
+
+    print("✅ Hand tables match card-by-card scoring.")
+
+if __name__ == "__main__":
+    test_mcts_reuses_tree_within_hand()
+    test_mcts_root_parallel()
+    test_mcts_parallel_tasks_on_one_worker()
+    test_solver_based_agents_play_legal_hands()
+    test_compact_policy_round_trip()
+    test_hand_tables_match_card_by_card_scoring()
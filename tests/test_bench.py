@@ -0,0 +1,49 @@
+import sys
+import os
+import json
+import tempfile
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from euchre import bench
+
+def _results(**values):
+    return {"results": {name: {"value": v, "unit": "ops/s" if higher else "s", "higher_is_better": higher}
+                        for name, (v, higher) in values.items()}}
+
+def test_compare_flags_regressions_beyond_threshold():
+    baseline = _results(fast=(100.0, True), load=(1.0, False), gone=(5.0, True), zero=(0.0, True))
+    current = _results(fast=(90.0, True), load=(1.3, False), new=(7.0, True), zero=(3.0, True))
+    # 10% slower throughput is within 15%; 30% longer load time is not
+    assert bench.compare(current, baseline, threshold=0.15) == ["load"]
+    assert bench.compare(current, baseline, threshold=0.05) == ["fast", "load"]
+    # Benchmarks missing from either side, or with a zero baseline, are skipped
+    assert bench.compare(current, {}, threshold=0.0) == []
+
+    print("✅ Benchmark comparison flags regressions.")
+
+def test_main_exit_code_follows_baseline():
+    tmp = tempfile.mkdtemp()
+    args = ["--only", "resolve_trick", "--duration", "0.02", "--repeat", "1"]
+
+    def run_against(value):
+        path = os.path.join(tmp, f"baseline-{value}.json")
+        with open(path, "w") as f:
+            json.dump(_results(resolve_trick=(value, True)), f)
+        return bench.main(args + ["--baseline", path])
+
+    assert run_against(1.0) == 0
+    assert run_against(1e15) == 1
+
+    # A saved baseline isn't compared against itself
+    saved = os.path.join(tmp, "saved.json")
+    assert bench.main(args + ["--save-baseline", saved]) == 0
+    with open(saved) as f:
+        assert "resolve_trick" in json.load(f)["results"]
+
+    print("✅ Benchmark gate exit codes.")
+
+if __name__ == "__main__":
+    test_compare_flags_regressions_beyond_threshold()
+    test_main_exit_code_follows_baseline()
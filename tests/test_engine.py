@@ -5,7 +5,13 @@ import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from euchre.engine.card import Card, Suit, Rank
-from euchre.engine.state import EuchreGameState
+from euchre.engine.state import EuchreGameState, GamePhase
+from euchre.engine.actions import get_valid_moves, resolve_trick
+from euchre.engine import bitboard as bb
+from euchre.engine.zobrist import TranspositionTable, position_key
+from euchre.engine.solver import solve
+from euchre.engine import canonical
+import random
 
 def test_bower_logic():
     trump = Suit.SPADES
@@ -34,6 +40,20 @@ def test_bower_logic():
 
     print("✅ Bower logic tests passed.")
 
+def test_cards_are_interned():
+    import copy
+    import pickle
+    from euchre.engine.card import ALL_CARDS, Deck
+
+    jc = Card(Rank.JACK, Suit.CLUBS)
+    assert Card(Rank.JACK, Suit.CLUBS) is jc
+    assert copy.deepcopy(jc) is jc
+    assert pickle.loads(pickle.dumps(jc)) is jc
+    assert [c.ordinal for c in ALL_CARDS] == list(range(24))
+    assert Deck().cards == list(ALL_CARDS)
+
+    print("✅ Card interning tests passed.")
+
 def test_game_init():
     game = EuchreGameState()
     game.start_hand()
@@ -45,6 +65,332 @@ def test_game_init():
     
     print("✅ Game state initialization passed.")
 
+def test_bitboard_matches_card_lists():
+    import random
+    rng = random.Random(7)
+
+    for _ in range(500):
+        cards = rng.sample(bb.ALL_CARDS, 9)
+        hand, trick_cards = cards[:5], cards[5:]
+        trick = list(zip(range(4), trick_cards))[:rng.randint(0, 4)]
+        trump = rng.choice(list(Suit) + [None])
+        t = bb.suit_index(trump)
+        idx_trick = [(p, bb.card_index(c)) for p, c in trick]
+
+        expected = get_valid_moves(hand, trick, trump)
+        got = bb.mask_to_cards(bb.get_valid_moves_mask(bb.cards_to_mask(hand), idx_trick, t))
+        assert set(got) == set(expected)
+        if trick:
+            assert bb.resolve_trick_mask(idx_trick, t) == resolve_trick(trick, trump)
+
+    print("✅ Bitboard move/trick logic matches card lists.")
+
+def test_bitboard_game_runs():
+    game = bb.BitboardGameState()
+    game.start_hand()
+    assert all(bin(m).count("1") == 5 for m in game.hand_masks)
+
+    # The hands view is read-only: edits must go through the setter
+    hand = game.hands[0]
+    try:
+        hand.remove(hand[0])
+        assert False, "the hands view must not accept in-place edits"
+    except AttributeError:
+        pass
+    game.hands = [list(h)[1:] if i == 0 else h for i, h in enumerate(game.hands)]
+    assert len(game.hands[0]) == 4
+    game.hands = [list(h) + [hand[0]] if i == 0 else h for i, h in enumerate(game.hands)]
+
+    game.order_up(game.current_player_index)
+    assert bin(game.hand_masks[game.dealer_index]).count("1") == 5
+
+    while game.phase == GamePhase.PLAYING:
+        p = game.current_player_index
+        legal = game.valid_moves_mask(p)
+        game.play_index(p, next(bb.iter_bits(legal)))
+
+    assert sum(game.team_scores) > 0
+    print("✅ Bitboard game state plays a full hand.")
+
+def test_bitboard_discard_matches_card_lists():
+    """The same deal discards the same card whichever representation holds the hands."""
+    for seed in range(200):
+        games = [cls(rng=random.Random(seed)) for cls in (EuchreGameState, bb.BitboardGameState)]
+        for game in games:
+            game.dealer_index = seed % 4
+            game.start_hand()
+            game.order_up(game.current_player_index)
+        listed, bits = games
+        assert listed.tracker.discard == bits.tracker.discard
+        assert [set(h) for h in listed.hands] == [set(h) for h in bits.hands]
+
+    print("✅ Bitboard dealer discard matches card lists.")
+
+def _snapshot(game):
+    return (game.phase, [list(h) for h in game.hands], list(game.current_trick),
+            list(game.tricks_taken), list(game.team_scores), game.current_player_index)
+
+def test_apply_undo_round_trip():
+    for state_cls, going_alone in [(EuchreGameState, False), (EuchreGameState, True),
+                                   (bb.BitboardGameState, True)]:
+        game = state_cls()
+        game.start_hand()
+        game.order_up(game.current_player_index, going_alone=going_alone)
+        root = _snapshot(game)
+        clone = game.clone()
+
+        snapshots = []
+        while game.phase == GamePhase.PLAYING:
+            snapshots.append(_snapshot(game))
+            p = game.current_player_index
+            game.apply(get_valid_moves(game.hands[p], game.current_trick, game.trump_suit)[0])
+
+        # The hand stops instead of redealing, and the loner's partner never played
+        assert game.phase in (GamePhase.HAND_OVER, GamePhase.GAME_OVER)
+        assert sum(game.tricks_taken) == 5 and sum(game.team_scores) > 0
+        assert len(snapshots) == (15 if going_alone else 20)
+
+        while game.undo_depth:
+            game.undo()
+            assert _snapshot(game) == snapshots.pop()
+        assert _snapshot(game) == root == _snapshot(clone)
+
+    print("✅ apply/undo restores every intermediate state.")
+
+def test_event_sinks():
+    import io
+    import json
+    import tempfile
+    from euchre.engine.events import ListSink, TextLogSink, JsonlSink
+
+    events = ListSink()
+    game = EuchreGameState(sink=events)
+    game.start_hand()
+    game.order_up(game.current_player_index)
+    while game.phase == GamePhase.PLAYING:
+        p = game.current_player_index
+        game.play_card(p, game.hands[p].index(get_valid_moves(game.hands[p], game.current_trick, game.trump_suit)[0]))
+
+    assert [e["event"] for e in events.events[:2]] == ["new_hand", "order_up"]
+    assert len(events.of_type("play")) == 20
+    assert len(events.of_type("trick")) == 5
+    assert events.of_type("hand_over")[0]["scores"] == game.team_scores
+
+    text = io.StringIO()
+    for e in events.events:
+        TextLogSink(text).emit(**e)
+    assert "orders up" in text.getvalue()
+
+    path = os.path.join(tempfile.mkdtemp(), "trace.jsonl")
+    with JsonlSink(path) as sink:
+        for e in events.events:
+            sink.emit(**dict(e))
+    with open(path, encoding="utf-8") as f:
+        lines = [json.loads(line) for line in f]
+    assert len(lines) == len(events.events) and lines[1]["trump"] == events.events[1]["trump"].name
+
+    # A sink that forgets emit() fails when it is created, not at the first event
+    from euchre.engine.events import EventSink
+    class Forgetful(EventSink):
+        pass
+    try:
+        Forgetful()
+        assert False, "EventSink subclasses must implement emit"
+    except TypeError:
+        pass
+
+    print("✅ Event sink tests passed.")
+
+def test_tracker_sampling():
+    rng = random.Random(5)
+    for _ in range(30):
+        game = EuchreGameState(rng=rng)
+        game.start_hand()
+        game.order_up(game.current_player_index)
+        dealer, up_card = game.dealer_index, game.up_card
+        # Play a random number of cards with random legal moves
+        for _ in range(rng.randint(0, 12)):
+            p = game.current_player_index
+            game.apply(rng.choice(get_valid_moves(game.hands[p], game.current_trick, game.trump_suit)))
+        tracker = game.tracker
+        me = game.current_player_index
+        played = {c for _, c in tracker.plays}
+
+        for _ in range(20):
+            hands = tracker.sample_hands(game.hands, me, game.trump_suit, rng)
+            assert hands[me] == game.hands[me]
+            assert [len(h) for h in hands] == [len(h) for h in game.hands]
+            dealt = [c for h in hands for c in h]
+            assert len(set(dealt)) == len(dealt) and not set(dealt) & played
+            for s in range(4):
+                for c in hands[s]:
+                    if c is not up_card or s != dealer:
+                        assert not tracker.is_void(s, c.get_effective_suit(game.trump_suit))
+            if me != dealer and up_card not in played:
+                assert up_card in hands[dealer]
+
+        # undo() rewinds the tracker too
+        while game.undo_depth:
+            game.undo()
+        assert tracker.plays == [] and tracker.played == 0 and tracker.voids == [0, 0, 0, 0]
+
+    print("✅ Card tracker samples consistent hands.")
+
+def test_zobrist_keys():
+    game = EuchreGameState(rng=random.Random(8))
+    game.start_hand()
+    game.order_up(game.current_player_index)
+    keys = [position_key(game)]
+    while game.phase == GamePhase.PLAYING:
+        p = game.current_player_index
+        game.apply(get_valid_moves(game.hands[p], game.current_trick, game.trump_suit)[-1])
+        keys.append(position_key(game))
+    assert len(set(keys)) == len(keys)
+    while game.undo_depth:
+        keys.pop()
+        game.undo()
+        assert position_key(game) == keys[-1]
+
+    table = TranspositionTable(max_entries=3)
+    for k in range(5):
+        table.get_or_create(k, list)
+    assert len(table) == 3 and table.get(0) is None and table.get(4) == []
+    assert table.get_or_create(2, dict) == [] and table.hits == 1
+
+    print("✅ Zobrist keys and transposition table passed.")
+
+def _minimax_team0(game):
+    """Brute-force team 0 trick total, for checking the solver."""
+    if game.phase != GamePhase.PLAYING:
+        return game.tricks_taken[0]
+    p = game.current_player_index
+    values = []
+    for card in get_valid_moves(game.hands[p], game.current_trick, game.trump_suit):
+        game.apply(card)
+        values.append(_minimax_team0(game))
+        game.undo()
+    return max(values) if p % 2 == 0 else min(values)
+
+def test_double_dummy_solver():
+    rng = random.Random(1)
+    for i in range(12):
+        game = EuchreGameState(rng=rng)
+        game.start_hand()
+        game.order_up(game.current_player_index, going_alone=i % 3 == 0)
+        # Brute force is only feasible in the last few tricks
+        for _ in range(rng.randint(8, 11)):
+            p = game.current_player_index
+            game.apply(rng.choice(get_valid_moves(game.hands[p], game.current_trick, game.trump_suit)))
+        if game.phase != GamePhase.PLAYING:
+            continue
+        p = game.current_player_index
+        left, taken = len(game.hands[p]), game.tricks_taken[0]
+        for card, tricks in solve(game).items():
+            game.apply(card)
+            team0 = _minimax_team0(game) - taken
+            game.undo()
+            assert tricks == (team0 if p % 2 == 0 else left - team0)
+
+    print("✅ Double-dummy solver matches brute force.")
+
+def test_suit_canonicalization():
+    rng = random.Random(4)
+    assert len(set(canonical.SUIT_PERMUTATIONS)) == 8
+    all_cards = [Card(r, s) for s in Suit for r in Rank]
+    for _ in range(500):
+        perm = rng.choice(canonical.SUIT_PERMUTATIONS)
+        trump = rng.choice(list(Suit))
+        cards = rng.sample(all_cards, 9)
+        trick = list(enumerate(cards[5:]))
+        relabel = lambda cs: [canonical.permute_card(c, perm) for c in cs]
+        new_trump = canonical.permute_suit(trump, perm)
+        # The rules can't tell relabelled positions apart
+        assert resolve_trick(trick, trump) == resolve_trick([(p, canonical.permute_card(c, perm)) for p, c in trick], new_trump)
+        assert relabel(get_valid_moves(cards[:5], trick[:2], trump)) == get_valid_moves(
+            relabel(cards[:5]), [(p, canonical.permute_card(c, perm)) for p, c in trick[:2]], new_trump)
+        assert canonical.permute_mask(bb.cards_to_mask(cards), perm) == bb.cards_to_mask(relabel(cards))
+
+        # Equivalent (hand, up-card) pairs share a canonical form, with the up-card's suit as Hearts
+        hand, up = cards[:5], cards[5]
+        mask, canon_up, _, used = canonical.canonical_hand(hand, up)
+        assert canonical.canonical_hand(relabel(hand), canonical.permute_card(up, perm))[:2] == (mask, canon_up)
+        assert canon_up.suit == Suit.HEARTS and canonical.permute_card(up, used) is canon_up
+        assert bb.cards_to_mask(canonical.permute_card(c, canonical.inverse(used)) for c in bb.mask_to_cards(mask)) == bb.cards_to_mask(hand)
+
+    print("✅ Suit canonicalization passed.")
+
+def test_game_records():
+    import tempfile
+    from euchre.engine import record
+
+    def random_game(seed, target_score=10):
+        # Random bids (loners and passed-out hands included) and random legal plays
+        rng = random.Random(seed)
+        sink = record.GameRecordSink()
+        game = EuchreGameState(target_score=target_score, sink=sink, rng=rng)
+        game.start_hand()
+        while game.phase != GamePhase.GAME_OVER:
+            p = game.current_player_index
+            if game.phase == GamePhase.BIDDING_ROUND_1 and rng.random() < 0.3:
+                game.order_up(p, going_alone=rng.random() < 0.3)
+            elif game.phase == GamePhase.BIDDING_ROUND_2 and rng.random() < 0.3:
+                suit = rng.choice([s for s in Suit if s != game.up_card.suit])
+                game.call_suit(p, suit, going_alone=rng.random() < 0.3)
+            elif game.phase in (GamePhase.BIDDING_ROUND_1, GamePhase.BIDDING_ROUND_2):
+                game.pass_turn()
+            else:
+                card = rng.choice(get_valid_moves(game.hands[p], game.current_trick, game.trump_suit))
+                game.play_card(p, game.hands[p].index(card))
+        return game, sink.games[0]
+
+    games = []
+    for seed in range(30):
+        game, rec = random_game(seed, target_score=5 if seed % 3 == 0 else 10)
+        assert rec.target_score == game.target_score
+        data = rec.to_bytes()
+        assert len(data) == 4 + record.HAND_BYTES * len(rec.hands)
+        assert record.GameRecord.from_bytes(data) == rec
+        replay = record.GameReplay(rec)
+        last = len(rec.hands) - 1
+        assert replay.state_at(last, replay.actions_in_hand(last)).phase == GamePhase.GAME_OVER
+        assert replay.final_scores() == game.team_scores
+        games.append(rec)
+    hands = [h for g in games for h in g.hands]
+    assert any(h.maker is None for h in hands) and any(h.alone for h in hands)
+
+    # Random access matches walking the game
+    replay = record.GameReplay(games[0])
+    for hand, action, state in replay.positions():
+        if action % 3 == 0:
+            other = replay.state_at(hand, action)
+            assert (other.team_scores, other.current_player_index, other.phase) == (state.team_scores, state.current_player_index, state.phase)
+            assert [bb.cards_to_mask(h) for h in other.hands] == [bb.cards_to_mask(h) for h in state.hands]
+
+    path = os.path.join(tempfile.mkdtemp(), "games.rec")
+    with open(path, "wb") as f:
+        record.write_games(f, games)
+    assert list(record.read_games(path)) == games
+    with open(path, "ab") as f:
+        f.write(games[0].to_bytes()[:-1])
+    try:
+        list(record.read_games(path))
+        assert False, "a truncated archive must not read"
+    except ValueError:
+        pass
+
+    print("✅ Game record tests passed.")
+
 if __name__ == "__main__":
     test_bower_logic()
-    test_game_init()
\ No newline at end of file
+    test_cards_are_interned()
+    test_game_init()
+    test_bitboard_matches_card_lists()
+    test_bitboard_game_runs()
+    test_bitboard_discard_matches_card_lists()
+    test_apply_undo_round_trip()
+    test_event_sinks()
+    test_tracker_sampling()
+    test_zobrist_keys()
+    test_double_dummy_solver()
+    test_suit_canonicalization()
+    test_game_records()
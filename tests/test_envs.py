@@ -0,0 +1,155 @@
+import sys
+import os
+import random
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import numpy as np
+
+from euchre.engine.card import ALL_CARDS, Suit
+from euchre.engine.actions import get_valid_moves
+from euchre.engine.state import EuchreGameState, GamePhase
+from euchre.engine.bitboard import BitboardGameState, iter_bits
+from euchre.envs import vector as ve
+from euchre.envs import observation as ob
+from euchre.envs import EuchreEnv, BatchedEuchreEnv
+from euchre.agents import RuleBasedAgent
+
+def _apply_to_state(game, action):
+    p = game.current_player_index
+    if action == ve.PASS:
+        game.pass_turn()
+    elif action in (ve.ORDER_UP, ve.ORDER_UP_ALONE):
+        game.order_up(p, going_alone=action == ve.ORDER_UP_ALONE)
+    elif action >= ve.CALL_SUIT_ALONE:
+        game.call_suit(p, list(Suit)[action - ve.CALL_SUIT_ALONE], going_alone=True)
+    elif action >= ve.CALL_SUIT:
+        game.call_suit(p, list(Suit)[action - ve.CALL_SUIT])
+    else:
+        game.play_index(p, int(action))
+
+def test_vector_env_matches_game_state():
+    """Random legal play on 64 tables must track BitboardGameState step for step."""
+    n = 64
+    env = ve.VectorEuchreEnv(n, seed=3)
+    games = []
+    for i in range(n):
+        # Deal each table from the card lists so discard ties follow the deal order
+        dealt = EuchreGameState(rng=random.Random(i))
+        game = BitboardGameState(rng=random.Random(i))
+        for state in (dealt, game):
+            state.dealer_index = i % 4
+            state.start_hand()
+        env.load_deal(i, dealt.hands, dealt.kitty, dealt.dealer_index)
+        games.append(game)
+
+    active = np.ones(n, dtype=bool)
+    while active.any():
+        legal = env.legal_actions()
+        actions = env.sample_actions(legal)
+        phases, hands_before = env.phase.copy(), env.hands.copy()
+        points, hand_done, _, _ = env.step(actions, legal)
+
+        for i in np.flatnonzero(active):
+            game = games[i]
+            if phases[i] == ve.PLAYING:
+                expected = set(iter_bits(game.valid_moves_mask()))
+                assert set(np.flatnonzero(legal[i, :ve.NUM_CARDS])) == expected
+                assert np.array_equal(hands_before[i], [[bool(m >> c & 1) for c in range(24)] for m in game.hand_masks])
+            dealer = game.dealer_index
+            _apply_to_state(game, int(actions[i]))
+
+            if hand_done[i]:
+                assert game.team_scores == points[i].tolist()
+                active[i] = False
+            elif game.dealer_index != dealer:
+                # Passed out: both sides redealt independently
+                active[i] = False
+            else:
+                assert env.current[i] == game.current_player_index
+                assert (env.phase[i] == ve.PLAYING) == (game.phase == GamePhase.PLAYING)
+                assert env.tricks[i].tolist() == game.tricks_taken
+
+    print("✅ VectorEuchreEnv matches EuchreGameState.")
+
+def test_vector_env_random_hands():
+    env = ve.VectorEuchreEnv(256, seed=0)
+    points = env.play_random_hands(1000)
+    assert len(points) >= 1000
+    # Exactly one team scores 1, 2 or 4 points per hand
+    assert ((points > 0).sum(axis=1) == 1).all()
+    assert set(np.unique(points)) <= {0, 1, 2, 4}
+
+    print("✅ VectorEuchreEnv random hands passed.")
+
+def test_gym_env_observations_and_masks():
+    env = EuchreEnv({1: RuleBasedAgent("R1"), 3: RuleBasedAgent("R3")}, seed=5)
+    obs, info = env.reset()
+    obs_buffer, mask_buffer = obs, info["action_mask"]
+    rng = random.Random(5)
+    rewards = 0.0
+    for _ in range(5000):
+        game, seat = env.game, info["seat"]
+        assert seat in (0, 2) and seat == game.current_player_index
+        # Every step reuses the same buffers
+        assert obs is obs_buffer and info["action_mask"] is mask_buffer
+
+        hand = np.flatnonzero(obs[ob.OBS_HAND:ob.OBS_HAND + 24])
+        assert hand.tolist() == sorted(c.ordinal for c in game.hands[seat])
+        assert obs[ob.OBS_UP_CARD + game.up_card.ordinal] == 1.0
+        assert obs[ob.OBS_SEAT + seat] == 1.0
+        for player, card in game.current_trick:
+            assert obs[ob.OBS_TRICK + (player - seat) % 4 * 24 + card.ordinal] == 1.0
+        legal = np.flatnonzero(info["action_mask"])
+        if game.phase == GamePhase.PLAYING:
+            valid = get_valid_moves(game.hands[seat], game.current_trick, game.trump_suit)
+            assert legal.tolist() == sorted(c.ordinal for c in valid)
+            assert obs[ob.OBS_TRUMP + game.trump_suit.ordinal] == 1.0
+        else:
+            assert ve.PASS in legal and all(a >= ve.PASS for a in legal)
+
+        obs, reward, terminated, truncated, info = env.step(rng.choice(legal.tolist()))
+        rewards += reward
+        if terminated:
+            assert max(env.game.team_scores) >= 10
+            break
+    assert terminated and rewards != 0
+
+    try:
+        env.step(ve.PASS)
+        assert False, "stepping a finished game should fail"
+    except ValueError:
+        pass
+
+    print("✅ EuchreEnv observations and masks match the game.")
+
+def test_batched_env_is_contiguous_and_matches_single_env():
+    n = 8
+    batched = BatchedEuchreEnv(n, seed=11)
+    obs, info = batched.reset()
+    assert obs.shape == (n, ob.OBS_SIZE) and obs.flags["C_CONTIGUOUS"]
+    single = EuchreEnv(seed=11 + 3)
+    single_obs, single_info = single.reset()
+    rng = random.Random(0)
+    finished = 0
+    for _ in range(400):
+        actions = [rng.choice(np.flatnonzero(m).tolist()) for m in info["action_mask"]]
+        assert np.array_equal(obs[3], single_obs)
+        obs, rewards, terminated, _, info = batched.step(actions)
+        single_obs, reward, done, _, _ = single.step(actions[3])
+        assert rewards[3] == reward
+        finished += int(terminated.sum())
+        if done:
+            single_obs, _ = single.reset()
+    assert finished > 0
+    # Every table's row is a view into the one batch array
+    assert all(env.observation.base is batched.observations for env in batched.envs)
+
+    print("✅ BatchedEuchreEnv writes all tables into one array.")
+
+if __name__ == "__main__":
+    test_vector_env_matches_game_state()
+    test_vector_env_random_hands()
+    test_gym_env_observations_and_masks()
+    test_batched_env_is_contiguous_and_matches_single_env()
@@ -0,0 +1,56 @@
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import random
+
+from euchre.engine.state import EuchreGameState
+from euchre.utils.evaluator import AgentSpec, run_tournament, run_duplicate_tournament
+
+def test_parallel_tournament_matches_serial():
+    team0 = (AgentSpec("RuleBased", "H0"), AgentSpec("RuleBased", "H2"))
+    team1 = (AgentSpec("Random", "R1"), AgentSpec("Random", "R3"))
+
+    serial = run_tournament(team0, team1, num_games=12, seed=11)
+    parallel = run_tournament(team0, team1, num_games=12, seed=11, workers=2)
+
+    assert vars(serial) == vars(parallel)
+    assert serial.games_played == 12
+
+    # Seeded games seed each agent's own stream, never the global one
+    random.seed(99)
+    before = random.getstate()
+    again = run_tournament(team0, team1, num_games=12, seed=11)
+    assert random.getstate() == before
+    assert vars(again) == vars(serial)
+
+    print("✅ Parallel tournament matches serial totals.")
+
+def test_seeded_deal_stream():
+    deals = []
+    for _ in range(2):
+        game = EuchreGameState(rng=random.Random(42))
+        game.start_hand()
+        deals.append((game.hands, game.kitty))
+    assert deals[0] == deals[1]
+
+    print("✅ Seeded deal streams are reproducible.")
+
+def test_duplicate_cancels_identical_teams():
+    # Deterministic, identical teams: each seating's luck is exactly undone by the swap
+    team_a = (AgentSpec("RuleBased", "A0"), AgentSpec("RuleBased", "A2"))
+    team_b = (AgentSpec("RuleBased", "B1"), AgentSpec("RuleBased", "B3"))
+    stats = run_duplicate_tournament(team_a, team_b, num_deals=10, seed=3)
+
+    assert stats.games_played == 20
+    assert stats.paired_diffs == [0.0] * 10
+    assert stats.team_a_wins == stats.team_b_wins == 10
+
+    print("✅ Duplicate mode cancels deal luck.")
+
+if __name__ == "__main__":
+    test_parallel_tournament_matches_serial()
+    test_seeded_deal_stream()
+    test_duplicate_cancels_identical_teams()
@@ -0,0 +1,105 @@
+import sys
+import os
+import asyncio
+import random
+from concurrent.futures import ThreadPoolExecutor
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from euchre.agents import RuleBasedAgent
+from euchre.engine.actions import get_valid_moves
+from euchre.server import (AsyncAgent, ComputePool, ExecutorAgent, InlineAgent, LocalTransport, RemoteAgent,
+                           TableManager, async_agent, serve_agent)
+from euchre.server.adapters import CALL_SUIT, PICK_UP, PLAY
+from euchre.utils.evaluator import AgentSpec, play_single_game
+
+class SlowAgent(AsyncAgent):
+    """Misses every play deadline; bids like RuleBased."""
+    def __init__(self, name):
+        super().__init__(name)
+        self.agent = RuleBasedAgent(name)
+
+    async def decide(self, game, decision):
+        if decision == PLAY:
+            await asyncio.sleep(1.0)
+        return await InlineAgent(self.agent).decide(game, decision)
+
+class IllegalAgent(AsyncAgent):
+    """Always tries the first card it doesn't have or may not play."""
+    async def decide(self, game, decision):
+        if decision != PLAY:
+            return False if decision == PICK_UP else None
+        hand = game.hands[game.current_player_index]
+        legal = get_valid_moves(hand, game.current_trick, game.trump_suit)
+        return next(c for c in game.hands[(game.current_player_index + 1) % 4] + hand if c not in legal)
+
+class MalformedAgent(AsyncAgent):
+    """Names suits and cards as strings, the way a careless remote peer might."""
+    async def decide(self, game, decision):
+        if decision == PICK_UP:
+            return False
+        return "Hearts" if decision == CALL_SUIT else str(game.hands[game.current_player_index][0])
+
+def test_tables_match_blocking_games():
+    """Concurrent tables give the same games as play_single_game, whichever adapter runs the agents."""
+    seeds = range(12)
+    expected = [play_single_game([RuleBasedAgent(f"R{i}") for i in range(4)], rng=random.Random(s)) for s in seeds]
+
+    async def run():
+        pool = ComputePool(ThreadPoolExecutor(max_workers=2), max_pending=3)
+        transports = [LocalTransport() for _ in range(2)]
+        players = [asyncio.ensure_future(serve_agent(t.player, RuleBasedAgent(f"P{i}"))) for i, t in enumerate(transports)]
+        inline = [InlineAgent(RuleBasedAgent(f"R{i}")) for i in range(4)]
+        line_ups = [
+            inline,
+            [ExecutorAgent(AgentSpec("RuleBased", f"E{i}"), pool) for i in range(4)],
+            [RemoteAgent("P0", transports[0].table), inline[1], RemoteAgent("P1", transports[1].table), inline[3]],
+        ]
+        async with TableManager(max_tables=4, queue_size=2) as manager:
+            futures = [await manager.submit(line_ups[s % 3], rng=random.Random(s)) for s in seeds]
+            results = await asyncio.gather(*futures)
+        for t in transports:
+            await t.table.close()
+        answered = await asyncio.gather(*players)
+        pool.shutdown()
+        return results, answered, manager.stats
+
+    results, answered, stats = asyncio.run(run())
+    assert [(r.team0_score, r.team1_score) for r in results] == [(r.team0_score, r.team1_score) for r in expected]
+    assert stats.games == len(seeds) and stats.timeouts == stats.faults == 0
+    assert all(n > 0 for n in answered)
+
+    # Only the CPU-heavy kinds are sent to the pool
+    pool = ComputePool()
+    assert isinstance(async_agent(AgentSpec("MCTS", "M"), pool), ExecutorAgent)
+    assert isinstance(async_agent(AgentSpec("RuleBased", "R"), pool), InlineAgent)
+    pool.shutdown()
+
+    print("✅ Table manager games match blocking games.")
+
+def test_deadlines_and_faults_use_fallback():
+    async def run(seats):
+        async with TableManager(max_tables=2, decision_timeout=0.01) as manager:
+            result = await manager.play(seats, rng=random.Random(1))
+        return result, manager.stats
+
+    inline = [InlineAgent(RuleBasedAgent(f"R{i}")) for i in range(4)]
+    result, stats = asyncio.run(run([SlowAgent("S0")] + inline[1:]))
+    assert max(result.team0_score, result.team1_score) >= 10
+    assert stats.timeouts > 0 and stats.faults == 0
+
+    result, stats = asyncio.run(run([IllegalAgent("I0")] + inline[1:]))
+    assert max(result.team0_score, result.team1_score) >= 10
+    assert stats.faults > 0 and stats.timeouts == 0
+
+    # Every seat passes round 1, so every hand asks for a suit
+    result, stats = asyncio.run(run([MalformedAgent(f"X{i}") for i in range(4)]))
+    assert max(result.team0_score, result.team1_score) >= 10
+    assert stats.faults > 0 and stats.timeouts == 0
+
+    print("✅ Deadlines and illegal answers fall back.")
+
+if __name__ == "__main__":
+    test_tables_match_blocking_games()
+    test_deadlines_and_faults_use_fallback()
@@ -0,0 +1,224 @@
+import sys
+import os
+import random
+import tempfile
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import numpy as np
+
+from euchre.training.storage import InfoSetTable, regret_matching
+from euchre.training.cfr_trainer import ACTIONS, CFRTrainer
+from euchre.engine.state import EuchreGameState
+from euchre.training.dataset import COLUMNS, DatasetReader, generate_dataset, unpack_legal
+from euchre.utils.evaluator import AgentSpec
+
+def test_info_set_table():
+    table = InfoSetTable(("P", "O"), capacity=2)
+    ids = [table.index(f"k{i}") for i in range(5)]
+    assert ids == list(range(5)) and table.index("k3") == 3
+    assert len(table) == 5 and table.capacity == 8
+    table.regret_sum[1] = [3.0, 1.0]
+    table.regret_sum[2] = [-1.0, 2.0]
+    assert np.allclose(table.strategies()[:3], [[0.5, 0.5], [0.75, 0.25], [0.0, 1.0]])
+    assert np.allclose(regret_matching(np.array([-1.0, -2.0])), [0.5, 0.5])
+
+    table.strategy_sum[4] = [1.0, 3.0]
+    policy = table.to_policy()
+    assert policy["k4"] == {"P": 0.25, "O": 0.75} and policy["k0"] == {"P": 0.5, "O": 0.5}
+
+    print("✅ InfoSetTable passed.")
+
+def test_cfr_trainer_fills_table():
+    random.seed(0)
+    trainer = CFRTrainer()
+    for _ in range(20):
+        trainer.train_iteration()
+    table = trainer.table
+    assert len(table) > 0
+    assert all(k.startswith("Pos") for k in table.keys)
+    assert np.allclose(table.average_strategy().sum(axis=1), 1.0)
+
+    print("✅ CFR trainer fills the info-set table.")
+
+def test_playout_payoff_cache():
+    trainer = CFRTrainer()
+    state = EuchreGameState(rng=random.Random(9))
+    state.start_hand()
+    before = ([h[:] for h in state.hands], state.phase, state.current_player_index)
+
+    payoffs = trainer.playout_payoffs(state)
+    assert ([h[:] for h in state.hands], state.phase, state.current_player_index) == before
+    assert len(trainer._payoffs) == 4 and all(p in (-4, -2, -1, 1, 2, 4) for p in payoffs)
+
+    # Cached values match fresh playouts, and each "order up" leaf reads its maker's entry
+    start = (state.dealer_index + 1) % 4
+    for passes in range(4):
+        maker = (start + passes) % 4
+        assert trainer._get_playout_reward(state, ["P"] * passes + ["O"]) == payoffs[maker]
+        assert CFRTrainer()._playout(state, maker) == payoffs[maker]
+    assert len(trainer._payoffs) == 4
+
+    print("✅ Playout payoffs are cached per deal and maker.")
+
+def test_sampling_modes_converge():
+    for mode in ("vanilla", "external", "outcome"):
+        trainer = CFRTrainer(rng=random.Random(1))
+        proxies = []
+        for i in range(1, 801):
+            trainer.train_iteration(mode)
+            if i in (100, 800):
+                proxies.append(trainer.exploitability_proxy())
+        assert trainer.iterations == 800 and len(trainer.table) > 0
+        assert proxies[1] < proxies[0], (mode, proxies)
+
+    try:
+        CFRTrainer().train_iteration("full")
+        assert False, "unknown mode should raise"
+    except ValueError:
+        pass
+
+    print("✅ Vanilla, external and outcome sampling CFR converge.")
+
+def test_parallel_training_merges_shards():
+    runs = []
+    for _ in range(2):
+        trainer = CFRTrainer(rng=random.Random(3))
+        trainer.train_parallel(600, mode="external", workers=2, sync_every=100)
+        runs.append(trainer)
+    a, b = runs
+    assert a.iterations == 600
+    # Seed streams come from the trainer's rng, so runs are reproducible
+    assert a.table.keys == b.table.keys
+    assert np.array_equal(a.table.regret_sum, b.table.regret_sum)
+    assert np.array_equal(a.table.strategy_sum, b.table.strategy_sum)
+    assert np.allclose(a.table.average_strategy().sum(axis=1), 1.0)
+
+    print("✅ Parallel CFR training merges worker deltas.")
+
+def _serial_shards(iterations, mode, workers, sync_every, seed):
+    """train_parallel's rounds replayed in this process: same shard seeds, deltas summed per round."""
+    rng = random.Random(seed)
+    table, done = InfoSetTable(ACTIONS), 0
+    while done < iterations:
+        batch = min(iterations - done, sync_every * workers)
+        keys, regrets = list(table.keys), table.regret_sum.copy()
+        deltas = []
+        for w in range(workers):
+            n = batch // workers + (1 if w < batch % workers else 0)
+            if not n:
+                continue
+            shard = CFRTrainer(rng=random.Random(rng.getrandbits(64)))
+            shard.table = InfoSetTable.from_arrays(ACTIONS, keys, regrets)
+            shard.iterations = done + w
+            for _ in range(n):
+                shard.train_iteration(mode)
+            regret_delta = shard.table.regret_sum.copy()
+            regret_delta[:len(keys)] -= regrets
+            deltas.append((shard.table.keys, regret_delta, shard.table.strategy_sum.copy()))
+        for delta in deltas:
+            table.merge(*delta)
+        done += batch
+    return table
+
+def test_parallel_training_matches_serial_shards():
+    # 245 iterations in rounds of 2 x 60 leave a short, uneven last round
+    parallel = CFRTrainer(rng=random.Random(8))
+    parallel.train_parallel(245, mode="external", workers=2, sync_every=60)
+    expected = _serial_shards(245, "external", workers=2, sync_every=60, seed=8)
+
+    assert parallel.iterations == 245
+    assert parallel.table.keys == expected.keys
+    assert np.array_equal(parallel.table.regret_sum, expected.regret_sum)
+    assert np.array_equal(parallel.table.strategy_sum, expected.strategy_sum)
+
+    print("✅ Parallel CFR training equals the summed serial shards.")
+
+def test_checkpoint_resume_is_bit_identical():
+    for mode in ("vanilla", "outcome"):
+        full = CFRTrainer(rng=random.Random(5))
+        for _ in range(300):
+            full.train_iteration(mode)
+
+        first = CFRTrainer(rng=random.Random(5))
+        for _ in range(120):
+            first.train_iteration(mode)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "cfr.npz")
+            first.save_checkpoint(path)
+            # A fresh process would start from an unrelated RNG state
+            resumed = CFRTrainer(rng=random.Random(99))
+            resumed.load_checkpoint(path)
+            # Resuming in another mode would mix two algorithms' regrets
+            other = "external" if mode == "vanilla" else "vanilla"
+            try:
+                CFRTrainer().load_checkpoint(path, other)
+                assert False, "a checkpoint must not resume in another mode"
+            except ValueError:
+                pass
+        assert resumed.iterations == 120 and resumed.mode == mode
+        for _ in range(180):
+            resumed.train_iteration(mode)
+
+        assert resumed.table.keys == full.table.keys
+        assert np.array_equal(resumed.table.regret_sum, full.table.regret_sum)
+        assert np.array_equal(resumed.table.strategy_sum, full.table.strategy_sum)
+
+    print("✅ Resuming from a checkpoint reproduces the full run.")
+
+def test_exact_abstraction_shares_isomorphic_keys():
+    trainer = CFRTrainer(rng=random.Random(2), abstraction="exact")
+    for _ in range(50):
+        trainer.train_iteration("external")
+    assert len(trainer.table) > 0 and all("_H" in k for k in trainer.table.keys)
+    # The up-card is always relabelled to Hearts (ordinals 0-5)
+    assert all(int(k.split("_")[1][1:]) < 6 for k in trainer.table.keys)
+
+    print("✅ Exact canonical info-set keys passed.")
+
+def test_self_play_dataset_shards_and_reader():
+    seats = [AgentSpec("RuleBased", f"R{i}") for i in range(4)]
+    with tempfile.TemporaryDirectory() as tmp:
+        npz_dir, npy_dir = os.path.join(tmp, "npz"), os.path.join(tmp, "npy")
+        records, shards = generate_dataset(npz_dir, seats, 6, shard_size=500, fmt="npz", seed=4)
+        assert len(shards) == -(-records // 500) and all(p.endswith(".npz") for p in shards)
+        # Same seed, other layout and worker count: the same records
+        records2, _ = generate_dataset(npy_dir, seats, 6, workers=2, shard_size=300, fmt="npy", seed=4)
+        assert records2 == records
+
+        npz, npy = DatasetReader(npz_dir), DatasetReader(npy_dir)
+        assert len(npz) == len(npy) == records
+        for shard in npy.iter_shards():
+            assert isinstance(shard["obs"], np.memmap)
+        a = {k: np.concatenate([b[k] for b in npz.iter_batches(128)]) for k in COLUMNS}
+        b = {k: np.concatenate([s[k] for s in npy.iter_shards()]) for k in COLUMNS}
+        assert all(np.array_equal(a[k], b[k]) for k in COLUMNS)
+
+        assert unpack_legal(a["legal"])[np.arange(records), a["action"]].all()
+        assert sorted(set(a["game"].tolist())) == list(range(6))
+        # Each game: one side won, and game outcomes are zero-sum across teams
+        for g in range(6):
+            rows = a["game"] == g
+            team = a["seat"][rows] % 2
+            assert set(a["game_won"][rows][team == 0]) != set(a["game_won"][rows][team == 1])
+            assert (a["game_points"][rows][team == 0] == -a["game_points"][rows][team == 1][0]).all()
+        assert set(np.unique(a["hand_points"])) <= {-4, -2, -1, 0, 1, 2, 4}
+
+        # A smaller rerun into the same directories replaces the old shards
+        for out, fmt in ((npz_dir, "npz"), (npy_dir, "npy")):
+            fewer, _ = generate_dataset(out, seats, 1, shard_size=300, fmt=fmt, seed=5)
+            assert len(DatasetReader(out)) == fewer < records
+
+    print("✅ Self-play dataset shards round-trip through the reader.")
+
+if __name__ == "__main__":
+    test_info_set_table()
+    test_cfr_trainer_fills_table()
+    test_playout_payoff_cache()
+    test_sampling_modes_converge()
+    test_parallel_training_merges_shards()
+    test_parallel_training_matches_serial_shards()
+    test_checkpoint_resume_is_bit_identical()
+    test_exact_abstraction_shares_isomorphic_keys()
+    test_self_play_dataset_shards_and_reader()